@@ -0,0 +1,138 @@
+r"""Throughput and tail latency of ``POST /api/gm/turn`` under concurrent load.
+
+Point the app at ``benchmarks/fake_upstream.py`` (see its docstring for the
+environment) so no live model or storage is called, then run from
+``backend-py/app``::
+
+    uv run python benchmarks/bench_gm_turn_load.py \
+        --session <game-session-uuid> --session <game-session-uuid> \
+        --requests 200 --concurrency 8
+
+Sessions must already exist in the database.  Turns of one session are
+serialised, as the frontend does, so concurrency is capped by the number of
+sessions given.  Reported latencies are time to the first SSE event and to
+the end of the stream.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_URL = "http://127.0.0.1:8000"
+DEFAULT_REQUESTS = 100
+DEFAULT_CONCURRENCY = 4
+REQUEST_TIMEOUT_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class _Sample:
+    first_event_s: float
+    total_s: float
+    ok: bool
+
+
+async def _run_turn(
+    client: httpx.AsyncClient,
+    session_id: str,
+    input_text: str,
+) -> _Sample:
+    started = time.perf_counter()
+    first_event_s: float | None = None
+    ok = False
+    async with client.stream(
+        "POST",
+        "/api/gm/turn",
+        json={"session_id": session_id, "input_type": "do", "input_text": input_text},
+    ) as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            if first_event_s is None:
+                first_event_s = time.perf_counter() - started
+            event = json.loads(line.removeprefix("data:"))
+            ok = ok or event.get("type") == "done"
+        ok = ok and response.status_code == httpx.codes.OK
+    total_s = time.perf_counter() - started
+    return _Sample(first_event_s=first_event_s or total_s, total_s=total_s, ok=ok)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def _report(label: str, values: list[float]) -> None:
+    sys.stdout.write(
+        f"{label:<12} p50 {_percentile(values, 50) * 1000:>9.1f} ms"
+        f"  p95 {_percentile(values, 95) * 1000:>9.1f} ms"
+        f"  p99 {_percentile(values, 99) * 1000:>9.1f} ms"
+        f"  mean {statistics.fmean(values) * 1000:>9.1f} ms\n",
+    )
+
+
+async def _run(args: argparse.Namespace) -> None:
+    headers = dict(h.split(": ", 1) for h in args.header)
+    locks = {session: asyncio.Lock() for session in args.session}
+    sessions = itertools.cycle(args.session)
+    slots = asyncio.Semaphore(args.concurrency)
+    samples: list[_Sample] = []
+
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        headers=headers,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    ) as client:
+
+        async def one(index: int, session: str) -> None:
+            async with slots, locks[session]:
+                try:
+                    sample = await _run_turn(client, session, f"look around {index}")
+                except httpx.HTTPError:
+                    sample = _Sample(first_event_s=0.0, total_s=0.0, ok=False)
+                samples.append(sample)
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(one(i, next(sessions)) for i in range(args.requests)),
+        )
+        elapsed = time.perf_counter() - started
+
+    succeeded = [s for s in samples if s.ok]
+    sys.stdout.write(
+        f"requests: {len(samples)}  ok: {len(succeeded)}"
+        f"  throughput: {len(samples) / elapsed:.2f} turns/s\n",
+    )
+    if succeeded:
+        _report("first event", [s.first_event_s for s in succeeded])
+        _report("total", [s.total_s for s in succeeded])
+
+
+def main() -> None:
+    """Parse options and run the load."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL)
+    parser.add_argument("--session", action="append", required=True)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--header",
+        action="append",
+        default=[],
+        metavar="'NAME: VALUE'",
+        help="extra request header, e.g. 'Authorization: Bearer <token>'",
+    )
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
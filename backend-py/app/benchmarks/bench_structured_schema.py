@@ -0,0 +1,92 @@
+"""Structured-output overhead per GM decision: per-call schema vs registry.
+
+Measures what ``GeminiClient`` spends around each structured call besides
+the network round trip: building the ``GmDecisionResponse`` JSON schema and
+validating a representative response.
+
+Run from ``backend-py/app``::
+
+    uv run python benchmarks/bench_structured_schema.py [iterations]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+_APP_DIR = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(_APP_DIR), str(_APP_DIR / "src")]
+
+from domain.entity.gm_types import GmDecisionResponse  # noqa: E402
+from util.schema_registry import structured_schema  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_ITERATIONS = 2000
+
+_RESPONSE = GmDecisionResponse.model_validate(
+    {
+        "decision_type": "choice",
+        "narration_text": "The corridor splits in two.",
+        "nodes": [
+            {
+                "type": "dialogue",
+                "text": f"Line {i}",
+                "speaker": "Aki",
+                "characters": [{"npc_name": "Aki", "expression": "joy"}],
+            }
+            for i in range(8)
+        ]
+        + [
+            {
+                "type": "choice",
+                "text": "Which way?",
+                "choices": [
+                    {"id": "c1", "text": "Left"},
+                    {"id": "c2", "text": "Right"},
+                ],
+            },
+        ],
+        "npc_dialogues": [{"npc_name": "Aki", "dialogue": "Hurry."}],
+        "state_changes": {
+            "stats_delta": [{"stat": "hp", "delta": -3}],
+            "relationship_changes": [{"npc_name": "Aki", "trust_delta": 1}],
+            "flag_changes": [{"flag_id": "corridor_seen", "value": True}],
+        },
+    },
+).model_dump_json()
+
+
+def _per_call() -> None:
+    GmDecisionResponse.model_json_schema()
+    GmDecisionResponse.model_validate_json(_RESPONSE)
+
+
+def _registry() -> None:
+    schema = structured_schema(GmDecisionResponse)
+    _ = schema.json_schema
+    schema.validate_json(_RESPONSE)
+
+
+def _measure(label: str, fn: Callable[[], None], iterations: int) -> None:
+    fn()  # warm up validators and the registry
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call_us = (time.perf_counter() - started) / iterations * 1_000_000
+    sys.stdout.write(f"{label:<16} {per_call_us:>12.1f} us/call\n")
+
+
+def main() -> None:
+    """Print the average schema + validation cost for both strategies."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    sys.stdout.write(f"iterations: {iterations}\n")
+    _measure("per-call schema", _per_call, iterations)
+    _measure("registry", _registry, iterations)
+
+
+if __name__ == "__main__":
+    main()
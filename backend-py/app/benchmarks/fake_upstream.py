@@ -0,0 +1,497 @@
+r"""Local stand-in for Gemini, OpenAI images, fal and Supabase Storage.
+
+Serves just enough of each upstream API for ``/api/gm/turn`` to run end to
+end without network access or API spend, so throughput and tail latency of
+the pipeline can be benchmarked offline.  Every response is delayed by a
+log-normal latency sample, and a configurable share of requests fails with an
+injected HTTP error.
+
+Run from ``backend-py/app``::
+
+    uv run python benchmarks/fake_upstream.py --port 8787 \
+        --latency gemini=900:0.4 --failure gemini=0.02:503
+
+and start the app with the environment printed at startup::
+
+    GOOGLE_GEMINI_BASE_URL=http://127.0.0.1:8787   # GeminiClient, AdkGmClient
+    OPENAI_BASE_URL=http://127.0.0.1:8787/v1       # image generation
+    FAL_BASE_URL=http://127.0.0.1:8787/fal         # FalAceStepClient
+    SUPABASE_URL=http://127.0.0.1:8787             # StorageService
+
+The database is not faked; ADK sessions, turns and snapshots still need
+PostgreSQL.  Lyria is not covered: its realtime music API always connects
+over ``wss://``.
+
+``GET /_stats`` returns request and injected-failure counts per upstream.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import math
+import random
+import struct
+import sys
+import time
+import uuid
+import zlib
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+_APP_DIR = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(_APP_DIR), str(_APP_DIR / "src")]
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse, StreamingResponse  # noqa: E402
+
+from domain.entity.gm_types import GmDecisionResponse  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8787
+STREAM_CHUNK_CHARS = 64
+# Share of the sampled latency spent before the first streamed chunk.
+STREAM_FIRST_CHUNK_SHARE = 0.3
+IMAGE_SIZE_PX = 64
+MP3_FRAMES = 40
+
+
+@dataclass(frozen=True)
+class UpstreamProfile:
+    """Latency distribution and failure injection for one upstream."""
+
+    median_ms: float
+    sigma: float = 0.4
+    failure_rate: float = 0.0
+    failure_status: int = 503
+
+    def sample_delay(self, rng: random.Random) -> float:
+        """Return a log-normal latency sample in seconds."""
+        return self.median_ms / 1000 * math.exp(rng.gauss(0.0, self.sigma))
+
+
+DEFAULT_PROFILES: dict[str, UpstreamProfile] = {
+    "gemini": UpstreamProfile(median_ms=900),
+    "openai": UpstreamProfile(median_ms=6000, sigma=0.3),
+    "fal": UpstreamProfile(median_ms=12000, sigma=0.3),
+    "storage": UpstreamProfile(median_ms=60, sigma=0.3),
+}
+
+
+def _png(size: int) -> bytes:
+    """Encode a transparent ``size`` x ``size`` RGBA PNG."""
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0)
+    rows = b"".join(b"\x00" + b"\x00" * 4 * size for _ in range(size))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _mp3(frames: int) -> bytes:
+    """Return silent MPEG-1 Layer III frames (128 kbps, 44.1 kHz)."""
+    frame = b"\xff\xfb\x90\x64" + b"\x00" * 413
+    return frame * frames
+
+
+PNG_BYTES = _png(IMAGE_SIZE_PX)
+MP3_BYTES = _mp3(MP3_FRAMES)
+
+_GM_DECISIONS: list[str] = [
+    GmDecisionResponse.model_validate(payload).model_dump_json(exclude_none=True)
+    for payload in (
+        {
+            "decision_type": "narrate",
+            "narration_text": "Rain drums on the station roof.",
+            "nodes": [
+                {"type": "narration", "text": "Rain drums on the station roof."},
+                {
+                    "type": "dialogue",
+                    "text": "We should not linger here.",
+                    "speaker": "Aki",
+                    "characters": [{"npc_name": "Aki", "expression": "anger"}],
+                },
+            ],
+            "state_changes": {"stats_delta": [{"stat": "hp", "delta": -1}]},
+        },
+        {
+            "decision_type": "choice",
+            "narration_text": "The corridor splits in two.",
+            "nodes": [
+                {"type": "narration", "text": "The corridor splits in two."},
+                {
+                    "type": "choice",
+                    "text": "Which way?",
+                    "choices": [
+                        {"id": "left", "text": "Take the left passage"},
+                        {"id": "right", "text": "Take the right passage"},
+                    ],
+                },
+            ],
+        },
+    )
+]
+
+
+def _example(schema: dict[str, Any], defs: dict[str, Any]) -> object:
+    """Build a minimal instance of a JSON schema (or Gemini Schema dict)."""
+    ref = schema.get("$ref")
+    if isinstance(ref, str):
+        return _example(defs[ref.rsplit("/", 1)[-1]], defs)
+    for key in ("anyOf", "oneOf", "any_of"):
+        options = [o for o in schema.get(key) or [] if o.get("type") != "null"]
+        if options:
+            return _example(options[0], defs)
+    if schema.get("enum"):
+        return schema["enum"][0]
+    kind = schema.get("type", "object")
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != "null"), "null")
+    kind = str(kind).lower()
+    if kind == "object":
+        properties: dict[str, Any] = schema.get("properties") or {}
+        required = set(schema.get("required") or properties)
+        return {
+            name: _example(prop, defs)
+            for name, prop in properties.items()
+            if name in required
+        }
+    placeholders: dict[str, object] = {
+        "array": [],
+        "string": "placeholder",
+        "integer": 0,
+        "number": 0.0,
+        "boolean": False,
+    }
+    return placeholders.get(kind)
+
+
+class FakeUpstream:
+    """Canned responses, latency sampling and failure injection."""
+
+    def __init__(
+        self,
+        profiles: dict[str, UpstreamProfile],
+        *,
+        seed: int | None = None,
+    ) -> None:
+        self.profiles = profiles
+        self._rng = random.Random(seed)  # noqa: S311
+        self._decisions = itertools.cycle(_GM_DECISIONS)
+        self.requests: Counter[str] = Counter()
+        self.failures: Counter[str] = Counter()
+
+    def sample(self, upstream: str) -> tuple[float, int | None]:
+        """Return (delay seconds, injected status or None) for one request."""
+        profile = self.profiles[upstream]
+        self.requests[upstream] += 1
+        delay = profile.sample_delay(self._rng)
+        if self._rng.random() < profile.failure_rate:
+            self.failures[upstream] += 1
+            return delay, profile.failure_status
+        return delay, None
+
+    async def delay_or_fail(self, upstream: str) -> Response | None:
+        """Sleep for a latency sample; return an error response if injected."""
+        delay, status = self.sample(upstream)
+        await asyncio.sleep(delay)
+        if status is None:
+            return None
+        return _error_response(status)
+
+    def structured_text(self, schema: dict[str, Any] | None) -> str:
+        """Return a JSON answer for a structured-output request."""
+        if not schema:
+            return "ok"
+        if "decision_type" in (schema.get("properties") or {}):
+            return next(self._decisions)
+        defs = schema.get("$defs") or schema.get("defs") or {}
+        return json.dumps(_example(schema, defs))
+
+
+def _error_response(status: int) -> Response:
+    """Error body parseable by the Gemini, OpenAI and Storage clients alike."""
+    message = "Injected failure"
+    return JSONResponse(
+        {
+            "error": {"code": status, "message": message},
+            "message": message,
+            "statusCode": str(status),
+        },
+        status_code=status,
+    )
+
+
+def _usage(request_body: bytes, text: str) -> dict[str, int]:
+    prompt_tokens = len(request_body) // 4
+    output_tokens = len(text) // 4
+    return {
+        "promptTokenCount": prompt_tokens,
+        "candidatesTokenCount": output_tokens,
+        "totalTokenCount": prompt_tokens + output_tokens,
+    }
+
+
+def _response_schema(body: dict[str, Any]) -> dict[str, Any] | None:
+    config = body.get("generationConfig") or {}
+    schema = config.get("responseJsonSchema") or config.get("responseSchema")
+    return schema if isinstance(schema, dict) else None
+
+
+def _candidate(text: str, *, final: bool) -> dict[str, Any]:
+    candidate: dict[str, Any] = {
+        "content": {"role": "model", "parts": [{"text": text}]},
+        "index": 0,
+    }
+    if final:
+        candidate["finishReason"] = "STOP"
+    return candidate
+
+
+def create_app(fake: FakeUpstream) -> FastAPI:  # noqa: C901
+    """Build the FastAPI app serving every faked upstream."""
+    app = FastAPI(title="fake-upstream")
+
+    @app.get("/_stats")
+    async def stats() -> dict[str, Any]:
+        return {
+            name: {
+                "requests": fake.requests[name],
+                "failures": fake.failures[name],
+            }
+            for name in fake.profiles
+        }
+
+    # --- Gemini (generateContent / SSE stream / caches / interactions) ---
+
+    @app.post("/v1beta/models/{model_action}")
+    async def generate_content(model_action: str, request: Request) -> Response:
+        model, _, action = model_action.partition(":")
+        raw = await request.body()
+        text = fake.structured_text(_response_schema(json.loads(raw)))
+        usage = _usage(raw, text)
+        if action != "streamGenerateContent":
+            if error := await fake.delay_or_fail("gemini"):
+                return error
+            return JSONResponse(
+                {
+                    "candidates": [_candidate(text, final=True)],
+                    "usageMetadata": usage,
+                    "modelVersion": model,
+                },
+            )
+
+        delay, status = fake.sample("gemini")
+        await asyncio.sleep(delay * STREAM_FIRST_CHUNK_SHARE)
+        if status is not None:
+            return _error_response(status)
+        chunks = [
+            text[i : i + STREAM_CHUNK_CHARS]
+            for i in range(0, len(text), STREAM_CHUNK_CHARS)
+        ] or [""]
+        gap = delay * (1 - STREAM_FIRST_CHUNK_SHARE) / len(chunks)
+
+        async def events() -> AsyncIterator[bytes]:
+            for index, piece in enumerate(chunks):
+                final = index == len(chunks) - 1
+                payload: dict[str, Any] = {
+                    "candidates": [_candidate(piece, final=final)],
+                    "modelVersion": model,
+                }
+                if final:
+                    payload["usageMetadata"] = usage
+                yield f"data: {json.dumps(payload)}\r\n\r\n".encode()
+                if not final:
+                    await asyncio.sleep(gap)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.post("/v1beta/cachedContents")
+    async def create_cache(request: Request) -> Response:
+        body = await request.json()
+        if error := await fake.delay_or_fail("gemini"):
+            return error
+        return JSONResponse(
+            {
+                "name": f"cachedContents/{uuid.uuid4().hex}",
+                "model": body.get("model"),
+                "usageMetadata": {"totalTokenCount": len(json.dumps(body)) // 4},
+            },
+        )
+
+    @app.patch("/v1beta/cachedContents/{cache_id}")
+    async def update_cache(cache_id: str) -> dict[str, str]:
+        return {"name": f"cachedContents/{cache_id}"}
+
+    @app.delete("/v1beta/cachedContents/{cache_id}")
+    async def delete_cache(cache_id: str) -> dict[str, str]:  # noqa: ARG001
+        return {}
+
+    @app.post("/v1beta/interactions")
+    async def create_interaction(request: Request) -> Response:
+        raw = await request.body()
+        schema = json.loads(raw).get("response_format")
+        text = fake.structured_text(schema if isinstance(schema, dict) else None)
+        if error := await fake.delay_or_fail("gemini"):
+            return error
+        usage = _usage(raw, text)
+        return JSONResponse(
+            {
+                "id": uuid.uuid4().hex,
+                "status": "completed",
+                "outputs": [{"type": "text", "text": text}],
+                "usage": {
+                    "total_input_tokens": usage["promptTokenCount"],
+                    "total_output_tokens": usage["candidatesTokenCount"],
+                    "total_tokens": usage["totalTokenCount"],
+                },
+            },
+        )
+
+    @app.delete("/v1beta/interactions/{interaction_id}")
+    async def delete_interaction(interaction_id: str) -> dict[str, str]:  # noqa: ARG001
+        return {}
+
+    # --- OpenAI images ---
+
+    @app.post("/v1/images/generations")
+    @app.post("/v1/images/edits")
+    async def images() -> Response:
+        if error := await fake.delay_or_fail("openai"):
+            return error
+        return JSONResponse(
+            {
+                "created": int(time.time()),
+                "data": [{"b64_json": base64.b64encode(PNG_BYTES).decode()}],
+            },
+        )
+
+    # --- fal (synchronous run endpoint) ---
+
+    @app.post("/fal/{application:path}")
+    async def fal_run(application: str, request: Request) -> Response:
+        if error := await fake.delay_or_fail("fal"):
+            return error
+        return JSONResponse(
+            {
+                "audio": {
+                    "url": f"{request.base_url}files/{uuid.uuid4().hex}.mp3",
+                    "content_type": "audio/mpeg",
+                    "file_name": f"{application.rsplit('/', 1)[-1]}.mp3",
+                },
+            },
+        )
+
+    @app.get("/files/{name}")
+    async def fal_file(name: str) -> Response:  # noqa: ARG001
+        return Response(MP3_BYTES, media_type="audio/mpeg")
+
+    # --- Supabase Storage ---
+
+    @app.get("/storage/v1/object/public/{bucket}/{path:path}")
+    @app.get("/storage/v1/object/{bucket}/{path:path}")
+    async def download_object(bucket: str, path: str) -> Response:  # noqa: ARG001
+        if error := await fake.delay_or_fail("storage"):
+            return error
+        if path.endswith(".mp3"):
+            return Response(MP3_BYTES, media_type="audio/mpeg")
+        return Response(PNG_BYTES, media_type="image/png")
+
+    @app.post("/storage/v1/object/{bucket}/{path:path}")
+    @app.put("/storage/v1/object/{bucket}/{path:path}")
+    async def upload_object(bucket: str, path: str, request: Request) -> Response:
+        await request.body()
+        if error := await fake.delay_or_fail("storage"):
+            return error
+        return JSONResponse({"Key": f"{bucket}/{path}", "Id": str(uuid.uuid4())})
+
+    return app
+
+
+def _parse_overrides(
+    profiles: dict[str, UpstreamProfile],
+    latency: list[str],
+    failure: list[str],
+) -> dict[str, UpstreamProfile]:
+    """Apply ``name=median_ms[:sigma]`` and ``name=rate[:status]`` overrides."""
+    result = dict(profiles)
+
+    def split(spec: str) -> Iterator[str]:
+        name, _, values = spec.partition("=")
+        if name not in result:
+            msg = f"Unknown upstream {name!r}; expected one of {sorted(result)}"
+            raise SystemExit(msg)
+        yield name
+        yield from values.split(":")
+
+    for spec in latency:
+        name, median, *rest = split(spec)
+        result[name] = replace(
+            result[name],
+            median_ms=float(median),
+            sigma=float(rest[0]) if rest else result[name].sigma,
+        )
+    for spec in failure:
+        name, rate, *rest = split(spec)
+        result[name] = replace(
+            result[name],
+            failure_rate=float(rate),
+            failure_status=int(rest[0]) if rest else result[name].failure_status,
+        )
+    return result
+
+
+def main() -> None:
+    """Parse options, print the client environment and serve."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="NAME=MEDIAN_MS[:SIGMA]",
+        help=f"log-normal latency per upstream ({', '.join(DEFAULT_PROFILES)})",
+    )
+    parser.add_argument(
+        "--failure",
+        action="append",
+        default=[],
+        metavar="NAME=RATE[:STATUS]",
+        help="share of requests failing with STATUS (default 503)",
+    )
+    args = parser.parse_args()
+
+    profiles = _parse_overrides(DEFAULT_PROFILES, args.latency, args.failure)
+    base = f"http://{args.host}:{args.port}"
+    sys.stdout.write(
+        f"GOOGLE_GEMINI_BASE_URL={base}\n"
+        f"OPENAI_BASE_URL={base}/v1\n"
+        f"FAL_BASE_URL={base}/fal\n"
+        f"SUPABASE_URL={base}\n",
+    )
+    for name, profile in profiles.items():
+        sys.stdout.write(f"# {name}: {profile}\n")
+    app = create_app(FakeUpstream(profiles, seed=args.seed))
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""App-lifetime service container.
+
+Clients that own HTTP connection pools (genai, OpenAI, Supabase Storage) and
+the stateless services around them are built once at startup and shared by
+every request instead of being reconstructed per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlmodel import Session as SQLModelSession
+
+from gateway.llm_usage_gateway import LlmUsageGateway
+from infra.db_client import engine
+from infra.storage_service import aclose_storage_pool
+from infra.usage_accounting import usage_aggregator
+from usecase.gm_turn_usecase import GmTurnUseCase
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from fastapi import FastAPI, Request
+
+    from domain.entity.models import LlmUsage
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ServiceContainer:
+    """Shared, request-independent service instances."""
+
+    gm_turn: GmTurnUseCase
+
+    def start(self) -> None:
+        """Start app-lifetime background jobs (requires a running loop)."""
+        self.gm_turn.adk.start_session_gc()
+        usage_aggregator.start(_write_usage)
+
+    async def aclose(self) -> None:
+        """Drain background work, then release caches and connections."""
+        await self.gm_turn.adk.aclose()
+        await self.gm_turn.prompt_cache.aclose()
+        await self.gm_turn.gemini.aclose()
+        await aclose_storage_pool()
+        await usage_aggregator.aclose()
+
+
+def _write_usage(rows: Sequence[LlmUsage]) -> None:
+    """Bulk-insert one window of LLM usage (runs in a worker thread)."""
+    with SQLModelSession(engine) as db:
+        LlmUsageGateway().bulk_insert(db, rows)
+
+
+def build_container() -> ServiceContainer:
+    """Construct all shared services."""
+    return ServiceContainer(gm_turn=GmTurnUseCase())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the container on startup and close it on shutdown.
+
+    Missing credentials must not prevent the app (e.g. the health check)
+    from starting, so a failed build is logged and retried lazily by
+    ``get_container`` on the first request that needs it.
+    """
+    started = time.perf_counter()
+    try:
+        app.state.container = build_container()
+        app.state.container.start()
+    except ValueError:
+        logger.warning("Service container build deferred", exc_info=True)
+        app.state.container = None
+    else:
+        logger.info(
+            "Service container built",
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+    try:
+        yield
+    finally:
+        container: ServiceContainer | None = app.state.container
+        if container is not None:
+            await container.aclose()
+
+
+async def get_container(request: Request) -> ServiceContainer:
+    """Return the app container, building and starting it if startup deferred it.
+
+    Concurrent first requests wait on a lock kept on ``app.state`` so that
+    exactly one container is built.
+    """
+    state = request.app.state
+    container: ServiceContainer | None = getattr(state, "container", None)
+    if container is not None:
+        return container
+    lock: asyncio.Lock | None = getattr(state, "container_lock", None)
+    if lock is None:
+        lock = asyncio.Lock()
+        state.container_lock = lock
+    async with lock:
+        container = getattr(state, "container", None)
+        if container is None:
+            container = build_container()
+            container.start()
+            state.container = container
+    return container
+
+
+async def get_gm_turn_usecase(request: Request) -> GmTurnUseCase:
+    """FastAPI dependency returning the shared GmTurnUseCase."""
+    return (await get_container(request)).gm_turn
@@ -5,9 +5,11 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from container import get_gm_turn_usecase
 from domain.entity.gm_types import GmTurnRequest, LatestTurnResponse
-from infra.db_client import get_session
+from infra.db_client import get_async_session, get_session
 from usecase.gm_turn_usecase import GmTurnUseCase
 
 router = APIRouter(prefix="/api/gm", tags=["gm"])
@@ -16,10 +18,10 @@ router = APIRouter(prefix="/api/gm", tags=["gm"])
 @router.post("/turn")
 async def gm_turn(
     request: GmTurnRequest,
-    db: Annotated[Session, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_async_session)],
+    use_case: Annotated[GmTurnUseCase, Depends(get_gm_turn_usecase)],
 ) -> StreamingResponse:
     """Process a GM turn and stream the response via SSE."""
-    use_case = GmTurnUseCase()
     return StreamingResponse(
         use_case.execute(request, db),
         media_type="text/event-stream",
@@ -35,6 +37,7 @@ async def gm_turn(
 async def get_latest_turn(
     session_id: str,
     db: Annotated[Session, Depends(get_session)],
+    use_case: Annotated[GmTurnUseCase, Depends(get_gm_turn_usecase)],
 ) -> LatestTurnResponse:
     """Return the latest persisted turn for SSE error recovery.
 
@@ -42,7 +45,6 @@ async def get_latest_turn(
     Nodes are always persisted before streaming starts, so this endpoint
     reliably returns the current turn's nodes for seamless UI recovery.
     """
-    use_case = GmTurnUseCase()
     result = use_case.get_latest_turn(session_id, db)
     if result is None:
         raise HTTPException(status_code=404, detail="No turns found for session")
@@ -5,6 +5,9 @@ from __future__ import annotations
 # Maximum number of closing narration turns for condition/GM-triggered endings.
 MAX_CLOSING_TURNS = 5
 
+# Maximum number of nodes in a closing sequence generated by a single call.
+MAX_ENDING_NODES = 12
+
 GM_SYSTEM_PROMPT = """\
 You are the Game Master (GM) of an improvised single-player tabletop RPG,
 writing with the craft and sensibility of a world-class visual novel screenwriter.
@@ -355,6 +358,25 @@ Turn: {current_turn_number} / {max_turns} (Remaining: {remaining_turns})
 """
 
 
+def _ending_tone(ending_type: str) -> tuple[str, str]:
+    """Return the label and narration guidance for an ending type."""
+    if ending_type == "victory":
+        guidance = (
+            "Show the moment of achievement and resolution with dramatic triumph."
+        )
+        return "VICTORY", guidance
+    if ending_type == "bad_end":
+        guidance = "Portray the failure and its consequences with dramatic weight."
+        return "BAD END", guidance
+    # normal_end
+    guidance = (
+        "Bring the story to a quiet, reflective close — "
+        "neither triumphant nor tragic. "
+        "Convey closure, ambiguity, or bittersweet peace."
+    )
+    return "NORMAL END", guidance
+
+
 def build_ending_narration_prompt(
     *,
     scenario_title: str,
@@ -373,21 +395,7 @@ def build_ending_narration_prompt(
     Supports multi-turn closing sequences up to MAX_CLOSING_TURNS.
     """
     mx = MAX_CLOSING_TURNS
-    if ending_type == "victory":
-        ending_label = "VICTORY"
-        guidance = (
-            "Show the moment of achievement and resolution with dramatic triumph."
-        )
-    elif ending_type == "bad_end":
-        ending_label = "BAD END"
-        guidance = "Portray the failure and its consequences with dramatic weight."
-    else:  # normal_end
-        ending_label = "NORMAL END"
-        guidance = (
-            "Bring the story to a quiet, reflective close — "
-            "neither triumphant nor tragic. "
-            "Convey closure, ambiguity, or bittersweet peace."
-        )
+    ending_label, guidance = _ending_tone(ending_type)
     session_end_rule = (
         "Include state_changes.session_end ONLY when you are ready to conclude.\n"
         f'  Set ending_type="{ending_type}" and ending_summary="{ending_summary}".\n'
@@ -498,3 +506,54 @@ COMPRESSION_CONTEXT_TEMPLATE = """\
 # Turns to Compress
 {turns_to_compress}
 """
+
+
+def build_ending_sequence_prompt(
+    *,
+    scenario_title: str,
+    ending_type: str,
+    ending_summary: str,
+    is_gm_decided: bool = False,
+    max_nodes: int = MAX_ENDING_NODES,
+) -> str:
+    """Build a GM prompt for the whole closing sequence in one response.
+
+    Single-call counterpart of build_ending_narration_prompt: instead of up
+    to MAX_CLOSING_TURNS continuation turns, the GM writes every closing
+    node at once (at most ``max_nodes``) and always concludes the session.
+    """
+    ending_label, guidance = _ending_tone(ending_type)
+    if is_gm_decided:
+        heading = f"# Session Closing Sequence ({ending_label})"
+        situation = """\
+You decided to end this session in your previous turn.
+Your last narration has already begun the closing — continue from exactly
+where you left off and bring the story to a complete, emotionally
+satisfying conclusion."""
+    else:
+        heading = f"# IMPORTANT: Condition-Triggered Ending ({ending_label})"
+        situation = f"""\
+A {ending_label} condition has just been triggered: "{ending_summary}"
+Your previous narration brought the story to this decisive moment.
+Now write a proper closing narration to conclude the story."""
+
+    return f"""\
+{heading}
+
+{situation}
+
+Write the ENTIRE closing sequence in this single response — there is no
+next turn. Use up to {max_nodes} nodes for aftermath, emotional resolution,
+and final closure, in story order.
+
+- decision_type MUST be "narrate"
+- {guidance}
+- Do NOT include a "choice" node.
+- Keep each node's text to 2–4 sentences.
+- You MUST include state_changes.session_end with:
+    ending_type="{ending_type}"
+    ending_summary="{ending_summary}"
+
+Current scenario: {scenario_title}
+Ending: {ending_summary}
+"""
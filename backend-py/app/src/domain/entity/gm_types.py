@@ -20,6 +20,10 @@ class GmTurnRequest(BaseModel):
     input_text: str
     auto_advance_until_user_action: bool = False
     max_auto_turns: int = Field(default=5, ge=1, le=20)
+    # Emit a per-stage ``timing`` SSE event before each ``done``.
+    include_timing: bool = False
+    # Emit partial ``nodesReady`` events while the GM is still generating.
+    stream_nodes: bool = False
 
 
 # --- GM Decision Sub-models ---
@@ -308,3 +312,4 @@ class GameContext(BaseModel):
     available_backgrounds: list[BackgroundResourceSummary] = []
     previous_bgm_mood: str | None = None
     previous_background: str | None = None
+    scenario_id: str | None = None
@@ -18,6 +18,31 @@ class DrizzleMigrations(SQLModel, table=True):
     created_at: Optional[int] = Field(default=None, sa_column=Column('created_at', BigInteger))
 
 
+class LlmUsage(SQLModel, table=True):
+    __tablename__ = 'llm_usage'
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='llm_usage_pkey'),
+        {'schema': 'public'}
+    )
+
+    id: uuid.UUID = Field(sa_column=Column('id', Uuid, primary_key=True, server_default=text('gen_random_uuid()')))
+    purpose: str = Field(sa_column=Column('purpose', Text, nullable=False))
+    model: str = Field(sa_column=Column('model', Text, nullable=False))
+    call_count: int = Field(sa_column=Column('call_count', Integer, nullable=False))
+    prompt_tokens: int = Field(sa_column=Column('prompt_tokens', Integer, nullable=False, server_default=text('0')))
+    cached_tokens: int = Field(sa_column=Column('cached_tokens', Integer, nullable=False, server_default=text('0')))
+    output_tokens: int = Field(sa_column=Column('output_tokens', Integer, nullable=False, server_default=text('0')))
+    total_tokens: int = Field(sa_column=Column('total_tokens', Integer, nullable=False, server_default=text('0')))
+    latency_ms_total: int = Field(sa_column=Column('latency_ms_total', Integer, nullable=False, server_default=text('0')))
+    latency_ms_max: int = Field(sa_column=Column('latency_ms_max', Integer, nullable=False, server_default=text('0')))
+    window_start: datetime.datetime = Field(sa_column=Column('window_start', TIMESTAMP(True, 3), nullable=False))
+    window_end: datetime.datetime = Field(sa_column=Column('window_end', TIMESTAMP(True, 3), nullable=False))
+    created_at: datetime.datetime = Field(sa_column=Column('created_at', TIMESTAMP(True, 3), nullable=False, server_default=text('now()')))
+    session_id: Optional[uuid.UUID] = Field(default=None, sa_column=Column('session_id', Uuid))
+    scenario_id: Optional[uuid.UUID] = Field(default=None, sa_column=Column('scenario_id', Uuid))
+    section_tokens: Optional[dict] = Field(default=None, sa_column=Column('section_tokens', JSONB))
+
+
 class Users(SQLModel, table=True):
     __table_args__ = (
         PrimaryKeyConstraint('id', name='users_pkey'),
@@ -174,12 +174,15 @@ class BgmService:
                 extension="mp3",
             )
             try:
+                audio_path = await self._upload_audio(
+                    scenario_id, normalized, generated
+                )
                 self._save_cache_record(
                     db,
                     scenario_id,
                     normalized,
                     instrumental_prompt,
-                    generated,
+                    audio_path,
                 )
             except Exception as exc:
                 logger.warning(
@@ -231,12 +234,15 @@ class BgmService:
             if not cache_enabled:
                 return None
             try:
+                audio_path = await self._upload_audio(
+                    scenario_id, normalized, generated
+                )
                 path = self._save_cache_record(
                     db,
                     scenario_id,
                     normalized,
                     instrumental_prompt,
-                    generated,
+                    audio_path,
                 )
             except Exception as exc:
                 logger.warning(
@@ -309,13 +315,16 @@ class BgmService:
                 extension="mp3",
             )
             try:
+                audio_path = await self._upload_audio(
+                    scenario_id, normalized, generated
+                )
                 with session_factory() as db:
                     self._save_cache_record(
                         db,
                         scenario_id,
                         normalized,
                         instrumental_prompt,
-                        generated,
+                        audio_path,
                     )
                 completed = True
             except Exception as exc:
@@ -394,13 +403,16 @@ class BgmService:
                 return None
 
             try:
+                audio_path = await self._upload_audio(
+                    scenario_id, normalized, generated
+                )
                 with session_factory() as db:
                     path = self._save_cache_record(
                         db,
                         scenario_id,
                         normalized,
                         instrumental_prompt,
-                        generated,
+                        audio_path,
                     )
                 completed = True
                 return self._to_public_url(path)
@@ -427,12 +439,10 @@ class BgmService:
             self._generating.discard(key)
             self._pending_prompts.pop(key, None)
 
-    def _save_cache_record(
+    async def _upload_audio(
         self,
-        db: Session,
         scenario_id: uuid.UUID,
         mood: str,
-        music_prompt: str,
         generated: GeneratedAudioAsset,
     ) -> str:
         path = self._build_storage_path(
@@ -440,11 +450,21 @@ class BgmService:
             mood,
             extension=generated.extension,
         )
-        uploaded_path: str = self._storage_client.upload_audio(
+        stored_path: str = await self._storage_client.upload_audio(
             path=path,
             audio_bytes=generated.audio_bytes,
             content_type=generated.content_type,
         )
+        return stored_path
+
+    def _save_cache_record(
+        self,
+        db: Session,
+        scenario_id: uuid.UUID,
+        mood: str,
+        music_prompt: str,
+        uploaded_path: str,
+    ) -> str:
         existing = self._bgm_cache_gw.find_by_scenario_and_mood(
             db,
             scenario_id,
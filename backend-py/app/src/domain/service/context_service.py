@@ -2,11 +2,17 @@
 
 Builds GameContext from DB data and formats it as a structured prompt.
 Compression is delegated to GameMemoryService (BaseMemoryService).
+
+Prompts are kept within ``token_budget`` (estimated locally): when the
+full prompt is too large, the list sections are trimmed step by step from
+the lowest-priority content upwards — older turns first, then NPC profile
+detail, background descriptions, and finally the remaining turn text.
 """
 
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 
 from domain.entity.gm_prompts import CONTEXT_TEMPLATE
@@ -19,21 +25,32 @@ from domain.entity.gm_types import (
     PlayerSummary,
     TurnSummary,
 )
-from gateway.item_gateway import ItemGateway
-from gateway.npc_gateway import NpcGateway
-from gateway.objective_gateway import ObjectiveGateway
-from gateway.player_character_gateway import PlayerCharacterGateway
-from gateway.scenario_gateway import ScenarioGateway
-from gateway.scene_background_gateway import SceneBackgroundGateway
+from domain.service.game_context_cache import (
+    GameContextCache,
+    shared_context_cache,
+)
+from gateway.game_snapshot_gateway import GameSnapshotGateway
 from gateway.session_gateway import SessionGateway
-from gateway.turn_gateway import TurnGateway
+from infra.usage_accounting import note_prompt_sections
 from util.logging import get_logger
+from util.token_estimate import estimate_tokens
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Callable
 
     from sqlmodel import Session
 
+    from domain.entity.models import (
+        Items,
+        NpcRelationships,
+        Npcs,
+        Objectives,
+        SceneBackgrounds,
+        Sessions,
+        Turns,
+    )
+
 logger = get_logger(__name__)
 
 
@@ -64,6 +81,52 @@ def extract_nodes_text(output: dict[str, object]) -> str:
     return "\n".join(lines)
 
 
+_RECENT_TURN_LIMIT = 5
+
+DEFAULT_PROMPT_TOKEN_BUDGET = 8000
+
+
+@dataclass(frozen=True)
+class _TrimLevel:
+    """How aggressively the list sections are shortened."""
+
+    max_turns: int | None = None
+    compact_npcs: bool = False
+    background_chars: int | None = None
+    turn_chars: int | None = None
+
+
+# Ordered from no trimming to the most aggressive; each level keeps the
+# reductions of the previous ones.
+_TRIM_LADDER = (
+    _TrimLevel(),
+    _TrimLevel(max_turns=3),
+    _TrimLevel(max_turns=3, compact_npcs=True),
+    _TrimLevel(max_turns=3, compact_npcs=True, background_chars=80),
+    _TrimLevel(max_turns=1, compact_npcs=True, background_chars=80),
+    _TrimLevel(
+        max_turns=1,
+        compact_npcs=True,
+        background_chars=40,
+        turn_chars=600,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class _PromptSections:
+    """Formatted variable-size prompt sections."""
+
+    turns: str
+    npcs: str
+    backgrounds: str
+    objectives: str
+    items: str
+
+    def token_breakdown(self) -> dict[str, int]:
+        return {f.name: estimate_tokens(getattr(self, f.name)) for f in fields(self)}
+
+
 _DEFAULT_PLAYER = PlayerSummary(
     name="Adventurer",
     stats={},
@@ -76,66 +139,123 @@ _DEFAULT_PLAYER = PlayerSummary(
 class ContextService:
     """Builds and formats game context for the GM prompt."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: GameContextCache | None = None,
+        *,
+        token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+    ) -> None:
+        self._snapshot_gw = GameSnapshotGateway()
         self._session_gw = SessionGateway()
-        self._turn_gw = TurnGateway()
-        self._npc_gw = NpcGateway()
-        self._pc_gw = PlayerCharacterGateway()
-        self._objective_gw = ObjectiveGateway()
-        self._item_gw = ItemGateway()
-        self._scenario_gw = ScenarioGateway()
-        self._bg_gw = SceneBackgroundGateway()
+        self.cache = cache if cache is not None else shared_context_cache
+        self.token_budget = token_budget
 
     def build_context(
         self,
         db: Session,
         session_id: uuid.UUID,
+        *,
+        game_session: Sessions | None = None,
     ) -> GameContext:
-        """Load all game state and build GameContext."""
-        sess = self._session_gw.get_by_id(db, session_id)
-        if sess is None:
-            msg = f"Session {session_id} not found"
-            raise ValueError(msg)
+        """Load all game state and build GameContext.
 
-        scenario = self._scenario_gw.get_by_id(db, sess.scenario_id)
-        if scenario is None:
-            msg = f"Scenario {sess.scenario_id} not found"
-            raise ValueError(msg)
+        A cached context is reused when its turn number still matches the
+        sessions row; otherwise all rows are read through
+        GameSnapshotGateway, so the number of queries stays constant
+        regardless of NPC or background count.
 
-        pc = self._pc_gw.get_by_session(db, session_id)
+        Args:
+            db: Database session.
+            session_id: Game session ID.
+            game_session: Already-loaded session row, reused to skip
+                re-fetching it.
+        """
+        cached = self._get_cached(db, session_id)
+        if cached is not None:
+            return cached
+
+        snapshot = self._snapshot_gw.load(
+            db,
+            session_id,
+            game_session=game_session,
+            turn_limit=_RECENT_TURN_LIMIT,
+        )
+        sess = snapshot.session
+        scenario = snapshot.scenario
+        pc = snapshot.player
 
         max_turns = int(
             getattr(scenario, "max_turns", 30) or 30,
         )
 
-        return GameContext(
+        context = GameContext(
+            scenario_id=str(scenario.id),
             scenario_title=scenario.title,
             scenario_setting=scenario.description,
             system_prompt="",
             win_conditions=scenario.win_conditions,
             fail_conditions=scenario.fail_conditions,
-            recent_turns=self._load_turns(db, session_id),
+            recent_turns=self._load_turns(snapshot.recent_turns),
             player=self._build_player(pc) if pc else _DEFAULT_PLAYER,
-            active_npcs=self._load_npcs(db, session_id),
-            active_objectives=self._load_objectives(db, session_id),
-            player_items=self._load_items(db, session_id),
+            active_npcs=self._build_npcs(snapshot.npcs),
+            active_objectives=self._load_objectives(snapshot.objectives),
+            player_items=self._load_items(snapshot.items),
             current_turn_number=int(sess.current_turn_number),
             max_turns=max_turns,
             current_state=sess.current_state,
-            available_backgrounds=self._load_backgrounds(
-                db,
-                sess.scenario_id,
-                session_id,
-            ),
+            available_backgrounds=self._load_backgrounds(snapshot.backgrounds),
             previous_bgm_mood=self._extract_previous_bgm_mood(
-                db,
-                session_id,
+                snapshot.recent_turns,
             ),
             previous_background=self._extract_previous_background(
-                db,
-                session_id,
+                snapshot.recent_turns,
             ),
         )
+        # Without a player row the default summary is used, which
+        # StateMutationService never writes to, so it cannot be mirrored.
+        if pc is not None:
+            self.cache.put(session_id, context)
+        return context
+
+    def record_turn(self, turn: Turns) -> None:
+        """Write a just-persisted turn through to the context cache."""
+        self.cache.record_turn(
+            turn.session_id,
+            self._load_turns([turn])[0],
+            previous_background=self._extract_previous_background([turn]),
+            previous_bgm_mood=self._extract_previous_bgm_mood([turn]),
+            turn_limit=_RECENT_TURN_LIMIT,
+        )
+
+    def record_background(self, background: SceneBackgrounds) -> None:
+        """Write a newly generated session background through to the cache."""
+        if background.session_id is None:
+            return
+        self.cache.add_background(
+            background.session_id,
+            self._load_backgrounds([background])[0],
+        )
+
+    def _get_cached(
+        self,
+        db: Session,
+        session_id: uuid.UUID,
+    ) -> GameContext | None:
+        """Return the cached context if no other worker advanced the turn."""
+        cached = self.cache.get(session_id)
+        if cached is None:
+            return None
+        current = self._session_gw.get_current_turn_number(db, session_id)
+        if current != cached.current_turn_number:
+            logger.info(
+                "Context cache stale",
+                session_id=str(session_id),
+                cached_turn=cached.current_turn_number,
+                current_turn=current,
+            )
+            self.cache.invalidate(session_id)
+            return None
+        return cached
 
     def build_prompt(
         self,
@@ -153,8 +273,27 @@ class ContextService:
             input_text: Raw player input text.
             extra_sections: Additional prompt sections appended after
                 the main template (e.g. soft-limit, condition progress,
-                action resolution).
+                action resolution).  They are never trimmed.
         """
+        return self._fit_to_budget(
+            context,
+            lambda sections: self._render_prompt(
+                context,
+                sections,
+                input_type,
+                input_text,
+                extra_sections,
+            ),
+        )
+
+    def _render_prompt(
+        self,
+        context: GameContext,
+        sections: _PromptSections,
+        input_type: str,
+        input_text: str,
+        extra_sections: list[str] | None,
+    ) -> str:
         remaining = max(
             0,
             context.max_turns - context.current_turn_number,
@@ -166,7 +305,7 @@ class ContextService:
                 system_prompt=context.system_prompt,
                 win_conditions=json.dumps(context.win_conditions),
                 fail_conditions=json.dumps(context.fail_conditions),
-                recent_turns=self._format_turns(context.recent_turns),
+                recent_turns=sections.turns,
                 player_name=context.player.name,
                 player_stats=json.dumps(context.player.stats),
                 player_status_effects=", ".join(
@@ -174,18 +313,14 @@ class ContextService:
                 ),
                 player_x=context.player.location_x,
                 player_y=context.player.location_y,
-                active_npcs=self._format_npcs(context.active_npcs),
-                active_objectives=self._format_objectives(
-                    context.active_objectives,
-                ),
-                player_items=self._format_items(context.player_items),
+                active_npcs=sections.npcs,
+                active_objectives=sections.objectives,
+                player_items=sections.items,
                 current_turn_number=context.current_turn_number,
                 max_turns=context.max_turns,
                 remaining_turns=remaining,
                 current_state=json.dumps(context.current_state),
-                available_backgrounds=self._format_backgrounds(
-                    context.available_backgrounds,
-                ),
+                available_backgrounds=sections.backgrounds,
                 previous_background_section=(
                     self._format_background_state_section(
                         context.previous_background,
@@ -224,26 +359,45 @@ class ContextService:
         extra_sections: list[str] | None = None,
     ) -> str:
         """Build dynamic-only prompt body for use with cached prefix."""
+        return self._fit_to_budget(
+            context,
+            lambda sections: self._render_prompt_delta(
+                context,
+                sections,
+                input_type,
+                input_text,
+                extra_sections,
+            ),
+        )
+
+    def _render_prompt_delta(
+        self,
+        context: GameContext,
+        sections: _PromptSections,
+        input_type: str,
+        input_text: str,
+        extra_sections: list[str] | None,
+    ) -> str:
         remaining = max(
             0,
             context.max_turns - context.current_turn_number,
         )
         prompt = (
             "# Available Scene Backgrounds\n"
-            f"{self._format_backgrounds(context.available_backgrounds)}\n\n"
+            f"{sections.backgrounds}\n\n"
             "# Recent Turns\n"
-            f"{self._format_turns(context.recent_turns)}\n\n"
+            f"{sections.turns}\n\n"
             "# Player Character\n"
             f"Name: {context.player.name}\n"
             f"Stats: {json.dumps(context.player.stats)}\n"
             f"Status Effects: {', '.join(context.player.status_effects)}\n"
             f"Location: ({context.player.location_x}, {context.player.location_y})\n\n"
             "# Active NPCs\n"
-            f"{self._format_npcs(context.active_npcs)}\n\n"
+            f"{sections.npcs}\n\n"
             "# Active Objectives\n"
-            f"{self._format_objectives(context.active_objectives)}\n\n"
+            f"{sections.objectives}\n\n"
             "# Player Items\n"
-            f"{self._format_items(context.player_items)}\n\n"
+            f"{sections.items}\n\n"
             "# Current Game State\n"
             f"Turn: {context.current_turn_number} / {context.max_turns} "
             f"(Remaining: {remaining})\n"
@@ -262,13 +416,84 @@ class ContextService:
 
     # --- private helpers ---
 
-    def _extract_previous_background(
+    def _fit_to_budget(
         self,
-        db: Session,
-        session_id: uuid.UUID,
-    ) -> str | None:
+        context: GameContext,
+        render: Callable[[_PromptSections], str],
+    ) -> str:
+        """Render with the least trimming that fits ``token_budget``.
+
+        Everything outside the list sections is fixed; if even the most
+        aggressive level does not fit, that level is used anyway.  The
+        estimated size of each section sent is noted for usage accounting.
+        """
+        sections = self._render_sections(context, _TRIM_LADDER[0])
+        prompt = render(sections)
+        full_tokens = estimate_tokens(prompt)
+        breakdown = sections.token_breakdown()
+        fixed_tokens = full_tokens - sum(breakdown.values())
+        if full_tokens <= self.token_budget:
+            note_prompt_sections({"fixed": fixed_tokens, **breakdown})
+            return prompt
+        level = _TRIM_LADDER[-1]
+        for level in _TRIM_LADDER[1:]:
+            sections = self._render_sections(context, level)
+            breakdown = sections.token_breakdown()
+            if fixed_tokens + sum(breakdown.values()) <= self.token_budget:
+                break
+        note_prompt_sections({"fixed": fixed_tokens, **breakdown})
+        trimmed = render(sections)
+        logger.info(
+            "Prompt trimmed to token budget",
+            budget=self.token_budget,
+            full_tokens=full_tokens,
+            trimmed_tokens=estimate_tokens(trimmed),
+            trim_level=_TRIM_LADDER.index(level),
+        )
+        return trimmed
+
+    def _render_sections(
+        self,
+        context: GameContext,
+        level: _TrimLevel,
+    ) -> _PromptSections:
+        turns = context.recent_turns
+        if level.max_turns is not None:
+            turns = turns[-level.max_turns :]
+        if level.turn_chars is not None:
+            limit = level.turn_chars
+            turns = [
+                t.model_copy(
+                    update={
+                        "nodes_text": _truncate(t.nodes_text, limit),
+                        "narration_summary": _truncate(t.narration_summary, limit),
+                    },
+                )
+                for t in turns
+            ]
+        backgrounds = context.available_backgrounds
+        if level.background_chars is not None:
+            limit = level.background_chars
+            backgrounds = [
+                b.model_copy(update={"description": _truncate(b.description, limit)})
+                for b in backgrounds
+            ]
+        npcs = (
+            self._format_npcs_compact(context.active_npcs)
+            if level.compact_npcs
+            else self._format_npcs(context.active_npcs)
+        )
+        return _PromptSections(
+            turns=self._format_turns(turns),
+            npcs=npcs,
+            backgrounds=self._format_backgrounds(backgrounds),
+            objectives=self._format_objectives(context.active_objectives),
+            items=self._format_items(context.player_items),
+        )
+
+    @staticmethod
+    def _extract_previous_background(rows: list[Turns]) -> str | None:
         """Extract effective background from the most recent turn."""
-        rows = self._turn_gw.get_recent(db, session_id, limit=1)
         if not rows:
             return None
         output = rows[0].output
@@ -295,13 +520,9 @@ class ContextService:
             )
         return "No background set."
 
-    def _extract_previous_bgm_mood(
-        self,
-        db: Session,
-        session_id: uuid.UUID,
-    ) -> str | None:
+    @staticmethod
+    def _extract_previous_bgm_mood(rows: list[Turns]) -> str | None:
         """Extract bgm_mood from the most recent turn output."""
-        rows = self._turn_gw.get_recent(db, session_id, limit=1)
         if not rows:
             return None
         output = rows[0].output
@@ -321,12 +542,8 @@ class ContextService:
             )
         return "No BGM playing."
 
-    def _load_turns(
-        self,
-        db: Session,
-        session_id: uuid.UUID,
-    ) -> list[TurnSummary]:
-        rows = self._turn_gw.get_recent(db, session_id, limit=5)
+    @staticmethod
+    def _load_turns(rows: list[Turns]) -> list[TurnSummary]:
         return [
             TurnSummary(
                 turn_number=int(t.turn_number),
@@ -353,18 +570,14 @@ class ContextService:
             location_y=int(pc.location_y),  # type: ignore[attr-defined]
         )
 
-    def _load_npcs(
-        self,
-        db: Session,
-        session_id: uuid.UUID,
+    @staticmethod
+    def _build_npcs(
+        pairs: list[tuple[Npcs, NpcRelationships | None]],
     ) -> list[NpcSummary]:
-        npcs = self._npc_gw.get_by_session(db, session_id)
         result: list[NpcSummary] = []
-        for npc in npcs:
-            pair = self._npc_gw.get_with_relationship(db, npc.id)
+        for npc, rel in pairs:
             rel_dict: dict[str, object] = {}
-            if pair and pair[1]:
-                rel = pair[1]
+            if rel:
                 rel_dict = {
                     "affinity": int(rel.affinity),
                     "trust": int(rel.trust),
@@ -384,12 +597,8 @@ class ContextService:
             )
         return result
 
-    def _load_objectives(
-        self,
-        db: Session,
-        session_id: uuid.UUID,
-    ) -> list[ObjectiveSummary]:
-        rows = self._objective_gw.get_active_by_session(db, session_id)
+    @staticmethod
+    def _load_objectives(rows: list[Objectives]) -> list[ObjectiveSummary]:
         return [
             ObjectiveSummary(
                 title=o.title,
@@ -399,12 +608,8 @@ class ContextService:
             for o in rows
         ]
 
-    def _load_items(
-        self,
-        db: Session,
-        session_id: uuid.UUID,
-    ) -> list[ItemSummary]:
-        rows = self._item_gw.get_by_session(db, session_id)
+    @staticmethod
+    def _load_items(rows: list[Items]) -> list[ItemSummary]:
         return [
             ItemSummary(
                 name=i.name,
@@ -414,15 +619,11 @@ class ContextService:
             for i in rows
         ]
 
+    @staticmethod
     def _load_backgrounds(
-        self,
-        db: Session,
-        scenario_id: uuid.UUID,
-        session_id: uuid.UUID,
+        rows: list[SceneBackgrounds],
     ) -> list[BackgroundResourceSummary]:
-        """Load scenario + session-generated backgrounds."""
-        rows = self._bg_gw.find_all_by_scenario(db, scenario_id)
-        rows += self._bg_gw.find_all_by_session(db, session_id)
+        """Deduplicate scenario + session-generated backgrounds."""
         seen: set[str] = set()
         result: list[BackgroundResourceSummary] = []
         for bg in rows:
@@ -467,6 +668,16 @@ class ContextService:
             for n in npcs
         )
 
+    @staticmethod
+    def _format_npcs_compact(npcs: list[NpcSummary]) -> str:
+        """Format NPCs without profile and goals (budget trimming)."""
+        return "\n".join(
+            f"- {n.name}: state={json.dumps(n.state)}"
+            f" rel={json.dumps(n.relationship)}"
+            f" location=({n.location_x}, {n.location_y})"
+            for n in npcs
+        )
+
     @staticmethod
     def _format_objectives(objs: list[ObjectiveSummary]) -> str:
         return "\n".join(
@@ -487,3 +698,10 @@ class ContextService:
         return "\n".join(
             f"- id={b.id} | {b.location_name}: {b.description}" for b in bgs
         )
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut ``text`` to ``limit`` characters, marking the cut."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - 1] + "…"
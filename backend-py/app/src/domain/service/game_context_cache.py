@@ -0,0 +1,241 @@
+"""Per-session in-memory GameContext cache.
+
+Entries are evicted LRU-first once ``max_entries`` is reached and expire
+after ``ttl_seconds``.  Writers in this process keep entries current by
+mirroring their DB writes (write-through); writes from other workers are
+detected by comparing ``current_turn_number`` with the sessions row.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from domain.entity.gm_types import ItemSummary, ObjectiveSummary
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable
+
+    from domain.entity.gm_types import (
+        BackgroundResourceSummary,
+        GameContext,
+        NpcSummary,
+        StateChanges,
+        TurnSummary,
+    )
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 300.0
+
+
+@dataclass
+class _Entry:
+    context: GameContext
+    expires_at: float
+
+
+class GameContextCache:
+    """Bounded LRU + TTL cache of GameContext keyed by session ID."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[uuid.UUID, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of live entries."""
+        return len(self._entries)
+
+    def get(self, session_id: uuid.UUID) -> GameContext | None:
+        """Return a copy of the cached context, or None if absent/expired."""
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return None
+            self._entries.move_to_end(session_id)
+            return entry.context.model_copy(deep=True)
+
+    def put(self, session_id: uuid.UUID, context: GameContext) -> None:
+        """Store a copy of ``context`` and evict the least recently used."""
+        with self._lock:
+            self._entries[session_id] = _Entry(
+                context=context.model_copy(deep=True),
+                expires_at=self._clock() + self._ttl_seconds,
+            )
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: uuid.UUID) -> None:
+        """Drop the entry for a session, if any."""
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def apply_changes(
+        self,
+        session_id: uuid.UUID,
+        changes: StateChanges,
+    ) -> None:
+        """Mirror StateMutationService.apply onto the cached context."""
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return
+            ctx = entry.context
+            _apply_player_changes(ctx, changes)
+            _apply_item_changes(ctx, changes)
+            _apply_npc_changes(ctx.active_npcs, changes)
+            _apply_objective_changes(ctx, changes)
+            _apply_flag_changes(ctx, changes)
+
+    def record_turn(
+        self,
+        session_id: uuid.UUID,
+        turn: TurnSummary,
+        *,
+        previous_background: str | None,
+        previous_bgm_mood: str | None,
+        turn_limit: int,
+    ) -> None:
+        """Append a persisted turn and advance the cached turn number."""
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return
+            ctx = entry.context
+            ctx.recent_turns = [*ctx.recent_turns, turn][-turn_limit:]
+            ctx.current_turn_number = turn.turn_number
+            ctx.previous_background = previous_background
+            ctx.previous_bgm_mood = previous_bgm_mood
+
+    def add_background(
+        self,
+        session_id: uuid.UUID,
+        background: BackgroundResourceSummary,
+    ) -> None:
+        """Append a session-generated background to the cached context."""
+        with self._lock:
+            entry = self._live_entry(session_id)
+            if entry is None:
+                return
+            backgrounds = entry.context.available_backgrounds
+            if all(b.id != background.id for b in backgrounds):
+                entry.context.available_backgrounds = [*backgrounds, background]
+
+    def _live_entry(self, session_id: uuid.UUID) -> _Entry | None:
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[session_id]
+            return None
+        return entry
+
+
+def _apply_player_changes(ctx: GameContext, changes: StateChanges) -> None:
+    player = ctx.player
+    for sd in changes.stats_delta or []:
+        player.stats[sd.stat] = player.stats.get(sd.stat, 0) + sd.delta
+    if changes.location_change is not None:
+        player.location_x = changes.location_change.x
+        player.location_y = changes.location_change.y
+    adds = changes.status_effect_adds or []
+    removes = changes.status_effect_removes or []
+    if adds or removes:
+        effects = [*player.status_effects, *adds]
+        player.status_effects = [e for e in effects if e not in removes]
+
+
+def _apply_item_changes(ctx: GameContext, changes: StateChanges) -> None:
+    items = ctx.player_items
+    items.extend(
+        ItemSummary(
+            name=item.name,
+            item_type=item.item_type,
+            quantity=item.quantity,
+        )
+        for item in changes.new_items or []
+    )
+    for name in changes.removed_items or []:
+        found = next((i for i in items if i.name == name), None)
+        if found is not None:
+            items.remove(found)
+    for iu in changes.item_updates or []:
+        if iu.quantity_delta is None:
+            continue
+        found = next((i for i in items if i.name == iu.name), None)
+        if found is not None:
+            found.quantity += iu.quantity_delta
+
+
+def _find_npc(npcs: list[NpcSummary], name: str) -> NpcSummary | None:
+    return next((n for n in npcs if n.name == name), None)
+
+
+def _apply_npc_changes(npcs: list[NpcSummary], changes: StateChanges) -> None:
+    for rc in changes.relationship_changes or []:
+        npc = _find_npc(npcs, rc.npc_name)
+        if npc is None or not npc.relationship:
+            continue
+        rel = npc.relationship
+        rel["affinity"] = int(rel.get("affinity", 0)) + rc.affinity_delta
+        rel["trust"] = int(rel.get("trust", 0)) + rc.trust_delta
+        rel["fear"] = int(rel.get("fear", 0)) + rc.fear_delta
+        rel["debt"] = int(rel.get("debt", 0)) + rc.debt_delta
+    for nsu in changes.npc_state_updates or []:
+        npc = _find_npc(npcs, nsu.npc_name)
+        if npc is not None:
+            npc.state = {e.key: e.value for e in nsu.state}
+    for nlc in changes.npc_location_changes or []:
+        npc = _find_npc(npcs, nlc.npc_name)
+        if npc is not None:
+            npc.location_x = nlc.x
+            npc.location_y = nlc.y
+
+
+def _apply_objective_changes(ctx: GameContext, changes: StateChanges) -> None:
+    for ou in changes.objective_updates or []:
+        active = ctx.active_objectives
+        found = next((o for o in active if o.title == ou.title), None)
+        if found is not None:
+            if ou.status == "active":
+                continue
+            active.remove(found)
+        elif ou.status == "active":
+            active.append(
+                ObjectiveSummary(
+                    title=ou.title,
+                    status="active",
+                    description=ou.description or None,
+                ),
+            )
+
+
+def _apply_flag_changes(ctx: GameContext, changes: StateChanges) -> None:
+    if not changes.flag_changes:
+        return
+    state = dict(ctx.current_state or {})
+    flags: dict[str, bool] = dict(state.get("flags", {}))
+    for fc in changes.flag_changes:
+        if fc.value:
+            flags[fc.flag_id] = True
+        else:
+            flags.pop(fc.flag_id, None)
+    state["flags"] = flags
+    ctx.current_state = state
+
+
+shared_context_cache = GameContextCache()
+"""Process-wide cache shared by ContextService and StateMutationService."""
@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from domain.entity.gm_types import GmDecisionResponse, StateChanges
+    from domain.entity.gm_types import GmDecisionResponse, SceneNode, StateChanges
 
 from domain.service.storage_constants import SCENARIO_ASSETS_BUCKET
 from util.logging import get_logger
@@ -168,6 +168,22 @@ class GenuiBridgeService:
         # 6. Done
         yield _sse({"type": "done"})
 
+    @staticmethod
+    def partial_nodes_event(nodes: list[SceneNode]) -> str:
+        """Build a nodesReady event for nodes generated so far.
+
+        Each partial event carries every node of the in-flight decision, so
+        it replaces the previous one (including after a GM retry).  The
+        complete list follows in the regular nodesReady event.
+        """
+        return _sse(
+            {
+                "type": "nodesReady",
+                "nodes": [n.model_dump() for n in nodes],
+                "partial": True,
+            }
+        )
+
     @staticmethod
     def _text_event(word: str) -> str:
         return _sse({"type": "text", "content": word})
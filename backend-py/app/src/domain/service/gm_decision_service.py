@@ -6,19 +6,42 @@ google-adk の AdkGmClient を介して GmDecisionResponse を取得する。
 - use_interactions_api による自動セッション管理
 - セッションベースのマルチターン連鎖
 を実現する。
+
+ヘッジ (hedge_percentile 指定時の DECISION 呼び出しのみ):
+直近の成功レイテンシの指定パーセンタイルを超えても応答がない場合、
+同じプロンプトで 2 本目の decide を並列に投げ、先に成功した方を採用して
+もう一方をキャンセルする。2 本目は会話履歴を共有できないため、
+ADK セッションを共有する runtime (use_interactions=True) ではヘッジしない。
+レイテンシは purpose ごとに記録し、長いエンディング生成が判定の閾値を
+歪めないようにする。エンディングはヘッジすると生成全体が重複し、
+2 本目はノードをストリームしないためヘッジしない。
+
+セッションを共有しない呼び出し (単発ターン・ヘッジ) は ephemeral=True で
+インメモリセッションを使い、DB に ADK セッションを残さない。
+
+モデルは呼び出し目的 (purpose) ごとに ModelRouter が選び、成功した試行の
+レイテンシを返して適応させる。明示プロンプトキャッシュを使う呼び出しは
+キャッシュと同じ優先モデルに固定する。
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from util.logging import get_logger
+from infra.llm_retry import RetryPolicy, call_with_retry
+from infra.model_router import ModelRoute, ModelRouter, shared_model_router
+from infra.usage_accounting import UsagePurpose, usage_purpose
+from util.latency_window import LatencyWindow
+from util.logging import get_logger, timing_span
 
 if TYPE_CHECKING:
     from domain.entity.gm_types import GmDecisionResponse
-    from infra.adk_gm_client import AdkGmClient
+    from infra.adk_gm_client import AdkGmClient, SceneNodeListener
 
 logger = get_logger(__name__)
 
@@ -36,44 +59,169 @@ class GmDecisionRuntime:
     adk_session_id: str | None = None
 
 
+@dataclass(frozen=True)
+class _DecideCall:
+    prompt: str
+    game_session_id: str
+    cached_content: str | None
+    on_node: SceneNodeListener | None
+    ephemeral: bool
+    purpose: UsagePurpose
+    route: ModelRoute
+
+
 class GmDecisionService:
     """Call ADK agent for GM decisions (structured output via GmDecisionResponse)."""
 
     MAX_RETRIES = 3
+    RETRY_POLICY = RetryPolicy(max_attempts=MAX_RETRIES)
+    DEFAULT_HEDGE_PERCENTILE = 0.95
+    HEDGE_WINDOW = 200
+    HEDGE_MIN_SAMPLES = 20
 
-    def __init__(self, adk: AdkGmClient) -> None:
+    def __init__(
+        self,
+        adk: AdkGmClient,
+        *,
+        hedge_percentile: float | None = None,
+        router: ModelRouter | None = None,
+    ) -> None:
+        """``hedge_percentile`` (e.g. 0.95) enables hedging; None disables it."""
         self._adk = adk
+        self._router = router if router is not None else shared_model_router
+        self._hedge_percentile = hedge_percentile
+        self._latencies = {
+            purpose: LatencyWindow(self.HEDGE_WINDOW) for purpose in UsagePurpose
+        }
 
-    async def decide(
+    async def decide(  # noqa: PLR0913
         self,
         prompt: str,
         *,
         game_session_id: str,
         runtime: GmDecisionRuntime | None = None,
+        cached_content: str | None = None,
+        on_node: SceneNodeListener | None = None,
+        purpose: UsagePurpose = UsagePurpose.DECISION,
     ) -> GmDecisionResponse:
-        """Get GM decision with retry.  Raises the last exception on exhaustion."""
-        last_exc: BaseException = RuntimeError("GM decision retries exhausted")
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                session_id = self._get_or_create_session_id(runtime)
-                result = await self._adk.decide(
-                    prompt=prompt,
+        """Get GM decision with retry.  Raises the last exception on exhaustion.
+
+        Failures are classified by ``infra.llm_retry``: invalid output is
+        retried at once, transient and rate-limit errors after a jittered
+        backoff, fatal errors and an open circuit not at all.
+
+        ``cached_content`` names an explicit prompt cache holding the stable
+        prefix; ``prompt`` must then contain only the per-turn delta.
+        ``on_node`` receives scene nodes as they are generated; indices
+        restart at 0 on every attempt.  Only DECISION calls are hedged, and only
+        the primary request of a hedged attempt streams nodes.  ``purpose``
+        selects the model route, keys the latency window and tags usage
+        accounting.
+        """
+        call = _DecideCall(
+            prompt=prompt,
+            game_session_id=game_session_id,
+            cached_content=cached_content,
+            on_node=on_node,
+            ephemeral=runtime is None or not runtime.use_interactions,
+            purpose=purpose,
+            route=self._router.route(purpose, pinned=cached_content is not None),
+        )
+
+        async def attempt_once(attempt: int) -> GmDecisionResponse:
+            session_id = self._get_or_create_session_id(runtime)
+            with timing_span("gm_decide", attempt=attempt):
+                result = await self._decide_attempt(
+                    call,
                     session_id=session_id,
-                    game_session_id=game_session_id,
+                    hedge_delay=self._hedge_delay(runtime, purpose),
                 )
-                logger.info("GM decision succeeded", attempt=attempt + 1)
-                return result
-            except Exception as exc:
-                last_exc = exc
-                logger.exception(
-                    "GM decision attempt failed",
-                    attempt=attempt + 1,
+            logger.info("GM decision succeeded", attempt=attempt)
+            return result
+
+        try:
+            with usage_purpose(purpose):
+                return await call_with_retry(
+                    attempt_once,
+                    model=call.route.model,
+                    name="gm_decision",
+                    policy=self.RETRY_POLICY,
                 )
-        logger.error(
-            "All GM decision retries exhausted",
-            max_retries=self.MAX_RETRIES,
+        except Exception as exc:
+            logger.error(  # noqa: TRY400
+                "GM decision failed",
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            raise
+
+    async def _decide_attempt(
+        self,
+        call: _DecideCall,
+        *,
+        session_id: str,
+        hedge_delay: float | None,
+    ) -> GmDecisionResponse:
+        """Run one attempt, hedging it after ``hedge_delay`` seconds."""
+        started = time.perf_counter()
+        primary = asyncio.create_task(
+            self._adk.decide(
+                prompt=call.prompt,
+                session_id=session_id,
+                game_session_id=call.game_session_id,
+                cached_content=call.cached_content,
+                on_node=call.on_node,
+                ephemeral=call.ephemeral,
+                route=call.route,
+            ),
         )
-        raise last_exc
+        tasks = [primary]
+        try:
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    logger.info(
+                        "GM decision hedged",
+                        hedge_delay_ms=round(hedge_delay * 1000, 1),
+                    )
+                    tasks.append(
+                        asyncio.create_task(
+                            self._adk.decide(
+                                prompt=call.prompt,
+                                session_id=str(uuid.uuid4()),
+                                game_session_id=call.game_session_id,
+                                cached_content=call.cached_content,
+                                ephemeral=True,
+                                route=call.route,
+                            ),
+                        ),
+                    )
+            result = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    with contextlib.suppress(BaseException):
+                        await task
+        elapsed = time.perf_counter() - started
+        self._latencies[call.purpose].record(elapsed)
+        self._router.observe(call.purpose, call.route, elapsed)
+        return result
+
+    def _hedge_delay(
+        self,
+        runtime: GmDecisionRuntime | None,
+        purpose: UsagePurpose = UsagePurpose.DECISION,
+    ) -> float | None:
+        """Return the hedge delay, or None when this call must not hedge."""
+        if self._hedge_percentile is None or purpose != UsagePurpose.DECISION:
+            return None
+        if runtime is not None and runtime.use_interactions:
+            return None
+        latencies = self._latencies[purpose]
+        if len(latencies) < self.HEDGE_MIN_SAMPLES:
+            return None
+        delay: float = latencies.percentile(self._hedge_percentile)
+        return delay
 
     async def cleanup_runtime(
         self, runtime: GmDecisionRuntime, *, game_session_id: str
@@ -100,3 +248,19 @@ class GmDecisionService:
         if runtime.adk_session_id is None:
             runtime.adk_session_id = str(uuid.uuid4())
         return runtime.adk_session_id
+
+
+async def _first_success(
+    tasks: list[asyncio.Task[GmDecisionResponse]],
+) -> GmDecisionResponse:
+    """Return the first successful result; raise the primary's error if all fail."""
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(
+            pending,
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in done:
+            if task.exception() is None:
+                return task.result()
+    return tasks[0].result()
@@ -0,0 +1,282 @@
+"""Explicit Gemini prompt caches for the stable per-scenario prompt prefix.
+
+The GM system prompt plus ``ContextService.build_prompt_cache_seed`` is the
+same for every turn of every session playing a scenario, so it is cached
+once per scenario and shared.  Each game session holds a reference while it
+has turns in flight; caches nobody references are kept for reuse until they
+expire or are evicted LRU-first once ``max_entries`` is exceeded.  Caches
+close to expiry are refreshed on acquisition rather than recreated.
+
+Cache creation can fail (e.g. the prefix is below the model's minimum cache
+size); the scenario is then skipped for ``failure_cooldown_seconds`` and
+callers fall back to sending the full prompt.
+
+Bookkeeping never awaits, so it is atomic on the event loop and no lock is
+held across network calls: concurrent acquisitions of a missing cache share
+one in-flight creation, while refreshes and deletes of evicted caches run as
+background tasks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from infra.gemini_client import GeminiClient
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_REFRESH_MARGIN_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 32
+DEFAULT_FAILURE_COOLDOWN_SECONDS = 600
+
+
+@dataclass
+class _CacheEntry:
+    name: str
+    expires_at: float
+    holders: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True)
+class PromptCacheKey:
+    """Scenario plus a digest of the cached text.
+
+    The digest makes edited scenarios (or a changed system prompt) map to a
+    new cache instead of silently reusing stale content.
+    """
+
+    scenario_id: str
+    digest: str
+
+    @classmethod
+    def build(
+        cls,
+        scenario_id: str,
+        *,
+        system_instruction: str,
+        seed: str,
+    ) -> PromptCacheKey:
+        """Derive the key for a scenario's cached prefix."""
+        digest = hashlib.sha256(
+            f"{system_instruction}\0{seed}".encode(),
+        ).hexdigest()[:16]
+        return cls(scenario_id=scenario_id, digest=digest)
+
+
+class PromptCacheManager:
+    """Reference-counted, TTL-refreshed explicit caches keyed by scenario."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        gemini: GeminiClient,
+        *,
+        model: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        refresh_margin_seconds: int = DEFAULT_REFRESH_MARGIN_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        failure_cooldown_seconds: int = DEFAULT_FAILURE_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._gemini = gemini
+        self._model = model
+        self._ttl_seconds = ttl_seconds
+        self._refresh_margin_seconds = refresh_margin_seconds
+        self._max_entries = max_entries
+        self._failure_cooldown_seconds = failure_cooldown_seconds
+        self._clock = clock
+        self._entries: OrderedDict[PromptCacheKey, _CacheEntry] = OrderedDict()
+        self._failed_until: dict[PromptCacheKey, float] = {}
+        self._creating: dict[PromptCacheKey, asyncio.Future[None]] = {}
+        self._refreshing: set[PromptCacheKey] = set()
+        self._background: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """Return the number of tracked caches."""
+        return len(self._entries)
+
+    def references(self, key: PromptCacheKey) -> int:
+        """Return how many sessions currently hold ``key``."""
+        entry = self._entries.get(key)
+        return len(entry.holders) if entry else 0
+
+    async def acquire(
+        self,
+        key: PromptCacheKey,
+        *,
+        holder: str,
+        system_instruction: str,
+        seed: str,
+    ) -> str | None:
+        """Return the cache name for ``key``, creating it if needed.
+
+        ``holder`` (a game session ID) keeps the cache from being evicted
+        until ``release`` is called.  Returns None when no cache is
+        available; the caller should then send the full prompt.
+        """
+        while True:
+            now = self._clock()
+            self._prune_failures(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                if entry.expires_at - now <= self._refresh_margin_seconds:
+                    self._refresh_in_background(key, entry)
+                return self._hold(key, entry, holder)
+            if key in self._failed_until:
+                return None
+            pending = self._creating.get(key)
+            if pending is not None:
+                # Another session is creating this cache; re-check once done.
+                await asyncio.shield(pending)
+                continue
+            entry = await self._create_shared(
+                key,
+                system_instruction=system_instruction,
+                seed=seed,
+            )
+            return None if entry is None else self._hold(key, entry, holder)
+
+    def release(self, holder: str) -> None:
+        """Drop every reference ``holder`` has on any cache."""
+        for entry in self._entries.values():
+            entry.holders.discard(holder)
+        self._evict_unreferenced()
+
+    async def aclose(self) -> None:
+        """Delete all caches (best effort); used at process shutdown."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        for entry in entries:
+            await self._delete(entry.name)
+
+    def _hold(self, key: PromptCacheKey, entry: _CacheEntry, holder: str) -> str:
+        entry.holders.add(holder)
+        self._entries.move_to_end(key)
+        self._evict_unreferenced()
+        return entry.name
+
+    async def _create_shared(
+        self,
+        key: PromptCacheKey,
+        *,
+        system_instruction: str,
+        seed: str,
+    ) -> _CacheEntry | None:
+        """Create the cache while concurrent acquirers of ``key`` wait."""
+        done = asyncio.get_running_loop().create_future()
+        self._creating[key] = done
+        try:
+            return await self._create(
+                key,
+                system_instruction=system_instruction,
+                seed=seed,
+            )
+        finally:
+            del self._creating[key]
+            done.set_result(None)
+
+    async def _create(
+        self,
+        key: PromptCacheKey,
+        *,
+        system_instruction: str,
+        seed: str,
+    ) -> _CacheEntry | None:
+        try:
+            name = await self._gemini.create_prompt_cache(
+                model=self._model,
+                contents=seed,
+                ttl=f"{self._ttl_seconds}s",
+                display_name=f"gm-scenario-{key.scenario_id}-{key.digest}",
+                system_instruction=system_instruction,
+            )
+        except Exception as exc:
+            self._failed_until[key] = self._clock() + self._failure_cooldown_seconds
+            logger.warning(
+                "Prompt cache creation failed; sending full prompts",
+                scenario_id=key.scenario_id,
+                error=str(exc),
+            )
+            return None
+        self._failed_until.pop(key, None)
+        entry = _CacheEntry(name=name, expires_at=self._clock() + self._ttl_seconds)
+        self._entries[key] = entry
+        logger.info("Prompt cache created", scenario_id=key.scenario_id, name=name)
+        return entry
+
+    def _refresh_in_background(
+        self,
+        key: PromptCacheKey,
+        entry: _CacheEntry,
+    ) -> None:
+        """Extend ``entry``'s TTL without delaying the acquiring turn."""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self._spawn(self._refresh(key, entry))
+
+    async def _refresh(self, key: PromptCacheKey, entry: _CacheEntry) -> None:
+        try:
+            await self._gemini.refresh_prompt_cache(
+                entry.name,
+                ttl=f"{self._ttl_seconds}s",
+            )
+        except Exception as exc:
+            logger.warning(
+                "Prompt cache refresh failed; recreating",
+                scenario_id=key.scenario_id,
+                name=entry.name,
+                error=str(exc),
+            )
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        else:
+            entry.expires_at = self._clock() + self._ttl_seconds
+        finally:
+            self._refreshing.discard(key)
+
+    def _evict_unreferenced(self) -> None:
+        now = self._clock()
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at <= now and not entry.holders:
+                del self._entries[key]
+        excess = len(self._entries) - self._max_entries
+        idle = [key for key, entry in self._entries.items() if not entry.holders]
+        for key in idle[: max(excess, 0)]:
+            entry = self._entries.pop(key)
+            logger.info(
+                "Prompt cache evicted",
+                scenario_id=key.scenario_id,
+                name=entry.name,
+            )
+            self._spawn(self._delete(entry.name))
+
+    def _prune_failures(self, now: float) -> None:
+        expired = [key for key, until in self._failed_until.items() if until <= now]
+        for key in expired:
+            del self._failed_until[key]
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _delete(self, name: str) -> None:
+        try:
+            await self._gemini.delete_prompt_cache(name)
+        except Exception as exc:
+            logger.warning("Prompt cache delete failed", name=name, error=str(exc))
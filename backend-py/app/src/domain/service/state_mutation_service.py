@@ -6,6 +6,10 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from domain.entity.models import Items, Objectives
+from domain.service.game_context_cache import (
+    GameContextCache,
+    shared_context_cache,
+)
 from gateway.item_gateway import ItemGateway
 from gateway.npc_gateway import NpcGateway, RelationshipDelta
 from gateway.objective_gateway import ObjectiveGateway
@@ -26,7 +30,8 @@ logger = get_logger(__name__)
 class StateMutationService:
     """Apply StateChanges from GM decision to DB."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache: GameContextCache | None = None) -> None:
+        self.cache = cache if cache is not None else shared_context_cache
         self.pc_gw = PlayerCharacterGateway()
         self.item_gw = ItemGateway()
         self.npc_gw = NpcGateway()
@@ -39,18 +44,27 @@ class StateMutationService:
         session_id: uuid.UUID,
         changes: StateChanges,
     ) -> None:
-        """Apply all state mutations atomically."""
-        self._apply_stats(db, session_id, changes)
-        self._apply_items(db, session_id, changes)
-        self._apply_item_updates(db, session_id, changes)
-        self._apply_location(db, session_id, changes)
-        self._apply_relationships(db, session_id, changes)
-        self._apply_npc_states(db, session_id, changes)
-        self._apply_npc_locations(db, session_id, changes)
-        self._apply_objectives(db, session_id, changes)
-        self._apply_status_effects(db, session_id, changes)
-        self._apply_flags(db, session_id, changes)
-        self._apply_session_end(db, session_id, changes)
+        """Apply all state mutations atomically.
+
+        The cached GameContext is updated in place once every write has
+        succeeded; on failure it is dropped so the next turn reloads.
+        """
+        try:
+            self._apply_stats(db, session_id, changes)
+            self._apply_items(db, session_id, changes)
+            self._apply_item_updates(db, session_id, changes)
+            self._apply_location(db, session_id, changes)
+            self._apply_relationships(db, session_id, changes)
+            self._apply_npc_states(db, session_id, changes)
+            self._apply_npc_locations(db, session_id, changes)
+            self._apply_objectives(db, session_id, changes)
+            self._apply_status_effects(db, session_id, changes)
+            self._apply_flags(db, session_id, changes)
+            self._apply_session_end(db, session_id, changes)
+        except Exception:
+            self.cache.invalidate(session_id)
+            raise
+        self.cache.apply_changes(session_id, changes)
 
     def apply_session_end(
         self,
@@ -0,0 +1,175 @@
+"""Game snapshot data access gateway."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from sqlmodel import col, or_, select
+
+from domain.entity.models import (
+    Items,
+    NpcRelationships,
+    Npcs,
+    Objectives,
+    PlayerCharacters,
+    Scenarios,
+    SceneBackgrounds,
+    Sessions,
+    Turns,
+)
+
+if TYPE_CHECKING:
+    import uuid
+
+    from sqlmodel import Session
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """Rows backing one GameContext.
+
+    recent_turns is ordered by turn_number descending (newest first).
+    """
+
+    session: Sessions
+    scenario: Scenarios
+    player: PlayerCharacters | None
+    npcs: list[tuple[Npcs, NpcRelationships | None]]
+    objectives: list[Objectives]
+    items: list[Items]
+    backgrounds: list[SceneBackgrounds]
+    recent_turns: list[Turns]
+
+
+class GameSnapshotGateway:
+    """Load a GameSnapshot with a fixed number of queries.
+
+    The query count does not depend on the number of NPCs, turns or
+    backgrounds: NPCs are outer-joined with their relationship row, scenario
+    and session backgrounds share one query, and recent turns are read once.
+    """
+
+    def load(
+        self,
+        session: Session,
+        session_id: uuid.UUID,
+        *,
+        game_session: Sessions | None = None,
+        turn_limit: int = 5,
+    ) -> GameSnapshot:
+        """Load the snapshot for a session.
+
+        Args:
+            session: Database session.
+            session_id: Game session ID.
+            game_session: Already-loaded session row.  When given, the
+                session is not fetched again.
+            turn_limit: Number of recent turns to load.
+
+        Raises:
+            ValueError: If the session or its scenario does not exist.
+        """
+        sess, scenario = self._load_session_and_scenario(
+            session,
+            session_id,
+            game_session,
+        )
+        return GameSnapshot(
+            session=sess,
+            scenario=scenario,
+            player=session.exec(
+                select(PlayerCharacters).where(
+                    PlayerCharacters.session_id == session_id,
+                ),
+            ).first(),
+            npcs=self._load_npcs(session, session_id),
+            objectives=list(
+                session.exec(
+                    select(Objectives).where(
+                        Objectives.session_id == session_id,
+                        Objectives.status == "active",
+                    ),
+                ).all(),
+            ),
+            items=list(
+                session.exec(
+                    select(Items).where(Items.session_id == session_id),
+                ).all(),
+            ),
+            backgrounds=self._load_backgrounds(
+                session,
+                sess.scenario_id,
+                session_id,
+            ),
+            recent_turns=list(
+                session.exec(
+                    select(Turns)
+                    .where(Turns.session_id == session_id)
+                    .order_by(col(Turns.turn_number).desc())
+                    .limit(turn_limit),
+                ).all(),
+            ),
+        )
+
+    @staticmethod
+    def _load_session_and_scenario(
+        session: Session,
+        session_id: uuid.UUID,
+        game_session: Sessions | None,
+    ) -> tuple[Sessions, Scenarios]:
+        """Return (session, scenario) in a single query."""
+        if game_session is not None:
+            scenario = session.exec(
+                select(Scenarios).where(Scenarios.id == game_session.scenario_id),
+            ).first()
+            sess = game_session
+        else:
+            row = session.exec(
+                select(Sessions, Scenarios)
+                .outerjoin(Scenarios, col(Scenarios.id) == Sessions.scenario_id)
+                .where(Sessions.id == session_id),
+            ).first()
+            if row is None:
+                msg = f"Session {session_id} not found"
+                raise ValueError(msg)
+            sess, scenario = row
+        if scenario is None:
+            msg = f"Scenario {sess.scenario_id} not found"
+            raise ValueError(msg)
+        return sess, scenario
+
+    @staticmethod
+    def _load_npcs(
+        session: Session,
+        session_id: uuid.UUID,
+    ) -> list[tuple[Npcs, NpcRelationships | None]]:
+        """Return session NPCs outer-joined with their relationship row."""
+        statement = (
+            select(Npcs, NpcRelationships)
+            .outerjoin(
+                NpcRelationships,
+                col(NpcRelationships.npc_id) == Npcs.id,
+            )
+            .where(Npcs.session_id == session_id)
+        )
+        return [(npc, rel) for npc, rel in session.exec(statement).all()]
+
+    @staticmethod
+    def _load_backgrounds(
+        session: Session,
+        scenario_id: uuid.UUID,
+        session_id: uuid.UUID,
+    ) -> list[SceneBackgrounds]:
+        """Return scenario base assets followed by session-generated ones."""
+        statement = (
+            select(SceneBackgrounds)
+            .where(
+                or_(
+                    SceneBackgrounds.scenario_id == scenario_id,
+                    SceneBackgrounds.session_id == session_id,
+                ),
+            )
+            .order_by(col(SceneBackgrounds.scenario_id).is_(None))
+        )
+        return list(session.exec(statement).all())
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from sqlmodel import Session
 
 from domain.entity.models import Items
+from gateway.unit_of_work import commit_or_defer
 
 
 class ItemGateway:
@@ -27,8 +28,7 @@ class ItemGateway:
 
     def create(self, session: Session, item: Items) -> Items:
         session.add(item)
-        session.commit()
-        session.refresh(item)
+        commit_or_defer(session, item)
         return item
 
     def delete_by_name(
@@ -44,7 +44,7 @@ class ItemGateway:
         item = session.exec(statement).first()
         if item:
             session.delete(item)
-            session.commit()
+            commit_or_defer(session)
 
     def update_quantity(
         self,
@@ -61,7 +61,7 @@ class ItemGateway:
         if item:
             item.quantity += quantity_delta
             session.add(item)
-            session.commit()
+            commit_or_defer(session)
 
     def update_equipped(
         self,
@@ -80,4 +80,4 @@ class ItemGateway:
         if item:
             item.is_equipped = is_equipped
             session.add(item)
-            session.commit()
+            commit_or_defer(session)
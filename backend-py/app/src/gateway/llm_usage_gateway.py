@@ -0,0 +1,25 @@
+"""LLM usage accounting data access gateway."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlmodel import Session
+
+    from domain.entity.models import LlmUsage
+
+
+class LlmUsageGateway:
+    """Gateway for llm_usage write operations."""
+
+    def bulk_insert(
+        self,
+        session: Session,
+        records: Sequence[LlmUsage],
+    ) -> None:
+        """Insert aggregated usage rows in a single commit."""
+        session.add_all(records)
+        session.commit()
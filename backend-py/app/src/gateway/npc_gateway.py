@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from sqlmodel import select
 
 from domain.entity.models import NpcRelationships, Npcs
+from gateway.unit_of_work import commit_or_defer
 
 if TYPE_CHECKING:
     import uuid
@@ -44,8 +45,7 @@ class NpcGateway:
     ) -> None:
         """Persist a new NPC record."""
         session.add(npc)
-        session.commit()
-        session.refresh(npc)
+        commit_or_defer(session, npc)
 
     def create_relationship(
         self,
@@ -54,8 +54,7 @@ class NpcGateway:
     ) -> None:
         """Persist a new NPC relationship record."""
         session.add(rel)
-        session.commit()
-        session.refresh(rel)
+        commit_or_defer(session, rel)
 
     def get_by_scenario(
         self,
@@ -98,8 +97,7 @@ class NpcGateway:
             raise ValueError(msg)
         record.state = state
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     def update_location(
         self,
@@ -117,8 +115,7 @@ class NpcGateway:
         record.location_x = x
         record.location_y = y
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     def find_by_name_and_session(
         self,
@@ -147,7 +144,7 @@ class NpcGateway:
             raise ValueError(msg)
         record.image_path = image_path
         session.add(record)
-        session.commit()
+        commit_or_defer(session)
 
     def update_emotion_image(
         self,
@@ -166,7 +163,7 @@ class NpcGateway:
         images[emotion] = image_path
         record.emotion_images = images
         session.add(record)
-        session.commit()
+        commit_or_defer(session)
 
     def update_relationship(
         self,
@@ -187,5 +184,4 @@ class NpcGateway:
         record.fear = int(record.fear) + delta.fear
         record.debt = int(record.debt) + delta.debt
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
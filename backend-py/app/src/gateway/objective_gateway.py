@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from sqlmodel import select
 
 from domain.entity.models import Objectives
+from gateway.unit_of_work import commit_or_defer
 
 if TYPE_CHECKING:
     import uuid
@@ -34,8 +35,7 @@ class ObjectiveGateway:
     ) -> Objectives:
         """Create a new objective record."""
         session.add(objective)
-        session.commit()
-        session.refresh(objective)
+        commit_or_defer(session, objective)
         return objective
 
     def update_status(
@@ -56,5 +56,4 @@ class ObjectiveGateway:
             raise ValueError(msg)
         record.status = status
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from sqlmodel import select
 
 from domain.entity.models import PlayerCharacters
+from gateway.unit_of_work import commit_or_defer
 
 if TYPE_CHECKING:
     import uuid
@@ -36,8 +37,7 @@ class PlayerCharacterGateway:
         record = self._get_by_id(session, pc_id)
         record.stats = stats
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     def update_location(
         self,
@@ -51,8 +51,7 @@ class PlayerCharacterGateway:
         record.location_x = x
         record.location_y = y
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     def update_status_effects(
         self,
@@ -64,8 +63,7 @@ class PlayerCharacterGateway:
         record = self._get_by_id(session, pc_id)
         record.status_effects = status_effects
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     @staticmethod
     def _get_by_id(
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from sqlmodel import select
 
 from domain.entity.models import Sessions
+from gateway.unit_of_work import commit_or_defer
 
 if TYPE_CHECKING:
     import uuid
@@ -24,6 +25,18 @@ class SessionGateway:
         statement = select(Sessions).where(Sessions.id == session_id)
         return session.exec(statement).first()
 
+    def get_current_turn_number(
+        self,
+        session: Session,
+        session_id: uuid.UUID,
+    ) -> int | None:
+        """Get only the current turn number of a session."""
+        statement = select(Sessions.current_turn_number).where(
+            Sessions.id == session_id,
+        )
+        value = session.exec(statement).first()
+        return None if value is None else int(value)
+
     def update_state(
         self,
         session: Session,
@@ -37,8 +50,7 @@ class SessionGateway:
             raise ValueError(msg)
         record.current_state = state
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
 
     def increment_turn(
         self,
@@ -52,8 +64,7 @@ class SessionGateway:
             raise ValueError(msg)
         record.current_turn_number += 1
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
         return int(record.current_turn_number)
 
     def update_status(
@@ -73,5 +84,4 @@ class SessionGateway:
         record.ending_type = ending_type
         record.ending_summary = ending_summary
         session.add(record)
-        session.commit()
-        session.refresh(record)
+        commit_or_defer(session, record)
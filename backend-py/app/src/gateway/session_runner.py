@@ -0,0 +1,48 @@
+"""Run synchronous gateway calls on either a Session or an AsyncSession.
+
+Gateways are written against the synchronous SQLModel ``Session``.  When the
+caller holds an ``AsyncSession`` the call is dispatched through
+``AsyncSession.run_sync`` so the statements go through the async driver and
+the event loop is never blocked while Postgres answers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeIs
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlmodel import Session
+
+_LOCK_KEY = "session_runner.lock"
+
+
+def is_async_session(db: object) -> TypeIs[AsyncSession]:
+    """Return whether ``db`` is an AsyncSession."""
+    return isinstance(db, AsyncSession)
+
+
+async def run_in_session[T](
+    db: Session | AsyncSession,
+    fn: Callable[[Session], T],
+) -> T:
+    """Call ``fn`` with a synchronous Session bound to ``db``.
+
+    A plain Session is passed straight through.  For an AsyncSession the
+    call runs via ``run_sync``; calls on the same AsyncSession are serialised
+    because one session cannot run two statements at once, while the turn
+    pipeline resolves assets concurrently with asyncio.gather.
+    """
+    if not isinstance(db, AsyncSession):
+        return fn(db)
+    lock = db.info.get(_LOCK_KEY)
+    if lock is None:
+        lock = asyncio.Lock()
+        db.info[_LOCK_KEY] = lock
+    async with lock:
+        # sync_session_class of sqlmodel's AsyncSession is sqlmodel.Session.
+        return await db.run_sync(fn)  # type: ignore[arg-type]
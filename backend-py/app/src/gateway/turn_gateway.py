@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlmodel import select
+from sqlalchemy import cast, insert, literal, update
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import col, select
 
-from domain.entity.models import Turns
+from domain.entity.models import Sessions, Turns
+from gateway.unit_of_work import commit_or_defer
 
 if TYPE_CHECKING:
     import uuid
@@ -18,10 +21,82 @@ class TurnGateway:
     def create(self, session: Session, turn: Turns) -> Turns:
         """Create a new turn record."""
         session.add(turn)
-        session.commit()
-        session.refresh(turn)
+        commit_or_defer(session, turn)
         return turn
 
+    def create_next(self, session: Session, turn: Turns) -> int:
+        """Allocate the next turn number and insert ``turn`` in one statement.
+
+        ``sessions.current_turn_number`` is incremented with
+        ``UPDATE ... RETURNING`` inside a CTE that feeds the turn insert, so
+        the counter and the row are written in a single round trip.  The row
+        lock taken by the UPDATE serialises concurrent allocations for the
+        same session.  ``turn.turn_number`` is overwritten with the
+        allocated value, which is also returned.
+
+        Raises:
+            ValueError: If the session does not exist.
+        """
+        allocated = (
+            update(Sessions)
+            .where(col(Sessions.id) == turn.session_id)
+            .values(current_turn_number=col(Sessions.current_turn_number) + 1)
+            .returning(col(Sessions.current_turn_number))
+            .cte("allocated")
+        )
+        table = Turns.__table__
+        columns = [
+            "id",
+            "session_id",
+            "turn_number",
+            "input_type",
+            "input_text",
+            "gm_decision_type",
+            "output",
+            "created_at",
+        ]
+        values = [
+            cast(literal(getattr(turn, name), table.c[name].type), table.c[name].type)
+            if name != "turn_number"
+            else allocated.c.current_turn_number
+            for name in columns
+        ]
+        statement = (
+            insert(table)
+            .from_select(columns, select(*values))
+            .returning(table.c.turn_number)
+        )
+        new_turn_number = session.execute(statement).scalar_one_or_none()
+        if new_turn_number is None:
+            msg = f"Session {turn.session_id} not found"
+            raise ValueError(msg)
+        turn_number = int(new_turn_number)
+        turn.turn_number = turn_number
+        self._sync_session_counter(session, turn.session_id, turn_number)
+        commit_or_defer(session)
+        return turn_number
+
+    @staticmethod
+    def _sync_session_counter(
+        session: Session,
+        session_id: uuid.UUID,
+        turn_number: int,
+    ) -> None:
+        """Reflect the allocated number on a loaded Sessions row, if any.
+
+        The Core UPDATE bypasses the ORM, so an instance already in the
+        identity map would otherwise keep the old counter.
+        """
+        record = session.identity_map.get(
+            session.identity_key(Sessions, session_id),
+        )
+        if record is not None:
+            set_committed_value(  # type: ignore[no-untyped-call]
+                record,
+                "current_turn_number",
+                turn_number,
+            )
+
     def get_recent(
         self,
         session: Session,
@@ -37,6 +112,24 @@ class TurnGateway:
         )
         return list(session.exec(statement).all())
 
+    def get_after(
+        self,
+        session: Session,
+        session_id: uuid.UUID,
+        *,
+        after_turn: int,
+        limit: int,
+    ) -> list[Turns]:
+        """Get up to ``limit`` turns after ``after_turn``, oldest first."""
+        statement = (
+            select(Turns)
+            .where(Turns.session_id == session_id)
+            .where(Turns.turn_number > after_turn)
+            .order_by(Turns.turn_number.asc())
+            .limit(limit)
+        )
+        return list(session.exec(statement).all())
+
     def get_latest(self, session: Session, session_id: uuid.UUID) -> Turns | None:
         """Get the most recent turn for a session."""
         statement = (
@@ -0,0 +1,53 @@
+"""Group gateway writes into a single transaction.
+
+Gateway write methods normally commit (and refresh) on their own.  Inside
+``unit_of_work`` those per-call commits are deferred: statements are still
+flushed as SQLAlchemy needs them for subsequent reads, but the transaction
+is committed once when the block exits, or rolled back as a whole on error.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlmodel import Session
+
+_UOW_KEY = "unit_of_work.active"
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """Return whether ``session`` is inside an open unit of work."""
+    return session.info.get(_UOW_KEY) is True
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """Commit every gateway write in the block as one transaction.
+
+    Nested use joins the outer unit of work.
+    """
+    if in_unit_of_work(session):
+        yield session
+        return
+    session.info[_UOW_KEY] = True
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_UOW_KEY, None)
+
+
+def commit_or_defer(session: Session, *records: object) -> None:
+    """Commit and refresh ``records`` unless a unit of work is open."""
+    if in_unit_of_work(session):
+        return
+    session.commit()
+    for record in records:
+        session.refresh(record)
@@ -0,0 +1,144 @@
+"""Periodic garbage collection of orphaned ADK sessions.
+
+Shared (auto-advance) ADK sessions are deleted by
+``GmDecisionService.cleanup_runtime`` when the request ends, but a crash,
+a cancelled request or a failed delete leaves their rows in the ``adk``
+schema, as did every single-shot turn before those moved to in-memory
+sessions.  The collector deletes sessions of one app that have not been
+updated for ``max_age_seconds``, which is far longer than any request, so
+live sessions are never touched.
+
+Each run is one bounded ``DELETE`` on the ``sessions`` table (of the ``adk``
+schema, via the service's search_path) that removes at most
+``max_deletions`` of the oldest stale rows; events go with them through the
+table's ``ON DELETE CASCADE``.  Nothing is loaded into the process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, column, delete, select, table, tuple_
+
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from google.adk.sessions import DatabaseSessionService
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_AGE_SECONDS = 3600.0
+DEFAULT_INTERVAL_SECONDS = 900.0
+DEFAULT_MAX_DELETIONS = 500
+
+# The columns of ADK's sessions table the collector filters on; identical in
+# every ADK schema version.
+_SESSIONS = table(
+    "sessions",
+    column("app_name"),
+    column("user_id"),
+    column("id"),
+    column("update_time", DateTime),
+)
+
+
+class AdkSessionCollector:
+    """Delete stale sessions of one ADK app, once or on a fixed interval."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session_service: DatabaseSessionService,
+        app_name: str,
+        *,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        max_deletions: int = DEFAULT_MAX_DELETIONS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._session_service = session_service
+        self._app_name = app_name
+        self._max_age_seconds = max_age_seconds
+        self._interval_seconds = interval_seconds
+        self._max_deletions = max_deletions
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+
+    async def collect(self) -> int:
+        """Delete up to ``max_deletions`` stale sessions; return how many."""
+        cutoff = _naive_cutoff(self._clock() - self._max_age_seconds)
+        stale = (
+            select(_SESSIONS.c.app_name, _SESSIONS.c.user_id, _SESSIONS.c.id)
+            .where(
+                _SESSIONS.c.app_name == self._app_name,
+                _SESSIONS.c.update_time < cutoff,
+            )
+            .order_by(_SESSIONS.c.update_time)
+            .limit(self._max_deletions)
+        )
+        stmt = delete(_SESSIONS).where(
+            tuple_(_SESSIONS.c.app_name, _SESSIONS.c.user_id, _SESSIONS.c.id).in_(
+                stale,
+            ),
+        )
+        # ADK 1.26 creates its tables lazily in the private _prepare_tables;
+        # later releases expose prepare_tables.
+        prepare = getattr(self._session_service, "prepare_tables", None) or getattr(
+            self._session_service,
+            "_prepare_tables",
+            None,
+        )
+        if prepare is not None:
+            await prepare()
+        async with self._session_service.db_engine.begin() as conn:
+            result = await conn.execute(stmt)
+        deleted: int = result.rowcount
+        if deleted:
+            logger.info(
+                "ADK sessions collected",
+                deleted=deleted,
+                capped=deleted >= self._max_deletions,
+            )
+        return deleted
+
+    def start(self) -> None:
+        """Start collecting in the background; a no-op if already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Stop the background loop."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.collect()
+            except Exception as exc:
+                logger.warning(
+                    "ADK session GC failed",
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+            await asyncio.sleep(self._interval_seconds)
+
+
+def _naive_cutoff(timestamp: float) -> datetime:
+    """Return the naive update_time below which a session is surely stale.
+
+    ADK stores update_time without a zone but not consistently: on Postgres
+    ADK 1.26 writes new sessions in UTC and appended events in the host's
+    local time.  The earlier of the two readings of ``timestamp`` keeps a
+    session that is still in use from looking stale on any host offset.
+    """
+    utc = datetime.fromtimestamp(timestamp, UTC).replace(tzinfo=None)
+    local = datetime.fromtimestamp(timestamp)  # noqa: DTZ006
+    return min(utc, local)
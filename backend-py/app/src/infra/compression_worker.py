@@ -0,0 +1,108 @@
+"""Background worker that runs context compression off the turn path.
+
+Compression is requested after every GM decision but only does work every
+few turns, and when it does it costs a full structured Gemini call.  The
+worker runs it in background tasks instead, so the decision is returned
+(and streamed) immediately.
+
+Requests are coalesced per game session: at most one compression is in
+flight and at most one is pending behind it, so a burst of turns triggers
+one follow-up run rather than a queue.  A semaphore bounds how many
+sessions compress at once, and ``drain`` lets in-flight work finish at
+shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Awaitable, Callable
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 10.0
+
+
+class CompressionWorker:
+    """Per-session coalescing runner for a compression coroutine."""
+
+    def __init__(
+        self,
+        compress: Callable[[uuid.UUID], Awaitable[None]],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._compress = compress
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._running: dict[uuid.UUID, asyncio.Task[None]] = {}
+        self._pending: set[uuid.UUID] = set()
+        self._closed = False
+
+    def __len__(self) -> int:
+        """Return the number of sessions with compression in flight."""
+        return len(self._running)
+
+    def schedule(self, session_id: uuid.UUID) -> None:
+        """Request a compression run for ``session_id`` without waiting."""
+        if self._closed:
+            return
+        if session_id in self._running:
+            self._pending.add(session_id)
+            return
+        self._running[session_id] = asyncio.create_task(self._run(session_id))
+
+    async def wait_idle(self, session_id: uuid.UUID) -> None:
+        """Wait until no compression is running or pending for a session."""
+        task = self._running.get(session_id)
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.shield(task)
+
+    async def drain(
+        self,
+        timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS,  # noqa: ASYNC109
+    ) -> None:
+        """Stop accepting work and let in-flight runs finish.
+
+        Runs still going after ``timeout`` seconds are cancelled; their
+        turns are picked up by the next compression of that session.
+        """
+        self._closed = True
+        self._pending.clear()
+        tasks = list(self._running.values())
+        if not tasks:
+            return
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            logger.warning(
+                "Compression cancelled at shutdown",
+                sessions=len(still_running),
+            )
+            await asyncio.gather(*still_running, return_exceptions=True)
+
+    async def _run(self, session_id: uuid.UUID) -> None:
+        try:
+            while True:
+                async with self._semaphore:
+                    try:
+                        await self._compress(session_id)
+                    except Exception as exc:
+                        logger.warning(
+                            "Background compression failed",
+                            session_id=str(session_id),
+                            error=f"{type(exc).__name__}: {exc}",
+                        )
+                if session_id not in self._pending:
+                    break
+                self._pending.discard(session_id)
+        finally:
+            self._running.pop(session_id, None)
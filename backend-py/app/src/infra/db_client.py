@@ -1,13 +1,18 @@
 """このモジュールは、SQLModelを使用したデータベース接続とセッション管理を提供します.
 
 FastAPIの依存性注入システムと統合し、リクエストごとに安全なデータベースセッションを提供します。
-SQLModelの公式パターンに従った同期処理の実装です。
+同期エンジン (psycopg2) に加え、SSE ストリーミングなどイベントループ上で長時間動作する
+処理向けに asyncpg ベースの非同期エンジンと AsyncSession も提供します。
 """
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from util.database_url import to_asyncpg_url
 
 # 環境変数からデータベースURLを取得
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -34,6 +39,16 @@ engine = create_engine(
     pool_pre_ping=True,  # 接続の健全性チェック
 )
 
+# 非同期エンジン (asyncpg)。create_async_engine は lazy のため
+# 実際の接続は最初のクエリ実行時まで発生しない。
+_ASYNC_DATABASE_URL, _ASYNC_CONNECT_ARGS = to_asyncpg_url(DATABASE_URL)
+async_engine = create_async_engine(
+    _ASYNC_DATABASE_URL,
+    echo=_is_sql_echo_enabled(),
+    pool_pre_ping=True,
+    connect_args=_ASYNC_CONNECT_ARGS,
+)
+
 
 def get_session() -> Generator[Session]:
     """FastAPI依存性注入用のセッション取得関数.
@@ -53,3 +68,19 @@ def get_session() -> Generator[Session]:
     """
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession]:
+    """FastAPI依存性注入用の非同期セッション取得関数.
+
+    SSE ストリーミングのようにイベントループ上で DB アクセスを行うエンドポイント向け。
+    ゲートウェイ呼び出しは gateway.session_runner.run_in_session 経由で行う。
+
+    expire_on_commit=False とするのは、commit 後に ORM 属性へアクセスした際の
+    暗黙の lazy load (greenlet 外での I/O) を防ぐため。
+
+    Yields:
+        AsyncSession: 非同期データベースセッション
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -1,4 +1,13 @@
-"""fal.ai ACE-Step client for non-realtime music generation."""
+"""fal.ai ACE-Step client for non-realtime music generation.
+
+``FAL_BASE_URL`` を設定すると fal_client のキュー API ではなく
+``{FAL_BASE_URL}/{application}`` の同期実行エンドポイントを直接呼び出す。
+fal_client はホストを https 固定で組み立てるため、ローカルのスタブサーバー
+(benchmarks/fake_upstream.py) へ向ける場合に使用する。
+
+生成リクエストは infra.llm_admission の MUSIC クラスの枠内で送信する
+(結果のダウンロードは枠の外)。
+"""
 
 from __future__ import annotations
 
@@ -12,6 +21,7 @@ from typing import Any, ClassVar
 import fal_client
 import httpx
 
+from infra.llm_admission import AdmissionClass, llm_admission
 from util.logging import get_logger
 
 logger = get_logger(__name__)
@@ -68,6 +78,8 @@ class FalAceStepClient:
             msg = "FAL_KEY or FAL_API_KEY environment variable is not set"
             raise ValueError(msg)
         self._application = application
+        self._key = key
+        self._base_url = (os.getenv("FAL_BASE_URL") or "").rstrip("/") or None
         self._client = client or fal_client.SyncClient(
             key=key,
             default_timeout=timeout_seconds,
@@ -124,25 +136,32 @@ class FalAceStepClient:
             arguments_with_duration["duration"] = duration_seconds
 
         try:
-            return await asyncio.to_thread(
-                partial(
-                    self._client.subscribe,
-                    self._application,
-                    arguments_with_duration,
-                ),
-            )
+            return await self._run(arguments_with_duration)
         except Exception as exc:
             logger.warning(
                 "ACE-Step request with duration failed; retrying without duration",
                 error=str(exc),
             )
+            return await self._run({"prompt": prompt})
+
+    async def _run(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        async with llm_admission.admit(AdmissionClass.MUSIC):
+            return await self._send(arguments)
+
+    async def _send(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        if self._base_url is None:
             return await asyncio.to_thread(
-                partial(
-                    self._client.subscribe,
-                    self._application,
-                    {"prompt": prompt},
-                ),
+                partial(self._client.subscribe, self._application, arguments),
+            )
+        async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
+            response = await client.post(
+                f"{self._base_url}/{self._application}",
+                json=arguments,
+                headers={"Authorization": f"Key {self._key}"},
             )
+            response.raise_for_status()
+            result: dict[str, Any] = response.json()
+            return result
 
     async def _download_audio(self, audio_url: str) -> tuple[bytes, str]:
         async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
@@ -10,10 +10,16 @@ user_id = ゲームセッション UUID (str) でメモリをスコープする
   short_term_summary / confirmed_facts のセクションは含めない。
 - add_session_to_memory(): セッション終了時に強制圧縮を実行。
   Runner は自動呼び出しをしないため AdkGmClient.cleanup_session() から呼ぶ。
-- trigger_compression_if_due(): 毎ターン後に呼び出し、閾値到達時のみ圧縮。
-  BaseMemoryService 標準メソッドにはない ADK 拡張メソッド。
+- schedule_compression_if_due(): 毎ターン後に呼び出し、閾値到達時のみ圧縮。
+  BaseMemoryService 標準メソッドにはない ADK 拡張メソッド。圧縮は
+  CompressionWorker のバックグラウンドタスクで実行し、ターンの応答を待たせない。
 - add_events_to_memory() は利用しない。イベントデルタではなく DB 集計で
   圧縮タイミングを判断するため、基底クラスの NotImplementedError をそのまま使う。
+- search_memory() の整形済みテキストはセッション単位でキャッシュする
+  (LRU + TTL)。context_summary を書き換えるのは _run_compression() のみなので、
+  upsert 時にキャッシュも書き換える (write-through)。他ワーカーでの圧縮は
+  TTL 経過後に反映される。
+- 圧縮のモデルと thinking_level は ModelRouter の compression ルートで選ぶ。
 
 将来 VertexAiMemoryBankService への差し替えは Runner(memory_service=...) の
 1行変更で対応可能。
@@ -22,7 +28,9 @@ user_id = ゲームセッション UUID (str) でメモリをスコープする
 from __future__ import annotations
 
 import json
+import time
 import uuid
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from google.adk.memory import BaseMemoryService
@@ -39,16 +47,26 @@ from domain.entity.gm_prompts import (
 from domain.service.context_service import extract_nodes_text
 from gateway.context_summary_gateway import ContextSummaryData, ContextSummaryGateway
 from gateway.turn_gateway import TurnGateway
+from infra.compression_worker import CompressionWorker
 from infra.db_client import engine
+from infra.llm_retry import classify_error
+from infra.model_router import ModelRouter, shared_model_router
+from infra.usage_accounting import UsagePurpose, usage_purpose
 from util.logging import get_logger
+from util.schema_registry import precompute
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from domain.entity.models import ContextSummaries, Turns
     from infra.gemini_client import GeminiClient
 
 logger = get_logger(__name__)
 
 COMPRESSION_INTERVAL = 5
+COMPRESSION_CHUNK_TURNS = 10
+MEMORY_CACHE_MAX_ENTRIES = 256
+MEMORY_CACHE_TTL_SECONDS = 300.0
 
 
 class _CompressionResult(BaseModel):
@@ -59,6 +77,44 @@ class _CompressionResult(BaseModel):
     confirmed_facts: dict[str, object]
 
 
+precompute(_CompressionResult)
+
+
+class _MemoryTextCache:
+    """ゲームセッションごとの整形済みメモリテキスト (LRU + TTL)."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float],
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[uuid.UUID, tuple[str, float]] = OrderedDict()
+
+    def get(self, session_id: uuid.UUID) -> str | None:
+        """キャッシュ済みテキストを返す。未登録・期限切れは None."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        text, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        return text
+
+    def put(self, session_id: uuid.UUID, text: str) -> None:
+        """テキストを登録し、上限を超えた古いエントリを追い出す."""
+        self._entries[session_id] = (text, self._clock() + self._ttl_seconds)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
 class GameMemoryService(BaseMemoryService):
     """PostgreSQL-backed MemoryService using context_summary table.
 
@@ -77,10 +133,27 @@ class GameMemoryService(BaseMemoryService):
     confirmed_facts を含めないことで二重注入を防ぐ。
     """
 
-    def __init__(self, gemini: GeminiClient) -> None:
+    def __init__(
+        self,
+        gemini: GeminiClient,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        router: ModelRouter | None = None,
+    ) -> None:
         self._gemini = gemini
+        self._router = router if router is not None else shared_model_router
         self._context_gw = ContextSummaryGateway()
         self._turn_gw = TurnGateway()
+        self._memory_cache = _MemoryTextCache(
+            max_entries=MEMORY_CACHE_MAX_ENTRIES,
+            ttl_seconds=MEMORY_CACHE_TTL_SECONDS,
+            clock=clock,
+        )
+        self._worker = CompressionWorker(self._compress_if_due)
+
+    async def aclose(self) -> None:
+        """実行中の圧縮を待ってから停止する (シャットダウン時)."""
+        await self._worker.drain()
 
     async def add_session_to_memory(self, session: object) -> None:
         """Force compression when a session ends.
@@ -96,6 +169,8 @@ class GameMemoryService(BaseMemoryService):
         except ValueError:
             logger.warning("Invalid user_id for memory", user_id=user_id)
             return
+        # バックグラウンド圧縮と同じターンを二重に圧縮しないよう完了を待つ。
+        await self._worker.wait_idle(session_uuid)
         await self._fetch_and_run_compression(session_uuid)
 
     async def search_memory(
@@ -108,20 +183,21 @@ class GameMemoryService(BaseMemoryService):
         """Return context_summary as MemoryEntry for PreloadMemoryTool injection.
 
         query は無視する。ゲームセッションの文脈は常に全体を返すため
-        セマンティック検索は不要。
+        セマンティック検索は不要。整形済みテキストはキャッシュから返し、
+        未キャッシュのときのみ DB を参照する。
         """
         try:
             session_uuid = uuid.UUID(user_id)
         except ValueError:
             return SearchMemoryResponse()
 
-        with SQLModelSession(engine) as db:
-            ctx = self._context_gw.get_by_session(db, session_uuid)
-
-        if ctx is None:
-            return SearchMemoryResponse()
+        memory_text = self._memory_cache.get(session_uuid)
+        if memory_text is None:
+            with SQLModelSession(engine) as db:
+                ctx = self._context_gw.get_by_session(db, session_uuid)
+            memory_text = _format_context_summary(ctx) if ctx is not None else ""
+            self._memory_cache.put(session_uuid, memory_text)
 
-        memory_text = _format_context_summary(ctx)
         if not memory_text:
             return SearchMemoryResponse()
         return SearchMemoryResponse(
@@ -135,83 +211,100 @@ class GameMemoryService(BaseMemoryService):
             ]
         )
 
-    async def trigger_compression_if_due(self, game_session_id: str) -> None:
-        """Compress context if the compression interval has been reached.
+    def schedule_compression_if_due(self, game_session_id: str) -> None:
+        """Queue a background compression check for a session.
 
-        毎ターン後に AdkGmClient.decide() から呼び出す。
-        閾値未満の場合はノーオペレーション。
+        毎ターン後に AdkGmClient.decide() から呼び出す。待機はしない。
+        閾値判定はワーカー側で行い、閾値未満の場合はノーオペレーション。
+        同一セッションへの連続要求は実行中 1 件 + 保留 1 件にまとめられる。
         """
         try:
             session_uuid = uuid.UUID(game_session_id)
         except ValueError:
             logger.warning("Invalid game_session_id", game_session_id=game_session_id)
             return
-        await self._compress_if_due(session_uuid)
+        self._worker.schedule(session_uuid)
 
     async def _compress_if_due(self, game_session_id: uuid.UUID) -> None:
-        """Skip compression if the interval threshold has not been reached.
+        """Compress once COMPRESSION_INTERVAL turns have accumulated.
 
-        DB を1回だけフェッチしてインターバル判定と圧縮データの両方に使用する。
+        前回圧縮 (last_updated_turn) より後のターンだけを取得し、その件数で
+        インターバル判定する。
         """
-        with SQLModelSession(engine) as db:
-            ctx = self._context_gw.get_by_session(db, game_session_id)
-            last_updated = int(ctx.last_updated_turn) if ctx else 0
-            turns = self._turn_gw.get_recent(db, game_session_id, limit=10)
-            current_turn = int(turns[0].turn_number) if turns else 0
-
-        if (current_turn - last_updated) < COMPRESSION_INTERVAL:
-            return
-
-        await self._run_compression(
+        await self._compress_new_turns(
             game_session_id,
-            ctx_rec=ctx,
-            turns=turns,
-            current_turn=current_turn,
+            min_turns=COMPRESSION_INTERVAL,
         )
 
     async def _fetch_and_run_compression(self, game_session_id: uuid.UUID) -> None:
-        """Fetch DB data once and run compression if there are new turns.
+        """Compress every turn not yet compressed.
 
         add_session_to_memory() からセッション終了時に呼び出す。
-        ターンが0件の場合、または前回圧縮以降に新しいターンがない場合はスキップする。
+        前回圧縮以降に新しいターンがない場合はスキップする。
         """
-        with SQLModelSession(engine) as db:
-            ctx = self._context_gw.get_by_session(db, game_session_id)
-            turns = self._turn_gw.get_recent(db, game_session_id, limit=10)
-            current_turn = int(turns[0].turn_number) if turns else 0
+        await self._compress_new_turns(game_session_id, min_turns=1)
 
-        if not turns:
-            return
+    async def _compress_new_turns(
+        self,
+        game_session_id: uuid.UUID,
+        *,
+        min_turns: int,
+    ) -> None:
+        """Compress turns after last_updated_turn in bounded chunks.
 
-        last_updated = int(ctx.last_updated_turn) if ctx else 0
-        if current_turn <= last_updated:
+        各チャンクの結果を次のチャンクの「前回の要約」として渡し、チャンクごとに
+        永続化する。圧縮が遅れて未圧縮ターンが溜まっても取りこぼさない。
+        """
+        with SQLModelSession(engine) as db:
+            previous: ContextSummaries | ContextSummaryData | None = (
+                self._context_gw.get_by_session(db, game_session_id)
+            )
+            last_updated = int(previous.last_updated_turn) if previous else 0
+            turns = self._turn_gw.get_after(
+                db,
+                game_session_id,
+                after_turn=last_updated,
+                limit=COMPRESSION_CHUNK_TURNS,
+            )
+        if len(turns) < min_turns:
             return
 
-        await self._run_compression(
-            game_session_id,
-            ctx_rec=ctx,
-            turns=turns,
-            current_turn=current_turn,
-        )
+        while turns:
+            previous = await self._run_compression(
+                game_session_id,
+                previous=previous,
+                turns=turns,
+            )
+            if previous is None or len(turns) < COMPRESSION_CHUNK_TURNS:
+                return
+            with SQLModelSession(engine) as db:
+                turns = self._turn_gw.get_after(
+                    db,
+                    game_session_id,
+                    after_turn=previous.last_updated_turn,
+                    limit=COMPRESSION_CHUNK_TURNS,
+                )
 
     async def _run_compression(
         self,
         game_session_id: uuid.UUID,
         *,
-        ctx_rec: ContextSummaries | None,
+        previous: ContextSummaries | ContextSummaryData | None,
         turns: list[Turns],
-        current_turn: int,
-    ) -> None:
-        """Run Gemini compression and persist results to context_summary.
+    ) -> ContextSummaryData | None:
+        """Compress ``turns`` (oldest first) on top of ``previous``.
 
         フェッチ済みデータを受け取るため DB への再アクセスは発生しない。
+        plot_essentials / confirmed_facts は前回の値にマージし、
+        short_term_summary は置き換える。失敗時は None を返す。
         """
-        prev_plot = json.dumps(ctx_rec.plot_essentials if ctx_rec else {})
-        prev_facts = json.dumps(ctx_rec.confirmed_facts if ctx_rec else {})
-        prev_summary = ctx_rec.short_term_summary if ctx_rec else ""
+        current_turn = int(turns[-1].turn_number)
+        prev_plot = dict(previous.plot_essentials) if previous else {}
+        prev_facts = dict(previous.confirmed_facts) if previous else {}
+        prev_summary = previous.short_term_summary if previous else ""
 
         parts: list[str] = []
-        for t in reversed(turns):
+        for t in turns:
             narr = t.output.get("narration_text", "")
             nodes = extract_nodes_text(t.output)
             detail = nodes if nodes else str(narr)
@@ -222,44 +315,57 @@ class GameMemoryService(BaseMemoryService):
         turns_text = "\n".join(parts)
 
         prompt = COMPRESSION_CONTEXT_TEMPLATE.format(
-            previous_plot_essentials=prev_plot,
-            previous_confirmed_facts=prev_facts,
+            previous_plot_essentials=json.dumps(prev_plot),
+            previous_confirmed_facts=json.dumps(prev_facts),
             previous_short_term_summary=prev_summary,
             turns_to_compress=turns_text,
         )
 
+        route = self._router.route(UsagePurpose.COMPRESSION)
+        started = time.perf_counter()
         try:
-            result = await self._gemini.generate_structured(
-                contents=prompt,
-                system_instruction=COMPRESSION_SYSTEM_PROMPT,
-                response_type=_CompressionResult,
-                temperature=0.3,
-            )
-        except Exception:
-            logger.exception(
+            with usage_purpose(UsagePurpose.COMPRESSION):
+                result = await self._gemini.generate_structured(
+                    contents=prompt,
+                    system_instruction=COMPRESSION_SYSTEM_PROMPT,
+                    response_type=_CompressionResult,
+                    model=route.model,
+                    temperature=0.3,
+                    thinking_level=route.thinking_level,
+                )
+        except Exception as exc:
+            # 各試行の失敗は llm_retry が記録済みのため、ここでは要約のみ残す。
+            logger.warning(
                 "Context compression failed",
                 session_id=str(game_session_id),
                 turn=current_turn,
+                error_kind=str(classify_error(exc)),
+                error=f"{type(exc).__name__}: {exc}",
             )
-            return
+            return None
+        self._router.observe(
+            UsagePurpose.COMPRESSION,
+            route,
+            time.perf_counter() - started,
+        )
 
+        summary = ContextSummaryData(
+            plot_essentials={**prev_plot, **result.plot_essentials},
+            short_term_summary=result.short_term_summary,
+            confirmed_facts={**prev_facts, **result.confirmed_facts},
+            last_updated_turn=current_turn,
+        )
         with SQLModelSession(engine) as db:
-            self._context_gw.upsert(
-                db,
-                game_session_id,
-                ContextSummaryData(
-                    plot_essentials=result.plot_essentials,
-                    short_term_summary=result.short_term_summary,
-                    confirmed_facts=result.confirmed_facts,
-                    last_updated_turn=current_turn,
-                ),
-            )
+            self._context_gw.upsert(db, game_session_id, summary)
+        self._memory_cache.put(game_session_id, _format_context_summary(summary))
 
         logger.info(
             "Context compressed",
             session_id=str(game_session_id),
             turn=current_turn,
+            turns_compressed=len(turns),
         )
+        return summary
 
 
 def _format_context_summary(ctx: object) -> str:
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import base64
 import os
+import time
 from dataclasses import dataclass
 
 from google import genai
@@ -15,7 +16,15 @@ from google.genai import types
 from openai import AsyncOpenAI
 from pydantic import BaseModel
 
+from infra.llm_admission import AdmissionClass, llm_admission
+from infra.llm_retry import (
+    DEFAULT_RETRY_POLICY,
+    InvalidOutputError,
+    call_with_retry,
+)
+from infra.usage_accounting import UsagePurpose, record_usage
 from util.logging import get_logger
+from util.schema_registry import structured_schema
 
 logger = get_logger(__name__)
 
@@ -39,9 +48,31 @@ class GeminiStructuredResult[T: BaseModel]:
     usage: GeminiUsageMetadata | None = None
 
 
+def _record_usage(
+    model: str,
+    started: float,
+    usage: GeminiUsageMetadata | None,
+    *,
+    purpose: UsagePurpose | None = None,
+) -> None:
+    """Account a finished call in the current usage scope."""
+    usage = usage or GeminiUsageMetadata()
+    record_usage(
+        model=model,
+        started=started,
+        prompt_tokens=usage.prompt_tokens,
+        cached_tokens=usage.cached_tokens,
+        output_tokens=usage.output_tokens,
+        total_tokens=usage.total_tokens,
+        purpose=purpose,
+    )
+
+
 class GeminiClient:
     """Gemini(構造化出力) + OpenAI(画像生成)クライアント."""
 
+    RETRY_POLICY = DEFAULT_RETRY_POLICY
+
     def __init__(self) -> None:
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
@@ -60,13 +91,23 @@ class GeminiClient:
             self._openai_client = AsyncOpenAI(api_key=api_key)
         return self._openai_client
 
-    async def generate_structured[T: BaseModel](
+    async def aclose(self) -> None:
+        """保持しているHTTPコネクションプールを解放する."""
+        await self._client.aio.aclose()
+        self._client.close()
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+
+    async def generate_structured[T: BaseModel](  # noqa: PLR0913
         self,
         contents: str,
         system_instruction: str,
         response_type: type[T],
         model: str = "gemini-3.1-flash-lite-preview",
         temperature: float = 0.8,
+        *,
+        thinking_level: types.ThinkingLevel | None = types.ThinkingLevel.MINIMAL,
     ) -> T:
         """構造化出力でPydanticモデルを返す."""
         result = await self.generate_structured_with_meta(
@@ -75,6 +116,7 @@ class GeminiClient:
             response_type=response_type,
             model=model,
             temperature=temperature,
+            thinking_level=thinking_level,
         )
         return result.value
 
@@ -90,26 +132,52 @@ class GeminiClient:
         use_interactions: bool = False,
         cached_content_name: str | None = None,
         store_interaction: bool = True,
+        thinking_level: types.ThinkingLevel | None = types.ThinkingLevel.MINIMAL,
     ) -> GeminiStructuredResult[T]:
-        """Structured response with usage/interaction metadata."""
-        if use_interactions:
-            return await self._generate_structured_with_interactions(
-                contents=contents,
-                system_instruction=system_instruction,
-                response_type=response_type,
-                model=model,
-                temperature=temperature,
-                previous_interaction_id=previous_interaction_id,
-                store_interaction=store_interaction,
-            )
-        return await self._generate_structured_with_generate_content(
-            contents=contents,
-            system_instruction=system_instruction,
-            response_type=response_type,
+        """Structured response with usage/interaction metadata.
+
+        thinking_level は generate_content 経路にのみ適用し、None の場合は
+        モデル既定の思考設定を使う。
+
+        失敗は infra.llm_retry で分類し、モデル単位のサーキットブレーカー
+        配下でリトライする。各試行は現在の用途のクラスで infra.llm_admission
+        の枠を取得してから送信し、成功した試行のトークン数とレイテンシは
+        infra.usage_accounting に計上する。
+        """
+
+        async def attempt(_: int) -> GeminiStructuredResult[T]:
+            async with llm_admission.admit(AdmissionClass.current()):
+                started = time.perf_counter()
+                if use_interactions:
+                    result = await self._generate_structured_with_interactions(
+                        contents=contents,
+                        system_instruction=system_instruction,
+                        response_type=response_type,
+                        model=model,
+                        temperature=temperature,
+                        previous_interaction_id=previous_interaction_id,
+                        store_interaction=store_interaction,
+                    )
+                else:
+                    result = await self._generate_structured_with_generate_content(
+                        contents=contents,
+                        system_instruction=system_instruction,
+                        response_type=response_type,
+                        model=model,
+                        temperature=temperature,
+                        cached_content_name=cached_content_name,
+                        thinking_level=thinking_level,
+                    )
+            _record_usage(model, started, result.usage)
+            return result
+
+        result: GeminiStructuredResult[T] = await call_with_retry(
+            attempt,
             model=model,
-            temperature=temperature,
-            cached_content_name=cached_content_name,
+            name=f"generate_structured:{response_type.__name__}",
+            policy=self.RETRY_POLICY,
         )
+        return result
 
     async def _generate_structured_with_generate_content[T: BaseModel](  # noqa: PLR0913
         self,
@@ -120,28 +188,32 @@ class GeminiClient:
         model: str,
         temperature: float,
         cached_content_name: str | None,
+        thinking_level: types.ThinkingLevel | None,
     ) -> GeminiStructuredResult[T]:
         """Generate structured output via models.generate_content."""
+        schema = structured_schema(response_type)
         response = await self._client.aio.models.generate_content(
             model=model,
             contents=contents,
             config=types.GenerateContentConfig(
                 system_instruction=system_instruction,
                 response_mime_type="application/json",
-                response_json_schema=response_type.model_json_schema(),
+                response_json_schema=schema.json_schema,
                 temperature=temperature,
                 cached_content=cached_content_name,
-                thinking_config=types.ThinkingConfig(
-                    thinking_level="MINIMAL",
+                thinking_config=(
+                    types.ThinkingConfig(thinking_level=thinking_level)
+                    if thinking_level is not None
+                    else None
                 ),
             ),
         )
         if not response.text:
             msg = "Gemini returned empty response"
-            raise RuntimeError(msg)
+            raise InvalidOutputError(msg)
         usage = self._extract_generate_usage(response.usage_metadata)
         return GeminiStructuredResult(
-            value=response_type.model_validate_json(response.text),
+            value=schema.validate_json(response.text),
             usage=usage,
         )
 
@@ -157,11 +229,12 @@ class GeminiClient:
         store_interaction: bool,
     ) -> GeminiStructuredResult[T]:
         """Generate structured output via interactions API."""
+        schema = structured_schema(response_type)
         create_kwargs = {
             "model": model,
             "input": contents,
             "generation_config": {"temperature": temperature},
-            "response_format": response_type.model_json_schema(),
+            "response_format": schema.json_schema,
             "response_mime_type": "application/json",
             "store": store_interaction,
             "system_instruction": system_instruction,
@@ -169,14 +242,14 @@ class GeminiClient:
         if previous_interaction_id:
             create_kwargs["previous_interaction_id"] = previous_interaction_id
 
-        interaction = await self._client.aio.interactions.create(**create_kwargs)  # type: ignore[call-overload]
+        interaction = await self._client.aio.interactions.create(**create_kwargs)
         raw_text = self._extract_interaction_text(interaction)
         if not raw_text:
             msg = "Gemini interaction returned empty response"
-            raise RuntimeError(msg)
+            raise InvalidOutputError(msg)
 
         return GeminiStructuredResult(
-            value=response_type.model_validate_json(raw_text),
+            value=schema.validate_json(raw_text),
             interaction_id=getattr(interaction, "id", None),
             usage=self._extract_interaction_usage(getattr(interaction, "usage", None)),
         )
@@ -188,14 +261,20 @@ class GeminiClient:
         contents: str,
         ttl: str = "3600s",
         display_name: str | None = None,
+        system_instruction: str | None = None,
     ) -> str:
-        """Create explicit cache for stable prompt prefix, return cache name."""
+        """Create explicit cache for stable prompt prefix, return cache name.
+
+        Requests that use the cache may not set their own system_instruction,
+        so a fixed one must be cached together with the prefix.
+        """
         cached = await self._client.aio.caches.create(
             model=model,
             config=types.CreateCachedContentConfig(
                 contents=contents,
                 ttl=ttl,
                 display_name=display_name,
+                system_instruction=system_instruction,
             ),
         )
         if not cached.name:
@@ -203,6 +282,13 @@ class GeminiClient:
             raise RuntimeError(msg)
         return cached.name
 
+    async def refresh_prompt_cache(self, name: str, *, ttl: str) -> None:
+        """Extend an explicit cache's lifetime to ``ttl`` from now."""
+        await self._client.aio.caches.update(
+            name=name,
+            config=types.UpdateCachedContentConfig(ttl=ttl),
+        )
+
     async def delete_prompt_cache(self, name: str) -> None:
         """Delete explicit cache (best-effort caller side)."""
         await self._client.aio.caches.delete(name=name)
@@ -220,30 +306,46 @@ class GeminiClient:
         transparent_background: bool = False,
         size: str = "auto",
     ) -> bytes | None:
-        """OpenAI画像生成/編集。画像が取得できなければNoneを返す."""
+        """OpenAI画像生成/編集。画像が取得できなければNoneを返す.
+
+        infra.llm_admission の IMAGE クラスの枠内で実行する。
+        """
         background = "transparent" if transparent_background else "auto"
         client = self._get_openai_client()
 
-        if source_image:
-            response = await client.images.edit(  # type: ignore[call-overload]
-                image=("npc-base.png", source_image, "image/png"),
-                prompt=prompt,
-                model=model,
-                input_fidelity="high",
-                response_format="b64_json",
-                output_format="png",
-                size=size,
-                background=background,
-            )
-        else:
-            response = await client.images.generate(  # type: ignore[call-overload]
-                prompt=prompt,
-                model=model,
-                response_format="b64_json",
-                output_format="png",
-                size=size,
-                background=background,
-            )
+        async with llm_admission.admit(AdmissionClass.IMAGE):
+            started = time.perf_counter()
+            if source_image:
+                response = await client.images.edit(  # type: ignore[call-overload]
+                    image=("npc-base.png", source_image, "image/png"),
+                    prompt=prompt,
+                    model=model,
+                    input_fidelity="high",
+                    response_format="b64_json",
+                    output_format="png",
+                    size=size,
+                    background=background,
+                )
+            else:
+                response = await client.images.generate(  # type: ignore[call-overload]
+                    prompt=prompt,
+                    model=model,
+                    response_format="b64_json",
+                    output_format="png",
+                    size=size,
+                    background=background,
+                )
+        usage = getattr(response, "usage", None)
+        _record_usage(
+            model,
+            started,
+            GeminiUsageMetadata(
+                prompt_tokens=getattr(usage, "input_tokens", None),
+                output_tokens=getattr(usage, "output_tokens", None),
+                total_tokens=getattr(usage, "total_tokens", None),
+            ),
+            purpose=UsagePurpose.IMAGE,
+        )
 
         if not response.data:
             return None
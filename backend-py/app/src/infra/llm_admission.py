@@ -0,0 +1,271 @@
+"""Process-wide admission control for outbound LLM and generation calls.
+
+Every call to a model provider first takes a slot from the shared
+``llm_admission`` controller.  Calls are queued per admission class and
+slots are granted in priority order::
+
+    DECISION > ENDING > IMAGE > COMPRESSION > MUSIC
+
+so that background work (context compression, image and BGM generation)
+never holds up interactive GM turns when the process is saturated.
+
+Each class has its own concurrency limit on top of the process-wide one
+(``LLM_ADMISSION_MAX_CONCURRENCY``).  The background classes' limits sum to
+less than the total, which leaves slots free for interactive turns even
+while every background slot is busy.  Limits can be overridden with
+``LLM_ADMISSION_<CLASS>_CONCURRENCY``.
+
+Load shedding: a call fails fast with ``AdmissionRejectedError`` when its
+class queue is full, or when it waited longer than the class allows.
+``infra.llm_retry`` treats the error as fatal, so shed calls are neither
+retried nor counted against the model's circuit breaker.
+
+Queue waits are recorded on the bound StageTimer as ``llm_queue`` and kept
+per class for ``AdmissionController.stats``.  Slots are taken per network
+attempt, so retry backoff does not hold one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from infra.usage_accounting import UsagePurpose, usage_scope_var
+from util.env import env_positive_int
+from util.latency_window import LatencyWindow
+from util.logging import get_logger, stage_timer_var
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+logger = get_logger(__name__)
+
+
+class AdmissionClass(IntEnum):
+    """Priority class of a call; lower values are admitted first."""
+
+    DECISION = 0
+    ENDING = 1
+    IMAGE = 2
+    COMPRESSION = 3
+    MUSIC = 4
+
+    @classmethod
+    def for_purpose(cls, purpose: UsagePurpose) -> AdmissionClass:
+        """Return the class of calls made for ``purpose``."""
+        return cls[purpose.name]
+
+    @classmethod
+    def current(cls) -> AdmissionClass:
+        """Return the class of the purpose bound to the current usage scope."""
+        return cls.for_purpose(usage_scope_var.get().purpose)
+
+
+class AdmissionRejectedError(RuntimeError):
+    """A call was shed because its class queue was full or waited too long."""
+
+
+@dataclass(frozen=True)
+class ClassLimits:
+    """Concurrency and queueing limits of one admission class.
+
+    ``max_wait_seconds`` of None lets calls wait for a slot indefinitely.
+    """
+
+    concurrency: int
+    max_queue: int
+    max_wait_seconds: float | None = None
+
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+DEFAULT_LIMITS: Mapping[AdmissionClass, ClassLimits] = {
+    AdmissionClass.DECISION: ClassLimits(concurrency=32, max_queue=256),
+    AdmissionClass.ENDING: ClassLimits(concurrency=16, max_queue=128),
+    AdmissionClass.IMAGE: ClassLimits(
+        concurrency=8,
+        max_queue=64,
+        max_wait_seconds=120.0,
+    ),
+    AdmissionClass.COMPRESSION: ClassLimits(
+        concurrency=4,
+        max_queue=64,
+        max_wait_seconds=60.0,
+    ),
+    AdmissionClass.MUSIC: ClassLimits(
+        concurrency=2,
+        max_queue=16,
+        max_wait_seconds=300.0,
+    ),
+}
+
+
+class _ClassState:
+    """Waiters, in-flight count and metrics of one admission class."""
+
+    def __init__(self, limits: ClassLimits, *, window: int) -> None:
+        self.limits = limits
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.in_flight = 0
+        self.admitted = 0
+        self.shed = 0
+        self.waits = LatencyWindow(window)
+
+
+class AdmissionController:
+    """Grant call slots by priority under per-class and total limits."""
+
+    WAIT_WINDOW = 200
+
+    def __init__(
+        self,
+        limits: Mapping[AdmissionClass, ClassLimits] = DEFAULT_LIMITS,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._classes = {
+            admission_class: _ClassState(
+                limits.get(admission_class, DEFAULT_LIMITS[admission_class]),
+                window=self.WAIT_WINDOW,
+            )
+            for admission_class in AdmissionClass
+        }
+
+    @classmethod
+    def from_env(cls) -> AdmissionController:
+        """Build a controller from ``LLM_ADMISSION_*`` environment variables."""
+        limits = {
+            admission_class: replace(
+                defaults,
+                concurrency=env_positive_int(
+                    f"LLM_ADMISSION_{admission_class.name}_CONCURRENCY",
+                    default=defaults.concurrency,
+                ),
+            )
+            for admission_class, defaults in DEFAULT_LIMITS.items()
+        }
+        return cls(
+            limits,
+            max_concurrency=env_positive_int(
+                "LLM_ADMISSION_MAX_CONCURRENCY",
+                default=DEFAULT_MAX_CONCURRENCY,
+            ),
+        )
+
+    @asynccontextmanager
+    async def admit(self, admission_class: AdmissionClass) -> AsyncIterator[None]:
+        """Hold a slot of ``admission_class`` for the enclosed call.
+
+        Raises:
+            AdmissionRejectedError: The call was shed.
+        """
+        await self.acquire(admission_class)
+        try:
+            yield
+        finally:
+            self.release(admission_class)
+
+    async def acquire(self, admission_class: AdmissionClass) -> None:
+        """Wait for a slot; pair every successful call with ``release``.
+
+        Raises:
+            AdmissionRejectedError: The class queue is full or the wait
+                exceeded ``max_wait_seconds``.
+        """
+        state = self._classes[admission_class]
+        if len(state.waiters) >= state.limits.max_queue:
+            self._shed(admission_class, reason="queue_full")
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.waiters.append(future)
+        self._dispatch()
+        if future.done():
+            state.waits.record(0.0)
+            return
+
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(state.limits.max_wait_seconds):
+                await future
+        except BaseException as exc:
+            if future.done() and not future.cancelled():
+                # Granted just as the wait was abandoned: hand the slot on.
+                self.release(admission_class)
+            else:
+                future.cancel()
+                with contextlib.suppress(ValueError):
+                    state.waiters.remove(future)
+            if isinstance(exc, TimeoutError):
+                self._shed(admission_class, reason="wait_timeout")
+            raise
+        waited = time.perf_counter() - started
+        state.waits.record(waited)
+        timer = stage_timer_var.get()
+        if timer is not None:
+            timer.record(
+                "llm_queue",
+                waited * 1000,
+                admission_class=admission_class.name.lower(),
+            )
+
+    def release(self, admission_class: AdmissionClass) -> None:
+        """Return a slot taken by ``acquire`` and admit the next waiters."""
+        self._classes[admission_class].in_flight -= 1
+        self._in_flight -= 1
+        self._dispatch()
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return in-flight, queued, admitted, shed and p90 wait per class."""
+        return {
+            admission_class.name.lower(): {
+                "in_flight": state.in_flight,
+                "queued": sum(not waiter.done() for waiter in state.waiters),
+                "admitted": state.admitted,
+                "shed": state.shed,
+                "queue_wait_p90_ms": (
+                    round(state.waits.percentile(0.9) * 1000, 2) if state.waits else 0.0
+                ),
+            }
+            for admission_class, state in self._classes.items()
+        }
+
+    def _dispatch(self) -> None:
+        """Grant waiting calls in priority order while slots are free."""
+        for state in self._classes.values():
+            while (
+                state.waiters
+                and self._in_flight < self._max_concurrency
+                and state.in_flight < state.limits.concurrency
+            ):
+                future = state.waiters.popleft()
+                if future.done():
+                    continue
+                future.set_result(None)
+                state.in_flight += 1
+                state.admitted += 1
+                self._in_flight += 1
+            if self._in_flight >= self._max_concurrency:
+                return
+
+    def _shed(self, admission_class: AdmissionClass, *, reason: str) -> None:
+        state = self._classes[admission_class]
+        state.shed += 1
+        logger.warning(
+            "LLM call shed by admission control",
+            admission_class=admission_class.name.lower(),
+            reason=reason,
+            in_flight=self._in_flight,
+            queued=len(state.waiters),
+        )
+        msg = f"LLM call shed ({admission_class.name.lower()}: {reason})"
+        raise AdmissionRejectedError(msg) from None
+
+
+llm_admission = AdmissionController.from_env()
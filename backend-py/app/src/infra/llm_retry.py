@@ -0,0 +1,236 @@
+"""Error-classified retries and per-model circuit breakers for LLM calls.
+
+Every failure is classified before deciding whether to retry:
+
+- transient: timeouts, connection errors, 5xx — retried with jittered
+  exponential backoff.
+- rate_limited: 429 / quota errors — retried with a longer backoff.
+- invalid_output: the model answered but the output did not parse or was
+  empty — retried immediately, since waiting does not help sampling.
+- fatal: 4xx, missing credentials, programming errors, calls shed by
+  ``infra.llm_admission`` — never retried.
+
+Transient and rate-limited failures count towards the model's circuit
+breaker.  After ``failure_threshold`` consecutive such failures the breaker
+opens and calls for that model fail fast with ``CircuitOpenError`` until
+``reset_timeout_seconds`` have passed; then a single probe call is let
+through.  Breakers are shared process-wide, so GM decisions, structured
+generation and context compression back off together during an outage
+instead of multiplying the load with their own retries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+import openai
+from google.genai import errors as genai_errors
+from pydantic import ValidationError
+
+from infra.llm_admission import AdmissionRejectedError
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = get_logger(__name__)
+
+_HTTP_TOO_MANY_REQUESTS = 429
+_HTTP_REQUEST_TIMEOUT = 408
+_HTTP_SERVER_ERROR = 500
+
+
+class LlmErrorKind(StrEnum):
+    """How an LLM call failure should be handled."""
+
+    TRANSIENT = "transient"
+    RATE_LIMITED = "rate_limited"
+    INVALID_OUTPUT = "invalid_output"
+    FATAL = "fatal"
+
+
+class InvalidOutputError(RuntimeError):
+    """The model responded, but without usable output."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Calls to a model are suspended after repeated provider failures."""
+
+
+def classify_error(exc: BaseException) -> LlmErrorKind:
+    """Classify an exception raised by an LLM call."""
+    if isinstance(exc, InvalidOutputError | ValidationError | json.JSONDecodeError):
+        return LlmErrorKind.INVALID_OUTPUT
+    if isinstance(
+        exc,
+        CircuitOpenError
+        | AdmissionRejectedError
+        | ValueError
+        | TypeError
+        | AttributeError,
+    ):
+        return LlmErrorKind.FATAL
+    status: int | None = None
+    if isinstance(exc, genai_errors.APIError):
+        status = exc.code
+    elif isinstance(exc, openai.APIStatusError):
+        status = exc.status_code
+    if status is not None:
+        return _classify_status(status)
+    # Timeouts, dropped connections and unrecognised runtime errors are
+    # assumed to be worth another try.
+    return LlmErrorKind.TRANSIENT
+
+
+def _classify_status(status: int) -> LlmErrorKind:
+    if status == _HTTP_TOO_MANY_REQUESTS:
+        return LlmErrorKind.RATE_LIMITED
+    if status == _HTTP_REQUEST_TIMEOUT or status >= _HTTP_SERVER_ERROR:
+        return LlmErrorKind.TRANSIENT
+    return LlmErrorKind.FATAL
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Attempt budget and backoff delays (seconds) per error kind."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    rate_limit_base_delay: float = 2.0
+    max_delay: float = 10.0
+
+    def delay(self, kind: LlmErrorKind, attempt: int) -> float | None:
+        """Return the wait before retry ``attempt`` (1-based), None to give up."""
+        if kind is LlmErrorKind.FATAL or attempt >= self.max_attempts:
+            return None
+        if kind is LlmErrorKind.INVALID_OUTPUT:
+            return 0.0
+        base = (
+            self.rate_limit_base_delay
+            if kind is LlmErrorKind.RATE_LIMITED
+            else self.base_delay
+        )
+        ceiling = min(self.max_delay, base * 2 ** (attempt - 1))
+        # Full jitter spreads retries of concurrent sessions apart.
+        return random.uniform(0.0, ceiling)  # noqa: S311
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one model."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether calls are currently being rejected."""
+        return self._opened_at is not None
+
+    def before_call(self, model: str) -> None:
+        """Raise CircuitOpenError unless a call may proceed."""
+        if self._opened_at is None:
+            return
+        elapsed = self._clock() - self._opened_at
+        if elapsed >= self._reset_timeout_seconds and not self._probing:
+            self._probing = True
+            return
+        msg = f"Circuit open for model {model}"
+        raise CircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Close the breaker after any call that reached the model."""
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self, kind: LlmErrorKind) -> None:
+        """Count provider-side failures; other kinds leave the state as is."""
+        if kind is LlmErrorKind.INVALID_OUTPUT:
+            # The provider answered, so a probe that got this far succeeded.
+            self.record_success()
+            return
+        if kind not in {LlmErrorKind.TRANSIENT, LlmErrorKind.RATE_LIMITED}:
+            self._probing = False
+            return
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another call probe after the current one was cancelled."""
+        self._probing = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def circuit_breaker(model: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for ``model``."""
+    breaker = _breakers.get(model)
+    if breaker is None:
+        breaker = _breakers[model] = CircuitBreaker()
+    return breaker
+
+
+async def call_with_retry[T](
+    operation: Callable[[int], Awaitable[T]],
+    *,
+    model: str,
+    name: str,
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> T:
+    """Run ``operation(attempt)`` under ``policy`` and ``model``'s breaker.
+
+    ``attempt`` is 1-based.  The last exception is re-raised once the policy
+    gives up; an open circuit raises CircuitOpenError without calling.
+    """
+    breaker = circuit_breaker(model)
+    attempt = 1
+    while True:
+        breaker.before_call(model)
+        try:
+            result = await operation(attempt)
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception as exc:
+            kind = classify_error(exc)
+            breaker.record_failure(kind)
+            delay = policy.delay(kind, attempt)
+            logger.warning(
+                "LLM call failed",
+                operation=name,
+                model=model,
+                attempt=attempt,
+                error_kind=str(kind),
+                error=f"{type(exc).__name__}: {exc}",
+                retry_in_s=None if delay is None else round(delay, 2),
+            )
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
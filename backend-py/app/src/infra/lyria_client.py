@@ -13,6 +13,7 @@ from google import genai
 from google.genai import types
 from pydub import AudioSegment
 
+from infra.llm_admission import AdmissionClass, llm_admission
 from util.logging import get_logger
 
 logger = get_logger(__name__)
@@ -55,16 +56,20 @@ class LyriaClient:
         config: dict[str, Any] | None = None,
         duration_seconds: int = DEFAULT_DURATION_SECONDS,
     ) -> AsyncIterator[bytes]:
-        """Yield PCM chunks from Lyria realtime stream."""
+        """Yield PCM chunks from Lyria realtime stream.
+
+        The stream holds a MUSIC slot of infra.llm_admission until it ends.
+        """
         bytes_per_second = (
             self.DEFAULT_SAMPLE_RATE * self.DEFAULT_CHANNELS * self.DEFAULT_SAMPLE_WIDTH
         )
         max_bytes = max(1, duration_seconds) * bytes_per_second
         received = 0
 
-        async with self._client.aio.live.music.connect(
-            model=self._model,
-        ) as session:
+        async with (
+            llm_admission.admit(AdmissionClass.MUSIC),
+            self._client.aio.live.music.connect(model=self._model) as session,
+        ):
             await self._set_weighted_prompt(session, prompt)
             await self._set_generation_config(session, config)
             await session.play()
@@ -0,0 +1,187 @@
+"""Purpose-based model routing for LLM calls.
+
+Each call purpose gets an ordered list of candidate routes (model and
+optional thinking level) from the environment, most preferred first::
+
+    GM_MODEL_DECISION=gemini-3.1-flash-lite-preview
+    GM_MODEL_COMPRESSION=gemini-3.1-flash-lite-preview:minimal
+    GM_MODEL_ENDING=gemini-3-flash-preview:low,gemini-3.1-flash-lite-preview
+
+Unset or invalid variables fall back to ``DEFAULT_ROUTES``, which keep every
+purpose on the model the GM was built around.
+
+When ``GM_MODEL_<PURPOSE>_LATENCY_BUDGET_MS`` is set the router adapts to
+observed latency: a candidate whose recent p90 exceeds the budget is skipped
+for the next one, and every ``PROBE_EVERY``-th call still goes to the
+preferred route so that it is picked again once it recovers.  Calls bound to
+one model, such as prompts that extend an explicit prompt cache, are pinned
+to the preferred route.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from google.genai import types as genai_types
+
+from infra.usage_accounting import UsagePurpose
+from util.env import env_positive_float
+from util.latency_window import LatencyWindow
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model and thinking level for one call; None keeps the model default."""
+
+    model: str
+    thinking_level: genai_types.ThinkingLevel | None = None
+
+    @classmethod
+    def parse(cls, spec: str) -> ModelRoute:
+        """Parse ``model`` or ``model:thinking_level``.
+
+        Raises:
+            ValueError: The model is empty or the thinking level is unknown.
+        """
+        model, _, level = spec.strip().partition(":")
+        if not model:
+            msg = f"Empty model in route {spec!r}"
+            raise ValueError(msg)
+        if not level:
+            return cls(model=model)
+        # ThinkingLevel() accepts unknown values with a warning; reject them.
+        try:
+            thinking_level = genai_types.ThinkingLevel[level.upper()]
+        except KeyError:
+            msg = f"Unknown thinking level in route {spec!r}"
+            raise ValueError(msg) from None
+        return cls(model=model, thinking_level=thinking_level)
+
+
+_DEFAULT_MODEL = "gemini-3.1-flash-lite-preview"
+
+DEFAULT_ROUTES: Mapping[UsagePurpose, tuple[ModelRoute, ...]] = {
+    UsagePurpose.DECISION: (ModelRoute(_DEFAULT_MODEL),),
+    UsagePurpose.COMPRESSION: (
+        ModelRoute(_DEFAULT_MODEL, genai_types.ThinkingLevel.MINIMAL),
+    ),
+    UsagePurpose.ENDING: (ModelRoute(_DEFAULT_MODEL),),
+}
+
+
+class _PurposeRoutes:
+    """Candidates of one purpose and their recent latencies."""
+
+    def __init__(
+        self,
+        candidates: Sequence[ModelRoute],
+        *,
+        budget_seconds: float | None,
+        window: int,
+    ) -> None:
+        self.candidates = tuple(candidates)
+        self.budget_seconds = budget_seconds
+        self.latencies = {route: LatencyWindow(window) for route in self.candidates}
+        self.calls = 0
+
+
+class ModelRouter:
+    """Choose the model route for a call purpose."""
+
+    LATENCY_WINDOW = 50
+    LATENCY_PERCENTILE = 0.9
+    MIN_SAMPLES = 10
+    PROBE_EVERY = 10
+
+    def __init__(
+        self,
+        routes: Mapping[UsagePurpose, Sequence[ModelRoute]] = DEFAULT_ROUTES,
+        *,
+        latency_budgets: Mapping[UsagePurpose, float] | None = None,
+    ) -> None:
+        """``latency_budgets`` (seconds) enable latency adaptation per purpose."""
+        budgets = latency_budgets or {}
+        self._routes = {
+            purpose: _PurposeRoutes(
+                candidates,
+                budget_seconds=budgets.get(purpose),
+                window=self.LATENCY_WINDOW,
+            )
+            for purpose, candidates in routes.items()
+            if candidates
+        }
+
+    @classmethod
+    def from_env(cls) -> ModelRouter:
+        """Build a router from ``GM_MODEL_<PURPOSE>`` environment variables."""
+        routes: dict[UsagePurpose, Sequence[ModelRoute]] = {}
+        budgets: dict[UsagePurpose, float] = {}
+        for purpose, defaults in DEFAULT_ROUTES.items():
+            name = f"GM_MODEL_{purpose.name}"
+            routes[purpose] = _env_routes(name, default=defaults)
+            budget_ms = env_positive_float(
+                f"{name}_LATENCY_BUDGET_MS",
+                default=None,
+            )
+            if budget_ms is not None:
+                budgets[purpose] = budget_ms / 1000
+        return cls(routes, latency_budgets=budgets)
+
+    def primary(self, purpose: UsagePurpose) -> ModelRoute:
+        """Return the preferred route of ``purpose``."""
+        return self._routes[purpose].candidates[0]
+
+    def route(self, purpose: UsagePurpose, *, pinned: bool = False) -> ModelRoute:
+        """Return the route for the next call of ``purpose``."""
+        routes = self._routes[purpose]
+        if pinned or routes.budget_seconds is None or len(routes.candidates) == 1:
+            return routes.candidates[0]
+        routes.calls += 1
+        if routes.calls % self.PROBE_EVERY == 0:
+            return routes.candidates[0]
+        for candidate in routes.candidates[:-1]:
+            window = routes.latencies[candidate]
+            if (
+                len(window) < self.MIN_SAMPLES
+                or window.percentile(self.LATENCY_PERCENTILE) <= routes.budget_seconds
+            ):
+                return candidate
+        return routes.candidates[-1]
+
+    def observe(
+        self,
+        purpose: UsagePurpose,
+        route: ModelRoute,
+        seconds: float,
+    ) -> None:
+        """Record the latency of a successful call made on ``route``."""
+        window = self._routes[purpose].latencies.get(route)
+        if window is not None:
+            window.record(seconds)
+
+
+def _env_routes(
+    name: str,
+    *,
+    default: tuple[ModelRoute, ...],
+) -> tuple[ModelRoute, ...]:
+    """Parse a comma-separated route list; invalid values use ``default``."""
+    raw = os.getenv(name)
+    if not raw or not raw.strip():
+        return default
+    try:
+        return tuple(ModelRoute.parse(spec) for spec in raw.split(","))
+    except ValueError:
+        logger.warning("Invalid model route; using default", env=name, value=raw)
+        return default
+
+
+shared_model_router = ModelRouter.from_env()
@@ -1,22 +1,88 @@
-"""Supabase Storage service for uploading generated images."""
+"""Supabase Storage service for uploading generated images and audio.
+
+Talks to the Storage REST API directly on the event loop instead of wrapping
+the synchronous supabase client in worker threads.  Every StorageService
+shares one process-wide ``httpx.AsyncClient`` (HTTP/2, keep-alive pool), so
+transfers reuse connections across requests:
+
+- ``STORAGE_MAX_CONCURRENCY`` caps simultaneous transfers (default 16);
+  further calls wait for a free slot.
+- ``STORAGE_TIMEOUT_SECONDS`` bounds each request (default 30).
+- Connection errors, timeouts, 408, 429 and 5xx responses are retried with
+  jittered exponential backoff, up to ``StorageService.MAX_ATTEMPTS`` tries.
+
+``aclose_storage_pool`` releases the shared connections on shutdown.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 import uuid
-from typing import cast
+from typing import Any
 
-from supabase import Client, create_client
+import httpx
 
+from util.env import env_positive_float, env_positive_int
 from util.logging import get_logger
 
 logger = get_logger(__name__)
 
 _BUCKET = "generated-images"
+_CACHE_CONTROL = "3600"
+
+_HTTP_REQUEST_TIMEOUT = 408
+_HTTP_TOO_MANY_REQUESTS = 429
+_HTTP_SERVER_ERROR = 500
+
+
+class _StoragePool:
+    """Shared HTTP/2 connection pool and transfer concurrency cap."""
+
+    def __init__(self, *, max_concurrency: int, timeout_seconds: float) -> None:
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self.slots = asyncio.Semaphore(max_concurrency)
+
+
+_pool: _StoragePool | None = None
+
+
+def _storage_pool() -> _StoragePool:
+    """Return the shared pool, creating it on first call."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        _pool = _StoragePool(
+            max_concurrency=env_positive_int("STORAGE_MAX_CONCURRENCY", default=16),
+            timeout_seconds=env_positive_float(
+                "STORAGE_TIMEOUT_SECONDS",
+                default=30.0,
+            ),
+        )
+    return _pool
+
+
+async def aclose_storage_pool() -> None:
+    """Close the shared pool; the next StorageService call opens a new one."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.client.aclose()
 
 
 class StorageService:
-    """Upload files to Supabase Storage and return public URLs."""
+    """Upload files to Supabase Storage and return storage paths."""
+
+    MAX_ATTEMPTS = 3
+    BASE_DELAY_SECONDS = 0.2
+    MAX_DELAY_SECONDS = 2.0
 
     def __init__(self) -> None:
         url = os.getenv("SUPABASE_URL")
@@ -31,9 +97,10 @@ class StorageService:
                 "(or SUPABASE_SECRET_KEY / SUPABASE_SECRET) must be set"
             )
             raise ValueError(msg)
-        self._client: Client = create_client(url, key)
+        self._object_url = f"{url.rstrip('/')}/storage/v1/object"
+        self._headers = {"Authorization": f"Bearer {key}", "apikey": key}
 
-    def upload_image(
+    async def upload_image(
         self,
         session_id: str,
         image_bytes: bytes,
@@ -52,11 +119,7 @@ class StorageService:
         file_name = f"{uuid.uuid4()}.{ext}"
         path = f"sessions/{session_id}/{file_name}"
 
-        self._client.storage.from_(_BUCKET).upload(
-            path=path,
-            file=image_bytes,
-            file_options={"content-type": content_type},
-        )
+        await self._upload(_BUCKET, path, image_bytes, content_type)
 
         logger.info(
             "Image uploaded to storage",
@@ -65,7 +128,7 @@ class StorageService:
         )
         return path
 
-    def upload_audio(
+    async def upload_audio(
         self,
         path: str,
         audio_bytes: bytes,
@@ -80,22 +143,18 @@ class StorageService:
             content_type: MIME type.
             bucket: Storage bucket name.
         """
-        self._client.storage.from_(bucket).upload(
-            path=path,
-            file=audio_bytes,
-            file_options={"content-type": content_type},
-        )
+        await self._upload(bucket, path, audio_bytes, content_type)
         logger.info("Audio uploaded to storage", bucket=bucket, path=path)
         return path
 
-    def download_image(
+    async def download_image(
         self,
         path: str,
         bucket: str = _BUCKET,
     ) -> bytes | None:
         """Download image bytes from Supabase Storage."""
         try:
-            return cast("bytes", self._client.storage.from_(bucket).download(path))
+            response = await self._request("GET", f"{bucket}/{path}")
         except Exception:
             logger.warning(
                 "Image download failed",
@@ -103,3 +162,85 @@ class StorageService:
                 path=path,
             )
             return None
+        return response.content
+
+    async def _upload(
+        self,
+        bucket: str,
+        path: str,
+        payload: bytes,
+        content_type: str,
+    ) -> None:
+        """Upload one object as multipart form data, like supabase-py does.
+
+        Uploads upsert so that a retry after a lost response does not fail
+        on the object the first attempt already stored.
+        """
+        await self._request(
+            "POST",
+            f"{bucket}/{path}",
+            files={"file": (path.rsplit("/", 1)[-1], payload, content_type)},
+            data={"cacheControl": _CACHE_CONTROL},
+            headers={"x-upsert": "true"},
+        )
+
+    async def _request(
+        self,
+        method: str,
+        object_path: str,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> httpx.Response:
+        """Send one Storage request under the concurrency cap, with retries.
+
+        Raises:
+            httpx.HTTPError: The last failure once retries are exhausted, or
+                the first non-retryable error response.
+        """
+        pool = _storage_pool()
+        url = f"{self._object_url}/{object_path}"
+        headers = {**self._headers, **kwargs.pop("headers", {})}
+        attempt = 1
+        while True:
+            try:
+                async with pool.slots:
+                    response = await pool.client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        **kwargs,
+                    )
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                if attempt >= self.MAX_ATTEMPTS or not _is_retryable(exc):
+                    raise
+                delay = random.uniform(  # noqa: S311
+                    0.0,
+                    min(
+                        self.MAX_DELAY_SECONDS,
+                        self.BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+                    ),
+                )
+                logger.warning(
+                    "Storage request failed; retrying",
+                    method=method,
+                    path=object_path,
+                    attempt=attempt,
+                    delay_ms=round(delay * 1000),
+                    error=str(exc),
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                return response
+
+
+def _is_retryable(exc: httpx.HTTPError) -> bool:
+    """Connection problems, timeouts, throttling and 5xx are worth a retry."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status in {_HTTP_REQUEST_TIMEOUT, _HTTP_TOO_MANY_REQUESTS} or (
+            status >= _HTTP_SERVER_ERROR
+        )
+    return False
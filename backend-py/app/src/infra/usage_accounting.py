@@ -0,0 +1,286 @@
+"""Per-session and per-scenario LLM token and latency accounting.
+
+Every model call reports its usage through ``record_usage``.  The call is
+attributed to the game session, scenario and purpose bound in the current
+context (``bind_usage_scope`` / ``usage_purpose``), so call sites deep in
+infra need no extra parameters.  Records are summed in process per
+(session, scenario, purpose, model) and written to ``llm_usage`` in one bulk
+insert per interval: accounting never adds a database round trip to a turn.
+
+Decision calls also carry the estimated token count of each prompt section
+(``note_prompt_sections``), which shows which sections drive prompt cost for
+a scenario.  A failed flush is logged and its window dropped; the table is
+telemetry, not billing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from domain.entity.models import LlmUsage
+from util.logging import get_logger
+
+if TYPE_CHECKING:
+    import uuid
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
+logger = get_logger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 60.0
+
+
+class UsagePurpose(StrEnum):
+    """Why a model was called."""
+
+    DECISION = "decision"
+    COMPRESSION = "compression"
+    ENDING = "ending"
+    IMAGE = "image"
+
+
+@dataclass(frozen=True)
+class UsageScope:
+    """Attribution for the model calls made in the current context."""
+
+    game_session_id: uuid.UUID | None = None
+    scenario_id: uuid.UUID | None = None
+    purpose: UsagePurpose = UsagePurpose.DECISION
+
+
+usage_scope_var: ContextVar[UsageScope] = ContextVar(
+    "usage_scope",
+    default=UsageScope(),  # noqa: B039 -- frozen, never mutated
+)
+_prompt_sections_var: ContextVar[Mapping[str, int] | None] = ContextVar(
+    "usage_prompt_sections",
+    default=None,
+)
+
+
+def bind_usage_scope(
+    *,
+    game_session_id: uuid.UUID,
+    scenario_id: uuid.UUID | None,
+) -> Token[UsageScope]:
+    """Attribute model calls in the current context to a game session."""
+    return usage_scope_var.set(
+        UsageScope(game_session_id=game_session_id, scenario_id=scenario_id),
+    )
+
+
+def reset_usage_scope(token: Token[UsageScope]) -> None:
+    """Undo ``bind_usage_scope``.
+
+    Like ``reset_stage_timer``, tolerates finalization in another context.
+    """
+    try:
+        usage_scope_var.reset(token)
+    except ValueError:
+        usage_scope_var.set(UsageScope())
+
+
+@contextmanager
+def usage_purpose(purpose: UsagePurpose) -> Iterator[None]:
+    """Tag model calls made inside the block with ``purpose``."""
+    scope = usage_scope_var.get()
+    token = usage_scope_var.set(
+        UsageScope(
+            game_session_id=scope.game_session_id,
+            scenario_id=scope.scenario_id,
+            purpose=purpose,
+        ),
+    )
+    try:
+        yield
+    finally:
+        usage_scope_var.reset(token)
+
+
+def note_prompt_sections(section_tokens: Mapping[str, int]) -> None:
+    """Attach per-section prompt token estimates to later decision calls."""
+    _prompt_sections_var.set(dict(section_tokens))
+
+
+@dataclass(frozen=True)
+class UsageRecord:
+    """Usage of a single model call."""
+
+    model: str
+    purpose: UsagePurpose
+    latency_ms: float
+    game_session_id: uuid.UUID | None = None
+    scenario_id: uuid.UUID | None = None
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    section_tokens: Mapping[str, int] | None = None
+
+
+@dataclass
+class _UsageTotals:
+    call_count: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+    section_tokens: dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: UsageRecord) -> None:
+        self.call_count += 1
+        self.prompt_tokens += record.prompt_tokens
+        self.cached_tokens += record.cached_tokens
+        self.output_tokens += record.output_tokens
+        self.total_tokens += record.total_tokens
+        self.latency_ms_total += record.latency_ms
+        self.latency_ms_max = max(self.latency_ms_max, record.latency_ms)
+        for name, tokens in (record.section_tokens or {}).items():
+            self.section_tokens[name] = self.section_tokens.get(name, 0) + tokens
+
+
+type _UsageKey = tuple[uuid.UUID | None, uuid.UUID | None, UsagePurpose, str]
+
+
+class UsageAggregator:
+    """Sum usage records in memory and flush them in bulk on an interval."""
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._totals: dict[_UsageKey, _UsageTotals] = {}
+        self._window_start = clock()
+        self._writer: Callable[[Sequence[LlmUsage]], None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def add(self, record: UsageRecord) -> None:
+        """Add one call to the current window."""
+        key = (
+            record.game_session_id,
+            record.scenario_id,
+            record.purpose,
+            record.model,
+        )
+        totals = self._totals.get(key)
+        if totals is None:
+            totals = self._totals[key] = _UsageTotals()
+        totals.add(record)
+
+    def drain(self) -> list[LlmUsage]:
+        """Close the current window and return it as ``llm_usage`` rows."""
+        window_start, window_end = self._window_start, self._clock()
+        totals, self._totals = self._totals, {}
+        self._window_start = window_end
+        return [
+            LlmUsage(
+                session_id=session_id,
+                scenario_id=scenario_id,
+                purpose=purpose.value,
+                model=model,
+                call_count=t.call_count,
+                prompt_tokens=t.prompt_tokens,
+                cached_tokens=t.cached_tokens,
+                output_tokens=t.output_tokens,
+                total_tokens=t.total_tokens,
+                latency_ms_total=round(t.latency_ms_total),
+                latency_ms_max=round(t.latency_ms_max),
+                section_tokens=t.section_tokens or None,
+                window_start=window_start,
+                window_end=window_end,
+            )
+            for (session_id, scenario_id, purpose, model), t in totals.items()
+        ]
+
+    async def flush(self) -> int:
+        """Write the current window with the started writer; return row count.
+
+        Without a writer (``start`` not called) the window is kept.
+        """
+        if self._writer is None or not self._totals:
+            return 0
+        rows = self.drain()
+        try:
+            await asyncio.to_thread(self._writer, rows)
+        except Exception as exc:
+            logger.warning(
+                "LLM usage flush failed; window dropped",
+                rows=len(rows),
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            return 0
+        return len(rows)
+
+    def start(self, writer: Callable[[Sequence[LlmUsage]], None]) -> None:
+        """Flush to ``writer`` every interval; a no-op if already running."""
+        self._writer = writer
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Stop the background loop and flush what is left."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self.flush()
+
+
+usage_aggregator = UsageAggregator()
+
+
+def record_usage(  # noqa: PLR0913
+    *,
+    model: str,
+    started: float,
+    prompt_tokens: int | None = None,
+    cached_tokens: int | None = None,
+    output_tokens: int | None = None,
+    total_tokens: int | None = None,
+    purpose: UsagePurpose | None = None,
+) -> None:
+    """Account one finished model call in the current usage scope.
+
+    ``started`` is the call's ``time.perf_counter()`` start; missing token
+    counts are recorded as 0.  ``purpose`` overrides the scope's purpose.
+    """
+    scope = usage_scope_var.get()
+    purpose = purpose or scope.purpose
+    usage_aggregator.add(
+        UsageRecord(
+            model=model,
+            purpose=purpose,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            game_session_id=scope.game_session_id,
+            scenario_id=scope.scenario_id,
+            prompt_tokens=prompt_tokens or 0,
+            cached_tokens=cached_tokens or 0,
+            output_tokens=output_tokens or 0,
+            total_tokens=total_tokens or 0,
+            section_tokens=(
+                _prompt_sections_var.get() if purpose is UsagePurpose.DECISION else None
+            ),
+        ),
+    )
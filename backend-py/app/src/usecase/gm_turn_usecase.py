@@ -8,16 +8,25 @@ conditions, persist the turn record, and stream the result as SSE events.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
 import json
 import os
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from sqlmodel import Session as SQLModelSession
 
-from domain.entity.gm_prompts import MAX_CLOSING_TURNS, build_ending_narration_prompt
+from domain.entity.gm_prompts import (
+    GM_SYSTEM_PROMPT,
+    MAX_CLOSING_TURNS,
+    MAX_ENDING_NODES,
+    build_ending_narration_prompt,
+    build_ending_sequence_prompt,
+)
 from domain.entity.gm_types import (
     GmTurnRequest,
     LatestTurnResponse,
@@ -31,32 +40,54 @@ from domain.service.condition_evaluation_service import (
     ConditionEvaluationResult,
     ConditionEvaluationService,
 )
-from domain.service.context_service import ContextService
+from domain.service.context_service import (
+    DEFAULT_PROMPT_TOKEN_BUDGET,
+    ContextService,
+)
 from domain.service.genui_bridge_service import GenuiBridgeService, NpcImageMap
 from domain.service.gm_decision_service import GmDecisionRuntime, GmDecisionService
 from domain.service.npc_clone_service import NpcCloneService
+from domain.service.prompt_cache_manager import PromptCacheKey, PromptCacheManager
 from domain.service.state_mutation_service import StateMutationService
 from domain.service.storage_constants import SCENARIO_ASSETS_BUCKET
 from domain.service.turn_limit_service import TurnLimitService
 from gateway.npc_gateway import NpcGateway
 from gateway.scene_background_gateway import SceneBackgroundGateway
 from gateway.session_gateway import SessionGateway
+from gateway.session_runner import is_async_session, run_in_session
 from gateway.turn_gateway import TurnGateway
+from gateway.unit_of_work import unit_of_work
 from infra.adk_gm_client import AdkGmClient
 from infra.game_memory_service import GameMemoryService
 from infra.gemini_client import GeminiClient
+from infra.model_router import shared_model_router
 from infra.storage_service import StorageService
-from util.logging import get_logger
+from infra.usage_accounting import (
+    UsagePurpose,
+    bind_usage_scope,
+    reset_usage_scope,
+)
+from util.logging import (
+    StageTimer,
+    bind_stage_timer,
+    get_logger,
+    reset_stage_timer,
+    timing_span,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from sqlalchemy.ext.asyncio import AsyncSession
     from sqlmodel import Session
 
     from domain.entity.gm_types import (
         GameContext,
         GmDecisionResponse,
+        SceneNode,
     )
+    from domain.entity.models import Sessions
+    from infra.adk_gm_client import SceneNodeListener
 
 logger = get_logger(__name__)
 GENERATED_IMAGES_BUCKET = "generated-images"
@@ -79,9 +110,10 @@ def _get_adk_client(gemini: GeminiClient) -> AdkGmClient:
     return _adk_client
 
 
-async def _collect_async_gen(gen: AsyncIterator[str]) -> list[str]:
+async def _collect_async_gen(gen: AsyncIterator[str], *, stage: str) -> list[str]:
     """Drain an async generator into a list (for asyncio.gather compatibility)."""
-    return [item async for item in gen]
+    with timing_span(stage):
+        return [item async for item in gen]
 
 
 @dataclass(frozen=True)
@@ -95,7 +127,7 @@ class _DoneMeta:
 
 @dataclass(frozen=True)
 class _TurnStreamParams:
-    db: Session
+    db: Session | AsyncSession
     session_id: uuid.UUID
     scenario_id: object
     decision: GmDecisionResponse
@@ -103,7 +135,94 @@ class _TurnStreamParams:
     done_meta: _DoneMeta
     show_continue_button: bool
     show_continue_input_cta: bool
-    ending_nodes: list[Any] = field(default_factory=list)
+    ending: _EndingNarration | None = None
+    timer: StageTimer | None = None
+
+
+@dataclass(frozen=True)
+class _TurnCommit:
+    request: GmTurnRequest
+    decision: GmDecisionResponse
+    session_id: uuid.UUID
+    context: GameContext
+    game_session: object
+    is_player_action: bool
+
+
+@dataclass(frozen=True)
+class _TurnLoop:
+    request: GmTurnRequest
+    session_id: uuid.UUID
+    game_session: Sessions
+    runtime: GmDecisionRuntime
+    auto_advance_enabled: bool
+    auto_turn_budget: int
+
+
+@dataclass(frozen=True)
+class _PlanStep:
+    input_type: str
+    input_text: str
+    turn_index: int
+
+
+@dataclass(frozen=True)
+class _TurnPlan:
+    request: GmTurnRequest
+    context: GameContext
+    decision: GmDecisionResponse
+    timer: StageTimer
+
+
+@dataclass(frozen=True)
+class _EndingRequest:
+    game_session_id: str
+    scenario_title: str
+    ending_type: str
+    ending_summary: str
+    is_gm_decided: bool
+
+
+@dataclass(frozen=True)
+class _EndingNarration:
+    task: asyncio.Task[list[Any]]
+    relay: _PartialNodeRelay
+
+
+class _PartialNodeRelay:
+    """Relays nodes of an in-flight GM decision as partial SSE events.
+
+    A disabled relay never receives nodes, so ``relay`` only waits for the
+    plan to finish.
+    """
+
+    def __init__(self, *, enabled: bool) -> None:
+        self.enabled = enabled
+        self._nodes: list[SceneNode] = []
+        self._changed = asyncio.Event()
+
+    def push(self, index: int, node: SceneNode) -> None:
+        """Record a streamed node; index 0 starts a new attempt."""
+        if index == 0:
+            self._nodes = []
+        self._nodes.append(node)
+        self._changed.set()
+
+    async def relay(
+        self,
+        plan: asyncio.Future[Any],
+        bridge: GenuiBridgeService,
+    ) -> AsyncIterator[str]:
+        """Yield a partial nodesReady event per change until ``plan`` ends."""
+        while not plan.done():
+            changed = asyncio.ensure_future(self._changed.wait())
+            await asyncio.wait({plan, changed}, return_when=asyncio.FIRST_COMPLETED)
+            changed.cancel()
+            if self._changed.is_set():
+                self._changed.clear()
+                yield bridge.partial_nodes_event(self._nodes)
+        self._nodes = []
+        self._changed.clear()
 
 
 class GmTurnUseCase:
@@ -113,8 +232,21 @@ class GmTurnUseCase:
         self.gemini = GeminiClient()
         self.session_gw = SessionGateway()
         self.turn_gw = TurnGateway()
-        self.context_svc = ContextService()
-        self.decision_svc = GmDecisionService(_get_adk_client(self.gemini))
+        self.context_svc = ContextService(
+            token_budget=_env_int(
+                "GM_PROMPT_TOKEN_BUDGET",
+                default=DEFAULT_PROMPT_TOKEN_BUDGET,
+            ),
+        )
+        self.adk = _get_adk_client(self.gemini)
+        self.decision_svc = GmDecisionService(
+            self.adk,
+            hedge_percentile=(
+                GmDecisionService.DEFAULT_HEDGE_PERCENTILE
+                if _env_bool("GM_HEDGED_DECISIONS", default=False)
+                else None
+            ),
+        )
         self.mutation_svc = StateMutationService()
         self.bridge_svc = GenuiBridgeService()
         self.bgm_svc = BgmService()
@@ -129,6 +261,26 @@ class GmTurnUseCase:
             "GEMINI_INTERACTIONS_ENABLED",
             default=False,
         )
+        self.pipelined_auto_advance = _env_bool(
+            "GM_PIPELINED_AUTO_ADVANCE",
+            default=False,
+        )
+        self.prompt_cache_enabled = _env_bool(
+            "GM_PROMPT_CACHE_ENABLED",
+            default=False,
+        )
+        self.single_call_ending = _env_bool(
+            "GM_SINGLE_CALL_ENDING",
+            default=True,
+        )
+        self.npc_emotion_concurrency = _env_int(
+            "GM_NPC_EMOTION_CONCURRENCY",
+            default=3,
+        )
+        self.prompt_cache = PromptCacheManager(
+            self.gemini,
+            model=shared_model_router.primary(UsagePurpose.DECISION).model,
+        )
 
     @property
     def _storage_svc(self) -> StorageService:
@@ -139,11 +291,18 @@ class GmTurnUseCase:
     async def execute(
         self,
         request: GmTurnRequest,
-        db: Session,
+        db: Session | AsyncSession,
     ) -> AsyncIterator[str]:
-        """Run the full turn pipeline and yield SSE events."""
+        """Run the full turn pipeline and yield SSE events.
+
+        ``db`` may be an AsyncSession (the SSE endpoint) so that queries do not
+        block other streams on the same event loop; gateway calls are routed
+        through run_in_session either way.
+        """
         session_id = uuid.UUID(request.session_id)
-        game_session = self.session_gw.get_by_id(db, session_id)
+        game_session = await run_in_session(
+            db, partial(self.session_gw.get_by_id, session_id=session_id)
+        )
 
         if not game_session or game_session.status != "active":
             yield _error_event("Session not active")
@@ -152,57 +311,77 @@ class GmTurnUseCase:
         auto_advance_enabled = request.auto_advance_until_user_action
         auto_turn_budget = request.max_auto_turns if auto_advance_enabled else 1
         generated_turn_count = 0
-        current_input_type = request.input_type
-        current_input_text = request.input_text
-        is_first_turn = True
         decision_runtime = self._build_decision_runtime(
             auto_advance_enabled=auto_advance_enabled,
             auto_turn_budget=auto_turn_budget,
         )
+        loop = _TurnLoop(
+            request=request,
+            session_id=session_id,
+            game_session=game_session,
+            runtime=decision_runtime,
+            auto_advance_enabled=auto_advance_enabled,
+            auto_turn_budget=auto_turn_budget,
+        )
+        next_plan: asyncio.Task[_TurnPlan] | None = None
+        ending: _EndingNarration | None = None
+        timer = StageTimer()
+        timer_token = bind_stage_timer(timer)
+        usage_token = bind_usage_scope(
+            game_session_id=session_id,
+            scenario_id=game_session.scenario_id,
+        )
 
         try:
+            await run_in_session(
+                db,
+                partial(
+                    self._maybe_clone_npcs,
+                    request,
+                    session_id=session_id,
+                    game_session=game_session,
+                ),
+            )
+            relay = _PartialNodeRelay(enabled=request.stream_nodes)
+            next_plan = self._start_plan(
+                db,
+                loop,
+                _PlanStep(request.input_type, request.input_text, turn_index=0),
+                timer=StageTimer(parent=timer),
+                relay=relay,
+            )
             while True:
-                turn_request = GmTurnRequest(
-                    session_id=request.session_id,
-                    input_type=current_input_type,
-                    input_text=current_input_text,
-                    auto_advance_until_user_action=auto_advance_enabled,
-                    max_auto_turns=auto_turn_budget,
-                )
-
-                if is_first_turn:
-                    self._maybe_clone_npcs(turn_request, db, session_id, game_session)
-                    is_first_turn = False
-
-                # Build context and resolve decision (with turn-limit checks)
-                context = self.context_svc.build_context(db, session_id)
-                should_handoff_with_cta = auto_advance_enabled and (
-                    generated_turn_count + 1 >= auto_turn_budget
-                )
-                auto_section = self._build_auto_advance_addition(
-                    auto_advance_enabled=auto_advance_enabled,
-                    should_handoff_with_cta=should_handoff_with_cta,
-                    input_type=turn_request.input_type,
-                    current_turn=generated_turn_count + 1,
-                    total_turns=auto_turn_budget,
-                )
-                decision = await self._resolve_decision(
-                    context,
-                    turn_request,
-                    game_session_id=str(session_id),
-                    runtime=decision_runtime,
-                    auto_advance_section=auto_section,
+                async for event in relay.relay(next_plan, self.bridge_svc):
+                    yield event
+                plan = await next_plan
+                next_plan = None
+                # The rest of the turn records into the timer its plan used,
+                # so each timing event covers one turn (rolled up in ``timer``).
+                bind_stage_timer(plan.timer)
+                turn_request, context, decision = (
+                    plan.request,
+                    plan.context,
+                    plan.decision,
                 )
 
-                # Apply state mutations and evaluate conditions
-                is_ending = self._apply_and_evaluate(
+                # Apply state mutations and evaluate conditions.  Mutations, the
+                # turn counter and the turn row are written in one transaction
+                # so a turn is never half applied.
+                is_ending, turn_number = await run_in_session(
                     db,
-                    session_id,
-                    context,
-                    decision,
-                    is_player_action=_is_player_action(
-                        current_input_type,
-                        current_input_text,
+                    partial(
+                        self._commit_turn,
+                        commit=_TurnCommit(
+                            request=turn_request,
+                            decision=decision,
+                            session_id=session_id,
+                            context=context,
+                            game_session=game_session,
+                            is_player_action=_is_player_action(
+                                turn_request.input_type,
+                                turn_request.input_text,
+                            ),
+                        ),
                     ),
                 )
 
@@ -210,53 +389,33 @@ class GmTurnUseCase:
                 # whether the GM set session_end itself (route ①) or a
                 # programmatic condition triggered it (routes ②③).
                 # This prevents abrupt story termination in all cases.
-                ending_nodes: list[Any] = []
+                # It runs while this turn's own nodes and assets are streamed.
                 if is_ending:
-                    ending_nodes = await self._resolve_ending_narration(
+                    ending = self._start_ending_narration(
                         db=db,
                         session_id=session_id,
                         context=context,
                         runtime=decision_runtime,
                         is_gm_decided=_has_session_end(decision.state_changes),
+                        relay=_PartialNodeRelay(enabled=request.stream_nodes),
                     )
-
-                # Persist turn
-                turn_number = self._persist_turn(
-                    turn_request, decision, db, game_session
-                )
                 generated_turn_count += 1
 
-                npc_images = self._resolve_npc_images(
+                npc_images = await run_in_session(
                     db,
-                    session_id,
-                    game_session.scenario_id,
-                    decision,
+                    partial(
+                        self._resolve_npc_images,
+                        session_id=session_id,
+                        scenario_id=game_session.scenario_id,
+                        decision=decision,
+                    ),
                 )
 
-                auto_limit_reached = (
-                    auto_advance_enabled and generated_turn_count >= auto_turn_budget
-                )
-                narrate_requires_continue = (not auto_advance_enabled) or (
-                    auto_advance_enabled and auto_limit_reached
-                )
-                show_continue_input_cta = (
-                    auto_limit_reached and decision.decision_type == "narrate"
-                )
-                requires_user_action = _requires_user_action(
+                outcome = _evaluate_outcome(
+                    loop,
                     decision,
-                    narrate_requires_continue=narrate_requires_continue,
-                )
-                will_continue = (
-                    auto_advance_enabled
-                    and not auto_limit_reached
-                    and not requires_user_action
-                    and not is_ending
-                )
-                stop_reason = _build_stop_reason(
+                    generated_turn_count=generated_turn_count,
                     is_ending=is_ending,
-                    requires_user_action=requires_user_action,
-                    auto_limit_reached=auto_limit_reached,
-                    will_continue=will_continue,
                 )
 
                 stream_params = _TurnStreamParams(
@@ -267,32 +426,139 @@ class GmTurnUseCase:
                     npc_images=npc_images,
                     done_meta=_DoneMeta(
                         turn_number=turn_number,
-                        requires_user_action=requires_user_action,
+                        requires_user_action=outcome.requires_user_action,
                         is_ending=is_ending,
-                        will_continue=will_continue,
-                        stop_reason=stop_reason,
+                        will_continue=outcome.will_continue,
+                        stop_reason=outcome.stop_reason,
                     ),
-                    show_continue_button=narrate_requires_continue,
-                    show_continue_input_cta=show_continue_input_cta,
-                    ending_nodes=ending_nodes,
+                    show_continue_button=outcome.narrate_requires_continue,
+                    show_continue_input_cta=outcome.show_continue_input_cta,
+                    ending=ending,
+                    timer=plan.timer if request.include_timing else None,
                 )
+                # Pipelined auto-advance: the next turn's context and GM
+                # decision only depend on the persisted state, so they run
+                # while this turn's assets resolve.  No events are produced
+                # by the plan (pipelined plans never stream nodes), so SSE
+                # order stays canonical.
+                continue_step = _PlanStep("do", "continue", generated_turn_count)
+                if outcome.will_continue and self.pipelined_auto_advance:
+                    next_plan = self._start_plan(
+                        db,
+                        loop,
+                        continue_step,
+                        timer=StageTimer(parent=timer),
+                    )
                 async for event in self._stream_turn_events(stream_params):
                     yield event
 
-                if not will_continue:
+                if not outcome.will_continue:
                     break
-
-                current_input_type = "do"
-                current_input_text = "continue"
+                next_plan = next_plan or self._start_plan(
+                    db,
+                    loop,
+                    continue_step,
+                    timer=StageTimer(parent=timer),
+                    relay=relay,
+                )
         finally:
+            for task in (next_plan, ending.task if ending else None):
+                if task is not None:
+                    task.cancel()
+                    with contextlib.suppress(BaseException):
+                        await task
             logger.info(
                 "Turn generation finished",
                 session_id=str(session_id),
                 total_turns=generated_turn_count,
+                stages=timer.as_dict(),
             )
+            reset_stage_timer(timer_token)
             await self.decision_svc.cleanup_runtime(
                 decision_runtime, game_session_id=str(session_id)
             )
+            self.prompt_cache.release(str(session_id))
+            reset_usage_scope(usage_token)
+
+    def _start_plan(
+        self,
+        db: Session | AsyncSession,
+        loop: _TurnLoop,
+        step: _PlanStep,
+        *,
+        timer: StageTimer,
+        relay: _PartialNodeRelay | None = None,
+    ) -> asyncio.Task[_TurnPlan]:
+        """Schedule ``_plan_turn``; nodes stream into an enabled ``relay``.
+
+        ``timer`` is bound in the task's own context, so a pipelined plan
+        records into its turn while the current turn is still streaming.
+        """
+        context = contextvars.copy_context()
+        context.run(bind_stage_timer, timer)
+        return asyncio.create_task(
+            self._plan_turn(
+                db,
+                loop,
+                step,
+                timer=timer,
+                on_node=relay.push if relay is not None and relay.enabled else None,
+            ),
+            context=context,
+        )
+
+    async def _plan_turn(
+        self,
+        db: Session | AsyncSession,
+        loop: _TurnLoop,
+        step: _PlanStep,
+        *,
+        timer: StageTimer,
+        on_node: SceneNodeListener | None = None,
+    ) -> _TurnPlan:
+        """Build context and resolve the GM decision for one loop turn."""
+        turn_index = step.turn_index
+        turn_request = GmTurnRequest(
+            session_id=loop.request.session_id,
+            input_type=step.input_type,
+            input_text=step.input_text,
+            auto_advance_until_user_action=loop.auto_advance_enabled,
+            max_auto_turns=loop.auto_turn_budget,
+        )
+        # Build context and resolve decision (with turn-limit checks)
+        with timing_span("context"):
+            context = await run_in_session(
+                db,
+                partial(
+                    self.context_svc.build_context,
+                    session_id=loop.session_id,
+                    game_session=loop.game_session,
+                ),
+            )
+        should_handoff_with_cta = loop.auto_advance_enabled and (
+            turn_index + 1 >= loop.auto_turn_budget
+        )
+        auto_section = self._build_auto_advance_addition(
+            auto_advance_enabled=loop.auto_advance_enabled,
+            should_handoff_with_cta=should_handoff_with_cta,
+            input_type=turn_request.input_type,
+            current_turn=turn_index + 1,
+            total_turns=loop.auto_turn_budget,
+        )
+        decision = await self._resolve_decision(
+            context,
+            turn_request,
+            game_session_id=str(loop.session_id),
+            runtime=loop.runtime,
+            auto_advance_section=auto_section,
+            on_node=on_node,
+        )
+        return _TurnPlan(
+            request=turn_request,
+            context=context,
+            decision=decision,
+            timer=timer,
+        )
 
     def get_latest_turn(
         self, session_id: str, db: Session
@@ -367,6 +633,7 @@ class GmTurnUseCase:
         sid = game_session.scenario_id  # type: ignore[attr-defined]
         state = game_session.current_state  # type: ignore[attr-defined]
         self.clone_svc.clone_npcs_for_session(db, sid, session_id, state)
+        self.context_svc.cache.invalidate(session_id)
 
     async def _stream_turn_events(
         self,
@@ -386,6 +653,36 @@ class GmTurnUseCase:
                 continue
             yield event
 
+        async for event in self._stream_pre_done_events(params):
+            yield event
+
+        # Unlock user interaction after BGM, backgrounds, and NPC default
+        # portraits are resolved. Only NPC emotion variants may arrive after
+        # done -- they have fallback images on the frontend side.
+        if done_event_seen and params.done_meta.requires_user_action:
+            done_emitted = True
+            for event in _done_events(params):
+                yield event
+
+        if params.decision.nodes:
+            with timing_span("npc_emotion_images"):
+                async for event in self._resolve_npc_emotion_assets(
+                    params.db,
+                    params.session_id,
+                    params.decision.nodes,
+                    params.npc_images,
+                ):
+                    yield event
+
+        if done_event_seen and not done_emitted:
+            for event in _done_events(params):
+                yield event
+
+    async def _stream_pre_done_events(
+        self,
+        params: _TurnStreamParams,
+    ) -> AsyncIterator[str]:
+        """Yield asset events and closing narration that precede done."""
         # Resolve BGM, backgrounds, and NPC default portraits in parallel so
         # the frontend receives all pre-done assets as quickly as possible.
         # _resolve_npc_default_images mutates npc_images in-place; the
@@ -397,14 +694,16 @@ class GmTurnUseCase:
                     params.db,
                     params.scenario_id,
                     params.decision,
-                )
+                ),
+                stage="bgm",
             ),
             _collect_async_gen(
                 self._resolve_backgrounds(
                     params.db,
                     params.session_id,
                     params.decision,
-                )
+                ),
+                stage="backgrounds",
             ),
             _collect_async_gen(
                 self._resolve_npc_default_images(
@@ -412,54 +711,20 @@ class GmTurnUseCase:
                     params.session_id,
                     params.decision.nodes or [],
                     params.npc_images,
-                )
+                ),
+                stage="npc_default_images",
             ),
         )
         for event in (*bgm_events, *bg_events, *npc_default_events):
             yield event
 
-        # Stream condition-triggered ending narration nodes before done event.
-        # These are generated by a second GM call when win/fail conditions fire
-        # programmatically (without the GM setting session_end itself).
-        if params.ending_nodes:
-            yield _nodes_ready_event(params.ending_nodes)
-
-        # Unlock user interaction after BGM, backgrounds, and NPC default
-        # portraits are resolved. Only NPC emotion variants may arrive after
-        # done -- they have fallback images on the frontend side.
-        if (
-            done_event_seen
-            and params.done_meta.requires_user_action
-            and not done_emitted
-        ):
-            done_emitted = True
-            yield _done_event(
-                turn_number=params.done_meta.turn_number,
-                requires_user_action=params.done_meta.requires_user_action,
-                is_ending=params.done_meta.is_ending,
-                will_continue=params.done_meta.will_continue,
-                stop_reason=params.done_meta.stop_reason,
-            )
-
-        if params.decision.nodes:
-            async for event in self._resolve_npc_emotion_assets(
-                params.db,
-                params.session_id,
-                params.decision.nodes,
-                params.npc_images,
-            ):
+        # Stream closing narration nodes before the done event.  They come
+        # from a separate GM call started when the turn ended the session.
+        if params.ending is not None:
+            async for event in self._stream_ending(params.ending):
                 yield event
 
-        if done_event_seen and not done_emitted:
-            yield _done_event(
-                turn_number=params.done_meta.turn_number,
-                requires_user_action=params.done_meta.requires_user_action,
-                is_ending=params.done_meta.is_ending,
-                will_continue=params.done_meta.will_continue,
-                stop_reason=params.done_meta.stop_reason,
-            )
-
-    async def _resolve_decision(
+    async def _resolve_decision(  # noqa: PLR0913
         self,
         context: GameContext,
         request: GmTurnRequest,
@@ -467,39 +732,55 @@ class GmTurnUseCase:
         game_session_id: str,
         runtime: GmDecisionRuntime | None = None,
         auto_advance_section: str = "",
+        on_node: SceneNodeListener | None = None,
     ) -> GmDecisionResponse:
         """Check turn limits and return the appropriate decision."""
         cur = context.current_turn_number
         mx = context.max_turns
         is_hard_limit = self.turn_limit_svc.is_hard_limit_reached(cur, mx)
 
-        luck = self.resolution_svc.generate_luck_factor()
-        resolution_ctx = self.resolution_svc.build_resolution_context(
-            player_stats=dict(context.player.stats),
-            luck_roll=luck,
-        )
-        hard_limit_section = (
-            self.turn_limit_svc.build_hard_limit_prompt_addition(mx)
-            if is_hard_limit
-            else ""
-        )
-        extra_sections = [
-            self._build_soft_addition(context),
-            self._build_condition_progress(context),
-            resolution_ctx,
-            auto_advance_section,
-            hard_limit_section,
-        ]
-        # ADK が use_interactions_api でコンテキストを内部管理するため、
-        # 常にフルプロンプトを送信する。
-        prompt = self.context_svc.build_prompt(
-            context,
-            request.input_type,
-            request.input_text,
-            extra_sections=extra_sections,
-        )
+        with timing_span("prompt_cache"):
+            cached_content = await self._acquire_prompt_cache(
+                context,
+                game_session_id=game_session_id,
+            )
+        with timing_span("prompt"):
+            luck = self.resolution_svc.generate_luck_factor()
+            resolution_ctx = self.resolution_svc.build_resolution_context(
+                player_stats=dict(context.player.stats),
+                luck_roll=luck,
+            )
+            hard_limit_section = (
+                self.turn_limit_svc.build_hard_limit_prompt_addition(mx)
+                if is_hard_limit
+                else ""
+            )
+            extra_sections = [
+                self._build_soft_addition(context),
+                self._build_condition_progress(context),
+                resolution_ctx,
+                auto_advance_section,
+                hard_limit_section,
+            ]
+            # シナリオ固定部分を明示キャッシュに置けた場合は差分のみ送信し、
+            # それ以外はフルプロンプトを送信する。
+            build = (
+                self.context_svc.build_prompt_delta
+                if cached_content
+                else self.context_svc.build_prompt
+            )
+            prompt = build(
+                context,
+                request.input_type,
+                request.input_text,
+                extra_sections=extra_sections,
+            )
         decision = await self.decision_svc.decide(
-            prompt, game_session_id=game_session_id, runtime=runtime
+            prompt,
+            game_session_id=game_session_id,
+            runtime=runtime,
+            cached_content=cached_content,
+            on_node=on_node,
         )
 
         # Fallback: force session_end if GM omitted it at hard limit
@@ -523,6 +804,29 @@ class GmTurnUseCase:
                 )
         return decision
 
+    async def _acquire_prompt_cache(
+        self,
+        context: GameContext,
+        *,
+        game_session_id: str,
+    ) -> str | None:
+        """Return the scenario's explicit prompt cache name, if enabled."""
+        if not self.prompt_cache_enabled or context.scenario_id is None:
+            return None
+        seed = self.context_svc.build_prompt_cache_seed(context)
+        key = PromptCacheKey.build(
+            context.scenario_id,
+            system_instruction=GM_SYSTEM_PROMPT,
+            seed=seed,
+        )
+        cache_name: str | None = await self.prompt_cache.acquire(
+            key,
+            holder=game_session_id,
+            system_instruction=GM_SYSTEM_PROMPT,
+            seed=seed,
+        )
+        return cache_name
+
     @staticmethod
     def _build_auto_advance_addition(
         *,
@@ -592,6 +896,35 @@ class GmTurnUseCase:
         )
         return str(self.condition_svc.build_progress_prompt(result))
 
+    def _commit_turn(self, db: Session, commit: _TurnCommit) -> tuple[bool, int]:
+        """Apply mutations and persist the turn as one unit of work.
+
+        Returns (is_ending, turn_number).  On failure the transaction is
+        rolled back and the cached context, which may already mirror the
+        mutations, is dropped.
+        """
+        try:
+            with unit_of_work(db):
+                with timing_span("mutation"):
+                    is_ending = self._apply_and_evaluate(
+                        db,
+                        commit.session_id,
+                        commit.context,
+                        commit.decision,
+                        is_player_action=commit.is_player_action,
+                    )
+                with timing_span("persist"):
+                    turn_number = self._persist_turn(
+                        commit.request,
+                        commit.decision,
+                        db,
+                        commit.game_session,
+                    )
+        except Exception:
+            self.context_svc.cache.invalidate(commit.session_id)
+            raise
+        return is_ending, turn_number
+
     def _apply_and_evaluate(
         self,
         db: Session,
@@ -680,14 +1013,48 @@ class GmTurnUseCase:
             return True
         return False
 
-    async def _resolve_ending_narration(
+    def _start_ending_narration(  # noqa: PLR0913
         self,
         *,
-        db: Session,
+        db: Session | AsyncSession,
+        session_id: uuid.UUID,
+        context: GameContext,
+        runtime: GmDecisionRuntime | None,
+        is_gm_decided: bool,
+        relay: _PartialNodeRelay,
+    ) -> _EndingNarration:
+        """Schedule ``_resolve_ending_narration``; nodes stream into ``relay``."""
+
+        async def narrate() -> list[Any]:
+            with timing_span("ending_narration"):
+                return await self._resolve_ending_narration(
+                    db=db,
+                    session_id=session_id,
+                    context=context,
+                    runtime=runtime,
+                    is_gm_decided=is_gm_decided,
+                    on_node=relay.push if relay.enabled else None,
+                )
+
+        return _EndingNarration(task=asyncio.create_task(narrate()), relay=relay)
+
+    async def _stream_ending(self, ending: _EndingNarration) -> AsyncIterator[str]:
+        """Relay closing nodes as they are generated, then the full list."""
+        async for event in ending.relay.relay(ending.task, self.bridge_svc):
+            yield event
+        nodes = await ending.task
+        if nodes:
+            yield _nodes_ready_event(nodes)
+
+    async def _resolve_ending_narration(  # noqa: PLR0913
+        self,
+        *,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         context: GameContext,
         runtime: GmDecisionRuntime | None,
         is_gm_decided: bool,
+        on_node: SceneNodeListener | None = None,
     ) -> list[Any]:
         """Return ending narration nodes for any ending route.
 
@@ -697,27 +1064,82 @@ class GmTurnUseCase:
         is_gm_decided=True  → Route ①: GM itself set session_end.
         is_gm_decided=False → Routes ②③: programmatic condition triggered.
         """
-        updated_session = self.session_gw.get_by_id(db, session_id)
+        updated_session = await run_in_session(
+            db, partial(self.session_gw.get_by_id, session_id=session_id)
+        )
         ending_type = str(getattr(updated_session, "ending_type", None) or "bad_end")
         ending_summary = str(getattr(updated_session, "ending_summary", None) or "")
-        return await self._generate_ending_narration(
-            context=context,
+        ending = _EndingRequest(
+            game_session_id=str(session_id),
+            scenario_title=context.scenario_title,
             ending_type=ending_type,
             ending_summary=ending_summary,
             is_gm_decided=is_gm_decided,
-            runtime=runtime,
         )
+        if self.single_call_ending:
+            return await self._generate_ending_sequence(
+                ending,
+                runtime=runtime,
+                on_node=on_node,
+            )
+        return await self._generate_ending_narration(ending, runtime=runtime)
+
+    async def _generate_ending_sequence(
+        self,
+        ending: _EndingRequest,
+        *,
+        runtime: GmDecisionRuntime | None,
+        on_node: SceneNodeListener | None,
+    ) -> list[Any]:
+        """Generate the whole closing sequence with one GM call.
+
+        Nodes beyond MAX_ENDING_NODES are dropped, both from the result and
+        before they reach ``on_node``.  Returns [] on failure.
+        """
+        prompt = build_ending_sequence_prompt(
+            scenario_title=ending.scenario_title,
+            ending_type=ending.ending_type,
+            ending_summary=ending.ending_summary,
+            is_gm_decided=ending.is_gm_decided,
+        )
+        logger.info(
+            "Requesting ending narration sequence",
+            max_nodes=MAX_ENDING_NODES,
+            ending_type=ending.ending_type,
+            is_gm_decided=ending.is_gm_decided,
+        )
+        capped_on_node: SceneNodeListener | None = None
+        if on_node is not None:
+            listener = on_node
+
+            def capped_on_node(index: int, node: SceneNode) -> None:
+                if index < MAX_ENDING_NODES:
+                    listener(index, node)
+
+        try:
+            decision = await self.decision_svc.decide(
+                prompt,
+                game_session_id=ending.game_session_id,
+                runtime=runtime,
+                on_node=capped_on_node,
+                purpose=UsagePurpose.ENDING,
+            )
+        except Exception:
+            logger.warning(
+                "Ending narration failed",
+                ending_type=ending.ending_type,
+                exc_info=True,
+            )
+            return []
+        return (decision.nodes or [])[:MAX_ENDING_NODES]
 
     async def _generate_ending_narration(
         self,
+        ending: _EndingRequest,
         *,
-        context: GameContext,
-        ending_type: str,
-        ending_summary: str,
-        is_gm_decided: bool,
         runtime: GmDecisionRuntime | None,
     ) -> list[Any]:
-        """Generate closing narration for any session-ending route.
+        """Generate closing narration turn by turn (GM_SINGLE_CALL_ENDING=0).
 
         Loops up to MAX_CLOSING_TURNS, continuing until the GM includes
         session_end or the turn limit is reached.  Returns all collected
@@ -726,30 +1148,31 @@ class GmTurnUseCase:
         all_nodes: list[Any] = []
         for turn_num in range(1, MAX_CLOSING_TURNS + 1):
             prompt = build_ending_narration_prompt(
-                scenario_title=context.scenario_title,
-                ending_type=ending_type,
-                ending_summary=ending_summary,
+                scenario_title=ending.scenario_title,
+                ending_type=ending.ending_type,
+                ending_summary=ending.ending_summary,
                 turn_number=turn_num,
-                is_gm_decided=is_gm_decided,
+                is_gm_decided=ending.is_gm_decided,
             )
             logger.info(
                 "Requesting ending narration turn",
                 turn=turn_num,
                 max_turns=MAX_CLOSING_TURNS,
-                ending_type=ending_type,
-                is_gm_decided=is_gm_decided,
+                ending_type=ending.ending_type,
+                is_gm_decided=ending.is_gm_decided,
             )
             try:
                 decision = await self.decision_svc.decide(
                     prompt,
-                    game_session_id=context.session_id,
+                    game_session_id=ending.game_session_id,
                     runtime=runtime,
+                    purpose=UsagePurpose.ENDING,
                 )
             except Exception:
                 logger.warning(
                     "Ending narration failed; stopping early",
                     turn=turn_num,
-                    ending_type=ending_type,
+                    ending_type=ending.ending_type,
                     exc_info=True,
                 )
                 break
@@ -760,7 +1183,7 @@ class GmTurnUseCase:
                 logger.info(
                     "GM concluded ending narration",
                     turn=turn_num,
-                    ending_type=ending_type,
+                    ending_type=ending.ending_type,
                 )
                 break
 
@@ -768,7 +1191,7 @@ class GmTurnUseCase:
 
     async def _resolve_bgm(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         scenario_id: object,
         decision: GmDecisionResponse,
     ) -> AsyncIterator[str]:
@@ -782,7 +1205,14 @@ class GmTurnUseCase:
             return
 
         try:
-            cached_path = self.bgm_svc.get_cached_bgm_path(db, scenario_id, mood)
+            cached_path = await run_in_session(
+                db,
+                partial(
+                    self.bgm_svc.get_cached_bgm_path,
+                    scenario_id=scenario_id,
+                    mood=mood,
+                ),
+            )
         except Exception as exc:
             logger.warning(
                 "BGM cache lookup failed; skipping BGM for this turn",
@@ -819,12 +1249,7 @@ class GmTurnUseCase:
             )
 
         try:
-            await self.bgm_svc.generate_and_cache(
-                db=db,
-                scenario_id=scenario_id,
-                mood=mood,
-                music_prompt=prompt,
-            )
+            await self._generate_bgm(db, scenario_id, mood, prompt)
         except Exception as exc:
             logger.warning(
                 "BGM generation failed; skipping BGM for this turn",
@@ -833,7 +1258,14 @@ class GmTurnUseCase:
                 error=str(exc),
             )
             return
-        generated_path = self.bgm_svc.get_cached_bgm_path(db, scenario_id, mood)
+        generated_path = await run_in_session(
+            db,
+            partial(
+                self.bgm_svc.get_cached_bgm_path,
+                scenario_id=scenario_id,
+                mood=mood,
+            ),
+        )
         if generated_path:
             logger.info(
                 "BGM generated and cached",
@@ -843,6 +1275,35 @@ class GmTurnUseCase:
             )
             yield _bgm_update_event(f"generated-bgm/{generated_path}", mood)
 
+    async def _generate_bgm(
+        self,
+        db: Session | AsyncSession,
+        scenario_id: uuid.UUID,
+        mood: str,
+        prompt: str,
+    ) -> None:
+        """Generate and cache BGM for scenario+mood.
+
+        BgmService drives its cache reads/writes on a synchronous Session
+        across awaits, so an AsyncSession cannot be handed to it.  In that
+        case the detached variant opens short-lived sessions of its own and
+        the request session is not held for the whole generation.
+        """
+        if is_async_session(db):
+            await self.bgm_svc.generate_and_cache_detached(
+                scenario_id,
+                mood,
+                prompt,
+                session_factory=self._new_bgm_session,
+            )
+            return
+        await self.bgm_svc.generate_and_cache(
+            db=db,
+            scenario_id=scenario_id,
+            mood=mood,
+            music_prompt=prompt,
+        )
+
     @staticmethod
     def _fallback_bgm_prompt(
         decision: GmDecisionResponse,
@@ -865,7 +1326,7 @@ class GmTurnUseCase:
 
     async def _resolve_backgrounds(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         decision: GmDecisionResponse,
     ) -> AsyncIterator[str]:
@@ -878,7 +1339,9 @@ class GmTurnUseCase:
             ):
                 yield event
         else:
-            image_ref = self._resolve_background_image(db, decision)
+            image_ref = await run_in_session(
+                db, partial(self._resolve_background_image, decision=decision)
+            )
             if image_ref:
                 yield _image_event(image_ref)
             elif decision.scene_description:
@@ -973,20 +1436,20 @@ class GmTurnUseCase:
         db: Session,
         game_session: object,
     ) -> int:
-        """Increment turn counter and save the turn record."""
+        """Allocate the next turn number and save the turn record."""
         sid = game_session.id  # type: ignore[attr-defined]
-        new_turn_number: int = self.session_gw.increment_turn(db, sid)
         turn = Turns(
             id=uuid.uuid4(),
             session_id=sid,
-            turn_number=new_turn_number,
+            turn_number=0,  # assigned by create_next
             input_type=request.input_type,
             input_text=request.input_text,
             gm_decision_type=decision.decision_type,
             output=decision.model_dump(),
             created_at=datetime.now(UTC),
         )
-        self.turn_gw.create(db, turn)
+        new_turn_number: int = self.turn_gw.create_next(db, turn)
+        self.context_svc.record_turn(turn)
         logger.info(
             "Turn generated",
             session_id=str(sid),
@@ -997,7 +1460,7 @@ class GmTurnUseCase:
 
     async def _resolve_node_assets(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         nodes: list[Any],
     ) -> AsyncIterator[str]:
@@ -1012,7 +1475,9 @@ class GmTurnUseCase:
             # Try UUID lookup first
             try:
                 bg_id = uuid.UUID(bg_key)
-                bg = self.bg_gw.find_by_id(db, bg_id)
+                bg = await run_in_session(
+                    db, partial(self.bg_gw.find_by_id, bg_id=bg_id)
+                )
                 if bg and bg.image_path:
                     bucket = (
                         SCENARIO_ASSETS_BUCKET
@@ -1027,10 +1492,13 @@ class GmTurnUseCase:
             except ValueError:
                 pass
             # Try description-based cache lookup
-            cached = self.bg_gw.find_by_description(
+            cached = await run_in_session(
                 db,
-                session_id,
-                bg_key,
+                partial(
+                    self.bg_gw.find_by_description,
+                    session_id=session_id,
+                    description=bg_key,
+                ),
             )
             if cached and cached.image_path:
                 yield _asset_ready_event(
@@ -1056,22 +1524,20 @@ class GmTurnUseCase:
                 logger.warning("Node asset generation failed", key=desc)
                 continue
             try:
-                storage_path = await asyncio.to_thread(
-                    self._storage_svc.upload_image,
+                storage_path = await self._storage_svc.upload_image(
                     str(session_id),
                     result,
                 )
-                self.bg_gw.create(
-                    db,
-                    SceneBackgrounds(
-                        id=uuid.uuid4(),
-                        session_id=session_id,
-                        location_name=desc[:100],
-                        image_path=storage_path,
-                        description=desc,
-                        created_at=datetime.now(UTC),
-                    ),
+                record = SceneBackgrounds(
+                    id=uuid.uuid4(),
+                    session_id=session_id,
+                    location_name=desc[:100],
+                    image_path=storage_path,
+                    description=desc,
+                    created_at=datetime.now(UTC),
                 )
+                await run_in_session(db, partial(self.bg_gw.create, record=record))
+                self.context_svc.record_background(record)
                 yield _asset_ready_event(
                     desc,
                     f"{GENERATED_IMAGES_BUCKET}/{storage_path}",
@@ -1081,7 +1547,7 @@ class GmTurnUseCase:
 
     async def _resolve_npc_default_images(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         nodes: list[Any],
         npc_images: NpcImageMap,
@@ -1119,7 +1585,7 @@ class GmTurnUseCase:
 
     async def _resolve_npc_emotion_assets(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         nodes: list[Any],
         npc_images: NpcImageMap,
@@ -1127,15 +1593,17 @@ class GmTurnUseCase:
         """Resolve NPC emotion images for scene nodes (post-done).
 
         Default portraits are emitted by _resolve_npc_default_images() before
-        the done event.  This method handles only emotion variants.
+        the done event.  This method handles only emotion variants: cached
+        ones are emitted at once, missing ones are generated concurrently and
+        emitted as each finishes.
         """
         chars = _collect_npc_character_assets(nodes)
         if not chars:
             return
 
         sent: set[str] = set()
-        # Mutable copy so generated emotion paths are visible within the loop.
-        npc_images = dict(npc_images)
+        # In first-appearance order, so the earliest node's portrait starts first.
+        missing: list[tuple[str, str]] = []
 
         for npc_name, expression in chars:
             _, emotion_map = npc_images.get(
@@ -1156,26 +1624,64 @@ class GmTurnUseCase:
                 )
                 continue
 
-            if not expression:
-                continue
+            if expression:
+                missing.append((npc_name, expression))
 
-            # Generate missing emotion image
-            event = await self._generate_npc_emotion(
-                db,
-                session_id,
-                npc_name,
-                expression,
-                npc_images,
-            )
-            if event:
-                yield _asset_ready_event(
-                    asset_key,
-                    event,
+        async for asset_key, path in self._generate_npc_emotions(
+            db,
+            session_id,
+            missing,
+            npc_images,
+        ):
+            yield _asset_ready_event(asset_key, path)
+
+    async def _generate_npc_emotions(
+        self,
+        db: Session | AsyncSession,
+        session_id: uuid.UUID,
+        missing: list[tuple[str, str]],
+        npc_images: NpcImageMap,
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Generate missing emotion images, yielding (asset_key, path) pairs.
+
+        At most ``npc_emotion_concurrency`` generations run at once.  Tasks
+        are created in ``missing`` order and the semaphore admits waiters
+        first-in first-out, so generations start in that order; results are
+        yielded in completion order.  Failed generations (None) are skipped.
+        """
+        if not missing:
+            return
+        slots = asyncio.Semaphore(self.npc_emotion_concurrency)
+
+        async def generate(npc_name: str, expression: str) -> tuple[str, str | None]:
+            async with slots:
+                path = await self._generate_npc_emotion(
+                    db,
+                    session_id,
+                    npc_name,
+                    expression,
+                    npc_images,
                 )
+            return f"npc:{npc_name}:{expression}", path
+
+        tasks = [
+            asyncio.create_task(generate(npc_name, expression))
+            for npc_name, expression in missing
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                asset_key, path = await next_done
+                if path:
+                    yield asset_key, path
+        finally:
+            # Wait for cancelled generations so none outlives its use of db.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _generate_npc_default_image(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         npc_name: str,
     ) -> str | None:
@@ -1186,7 +1692,14 @@ class GmTurnUseCase:
         turns can reuse it without re-generating.
         Returns ``{bucket}/{path}`` on success, None on failure.
         """
-        npc_rec = self.npc_gw.find_by_name_and_session(db, session_id, npc_name)
+        npc_rec = await run_in_session(
+            db,
+            partial(
+                self.npc_gw.find_by_name_and_session,
+                session_id=session_id,
+                name=npc_name,
+            ),
+        )
         profile_desc = ""
         if npc_rec and npc_rec.profile:
             profile_desc = str(npc_rec.profile.get("description", ""))
@@ -1207,14 +1720,20 @@ class GmTurnUseCase:
             if not image_bytes:
                 return None
 
-            storage_path = await asyncio.to_thread(
-                self._storage_svc.upload_image,
+            storage_path = await self._storage_svc.upload_image(
                 str(session_id),
                 image_bytes,
             )
 
             if npc_rec:
-                self.npc_gw.update_image_path(db, npc_rec.id, storage_path)
+                await run_in_session(
+                    db,
+                    partial(
+                        self.npc_gw.update_image_path,
+                        npc_id=npc_rec.id,
+                        image_path=storage_path,
+                    ),
+                )
 
             return f"{GENERATED_IMAGES_BUCKET}/{storage_path}"
         except Exception:
@@ -1226,7 +1745,7 @@ class GmTurnUseCase:
 
     async def _generate_npc_emotion(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         npc_name: str,
         expression: str,
@@ -1236,10 +1755,13 @@ class GmTurnUseCase:
 
         Returns the storage path string on success, None on failure.
         """
-        npc_rec = self.npc_gw.find_by_name_and_session(
+        npc_rec = await run_in_session(
             db,
-            session_id,
-            npc_name,
+            partial(
+                self.npc_gw.find_by_name_and_session,
+                session_id=session_id,
+                name=npc_name,
+            ),
         )
         profile_desc = ""
         if npc_rec and npc_rec.profile:
@@ -1267,8 +1789,7 @@ class GmTurnUseCase:
             if not image_bytes:
                 return None
 
-            storage_path = await asyncio.to_thread(
-                self._storage_svc.upload_image,
+            storage_path = await self._storage_svc.upload_image(
                 str(session_id),
                 image_bytes,
             )
@@ -1276,18 +1797,18 @@ class GmTurnUseCase:
             # Cache in DB
             if npc_rec:
                 has_default = bool(npc_images.get(npc_name, (None,))[0])
-                if not has_default:
-                    self.npc_gw.update_image_path(
-                        db,
+
+                def _cache(s: Session) -> None:
+                    if not has_default:
+                        self.npc_gw.update_image_path(s, npc_rec.id, storage_path)
+                    self.npc_gw.update_emotion_image(
+                        s,
                         npc_rec.id,
+                        expression,
                         storage_path,
                     )
-                self.npc_gw.update_emotion_image(
-                    db,
-                    npc_rec.id,
-                    expression,
-                    storage_path,
-                )
+
+                await run_in_session(db, _cache)
 
             return f"{GENERATED_IMAGES_BUCKET}/{storage_path}"
         except Exception:
@@ -1306,15 +1827,12 @@ class GmTurnUseCase:
         if not default_path:
             return None
         bucket, path = _resolve_npc_bucket_and_path(default_path)
-        return await asyncio.to_thread(
-            self._storage_svc.download_image,
-            path,
-            bucket,
-        )
+        image: bytes | None = await self._storage_svc.download_image(path, bucket)
+        return image
 
     async def _generate_and_upload_image(
         self,
-        db: Session,
+        db: Session | AsyncSession,
         session_id: uuid.UUID,
         description: str,
     ) -> str | None:
@@ -1326,25 +1844,22 @@ class GmTurnUseCase:
             if not image_bytes:
                 return None
 
-            storage_path = await asyncio.to_thread(
-                self._storage_svc.upload_image,
+            storage_path = await self._storage_svc.upload_image(
                 str(session_id),
                 image_bytes,
             )
 
             # Cache the generated background for reuse
-            location_name = description[:100]
-            self.bg_gw.create(
-                db,
-                SceneBackgrounds(
-                    id=uuid.uuid4(),
-                    session_id=session_id,
-                    location_name=location_name,
-                    image_path=storage_path,
-                    description=description,
-                    created_at=datetime.now(UTC),
-                ),
+            record = SceneBackgrounds(
+                id=uuid.uuid4(),
+                session_id=session_id,
+                location_name=description[:100],
+                image_path=storage_path,
+                description=description,
+                created_at=datetime.now(UTC),
             )
+            await run_in_session(db, partial(self.bg_gw.create, record=record))
+            self.context_svc.record_background(record)
 
             return f"{GENERATED_IMAGES_BUCKET}/{storage_path}"
         except Exception:
@@ -1559,6 +2074,42 @@ def _done_event(
     return f"data: {payload}\n\n"
 
 
+def _timing_event(timer: StageTimer, *, turn_number: int) -> str:
+    """Build an SSE timing event with one turn's per-stage durations in ms.
+
+    ``total`` runs from the start of the turn's plan, so for a pipelined
+    auto-advance turn it overlaps the previous turn's streaming.
+    """
+    payload = json.dumps(
+        {
+            "type": "timing",
+            "turn_number": turn_number,
+            "stages": timer.as_dict(),
+            "server_timing": timer.server_timing(),
+        },
+        ensure_ascii=False,
+    )
+    return f"data: {payload}\n\n"
+
+
+def _done_events(params: _TurnStreamParams) -> list[str]:
+    """Build the done event, preceded by a timing event when requested."""
+    meta = params.done_meta
+    events: list[str] = []
+    if params.timer is not None:
+        events.append(_timing_event(params.timer, turn_number=meta.turn_number))
+    events.append(
+        _done_event(
+            turn_number=meta.turn_number,
+            requires_user_action=meta.requires_user_action,
+            is_ending=meta.is_ending,
+            will_continue=meta.will_continue,
+            stop_reason=meta.stop_reason,
+        ),
+    )
+    return events
+
+
 def _is_done_event(raw_event: str) -> bool:
     """Return whether SSE raw string is a `{type: done}` payload."""
     line = raw_event.strip()
@@ -1574,6 +2125,56 @@ def _is_done_event(raw_event: str) -> bool:
     return decoded.get("type") == "done"
 
 
+@dataclass(frozen=True)
+class _TurnOutcome:
+    narrate_requires_continue: bool
+    show_continue_input_cta: bool
+    requires_user_action: bool
+    will_continue: bool
+    stop_reason: str
+
+
+def _evaluate_outcome(
+    loop: _TurnLoop,
+    decision: GmDecisionResponse,
+    *,
+    generated_turn_count: int,
+    is_ending: bool,
+) -> _TurnOutcome:
+    """Decide whether the auto-advance loop continues after this turn."""
+    auto_advance_enabled = loop.auto_advance_enabled
+    auto_limit_reached = (
+        auto_advance_enabled and generated_turn_count >= loop.auto_turn_budget
+    )
+    narrate_requires_continue = (not auto_advance_enabled) or (
+        auto_advance_enabled and auto_limit_reached
+    )
+    requires_user_action = _requires_user_action(
+        decision,
+        narrate_requires_continue=narrate_requires_continue,
+    )
+    will_continue = (
+        auto_advance_enabled
+        and not auto_limit_reached
+        and not requires_user_action
+        and not is_ending
+    )
+    return _TurnOutcome(
+        narrate_requires_continue=narrate_requires_continue,
+        show_continue_input_cta=(
+            auto_limit_reached and decision.decision_type == "narrate"
+        ),
+        requires_user_action=requires_user_action,
+        will_continue=will_continue,
+        stop_reason=_build_stop_reason(
+            is_ending=is_ending,
+            requires_user_action=requires_user_action,
+            auto_limit_reached=auto_limit_reached,
+            will_continue=will_continue,
+        ),
+    )
+
+
 def _requires_user_action(
     decision: GmDecisionResponse,
     *,
@@ -0,0 +1,25 @@
+"""DATABASE_URL を asyncpg ドライバ向けに変換するヘルパー."""
+
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+
+def to_asyncpg_url(raw_url: str) -> tuple[str, dict[str, object]]:
+    """DATABASE_URL を asyncpg 用 URL と connect_args に変換する.
+
+    dialect を ``postgresql+asyncpg://`` に統一する。asyncpg は URL クエリの
+    sslmode を解釈しないため (asyncpg#737)、sslmode=require が含まれる場合は
+    URL から除去して connect_args["ssl"]=True に変換する。
+    """
+    rest = raw_url.split("://", 1)[1]
+    parsed = urlparse(f"postgresql+asyncpg://{rest}")
+    query = parse_qs(parsed.query)
+    sslmode = query.pop("sslmode", [None])[0]
+    clean_url = urlunparse(
+        parsed._replace(query=urlencode({k: v[0] for k, v in query.items()}))
+    )
+    connect_args: dict[str, object] = {}
+    if sslmode == "require":
+        connect_args["ssl"] = True
+    return clean_url, connect_args
@@ -0,0 +1,27 @@
+"""Parsing of numeric tuning knobs from environment variables.
+
+Malformed or non-positive values fall back to the default instead of
+failing startup, so a typo in a deployment only loses the override.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def env_positive_int(name: str, *, default: int) -> int:
+    """Parse a positive int env var; anything else uses ``default``."""
+    try:
+        parsed = int(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def env_positive_float[D: (float, None)](name: str, *, default: D) -> float | D:
+    """Parse a positive float env var; anything else uses ``default``."""
+    try:
+        parsed = float(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
@@ -0,0 +1,93 @@
+"""Incremental extraction of array elements from a streamed JSON object.
+
+LLM structured output arrives as text chunks of a single JSON object.  The
+parser tracks just enough lexical state (nesting depth, strings, escapes,
+the current top-level key) to notice when an object element of one
+top-level array has closed, so it can be validated and used before the rest
+of the document has been generated.  It never validates the JSON itself;
+the complete text is still parsed normally once generation finishes.
+"""
+
+from __future__ import annotations
+
+
+class IncrementalArrayParser:
+    """Yield raw JSON for each completed object in ``document[key]``."""
+
+    def __init__(self, key: str) -> None:
+        self._key = key
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: str | None = None
+        self._current_key: str | None = None
+        self._array_depth: int | None = None
+        self._array_closed = False
+        self._element_start: int | None = None
+
+    def feed(self, chunk: str) -> list[str]:
+        """Consume ``chunk`` and return elements completed by it, in order."""
+        self._text += chunk
+        text = self._text
+        completed: list[str] = []
+        while self._pos < len(text):
+            element = self._step(text, self._pos)
+            self._pos += 1
+            if element is not None:
+                completed.append(element)
+        return completed
+
+    def _step(self, text: str, i: int) -> str | None:
+        ch = text[i]
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._last_string = text[self._string_start : i]
+            return None
+        if ch == '"':
+            self._in_string = True
+            self._string_start = i + 1
+        elif ch == ":" and self._depth == 1:
+            self._current_key = self._last_string
+        elif ch in "{[":
+            self._open(ch, i)
+        elif ch in "}]":
+            return self._close(ch, text, i)
+        return None
+
+    def _open(self, ch: str, i: int) -> None:
+        if (
+            ch == "["
+            and self._depth == 1
+            and self._current_key == self._key
+            and not self._array_closed
+        ):
+            self._array_depth = self._depth + 1
+        elif ch == "{" and self._array_depth == self._depth:
+            self._element_start = i
+        self._depth += 1
+
+    def _close(self, ch: str, text: str, i: int) -> str | None:
+        self._depth -= 1
+        if self._array_depth is None:
+            return None
+        if ch == "]" and self._depth + 1 == self._array_depth:
+            self._array_depth = None
+            self._array_closed = True
+            return None
+        if (
+            ch == "}"
+            and self._depth == self._array_depth
+            and self._element_start is not None
+        ):
+            element = text[self._element_start : i + 1]
+            self._element_start = None
+            return element
+        return None
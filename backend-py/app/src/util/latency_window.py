@@ -0,0 +1,26 @@
+"""Sliding window of recent call latencies with percentile lookup."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+
+class LatencyWindow:
+    """Keep the last ``size`` latency samples (seconds)."""
+
+    def __init__(self, size: int) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a sample, evicting the oldest once the window is full."""
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the nearest-rank percentile; the window must not be empty."""
+        ordered = sorted(self._samples)
+        index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+        return ordered[index]
@@ -7,8 +7,10 @@ Development environment uses colored output, production uses JSON output.
 import logging
 import os
 import sys
-from collections.abc import MutableMapping
-from contextvars import ContextVar
+import time
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from typing import Any
 
 import orjson
@@ -131,3 +133,86 @@ def clear_request_context() -> None:
     clear_contextvars()
     request_id_var.set(None)
     user_id_var.set(None)
+
+
+class StageTimer:
+    """Accumulates wall-clock time per pipeline stage for one request.
+
+    Stages that run more than once (e.g. GM decision retries) are summed.
+    Concurrent stages overlap, so the sum can exceed the request's total.
+    A timer created with a ``parent`` (e.g. one per auto-advance turn) also
+    adds every recorded duration to the parent.
+    """
+
+    def __init__(self, parent: "StageTimer | None" = None) -> None:
+        self._started = time.perf_counter()
+        self._stages: dict[str, float] = {}
+        self._parent = parent
+
+    @contextmanager
+    def span(self, stage: str, **fields: Any) -> Iterator[None]:  # noqa: ANN401
+        """Time the enclosed block and log it as a structured span."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - started) * 1000, **fields)
+
+    def record(self, stage: str, elapsed_ms: float, **fields: Any) -> None:  # noqa: ANN401
+        """Add a measured duration to ``stage`` and log the span."""
+        self._add(stage, elapsed_ms)
+        get_logger(__name__).info(
+            "Timing span",
+            stage=stage,
+            elapsed_ms=round(elapsed_ms, 2),
+            **fields,
+        )
+
+    def _add(self, stage: str, elapsed_ms: float) -> None:
+        self._stages[stage] = self._stages.get(stage, 0.0) + elapsed_ms
+        if self._parent is not None:
+            self._parent._add(stage, elapsed_ms)  # noqa: SLF001
+
+    def as_dict(self) -> dict[str, float]:
+        """Return stage durations in ms, plus ``total`` since creation."""
+        stages = {name: round(ms, 2) for name, ms in self._stages.items()}
+        stages["total"] = round((time.perf_counter() - self._started) * 1000, 2)
+        return stages
+
+    def server_timing(self) -> str:
+        """Format the stages as a ``Server-Timing`` header value."""
+        return ", ".join(f"{name};dur={ms}" for name, ms in self.as_dict().items())
+
+
+stage_timer_var: ContextVar[StageTimer | None] = ContextVar(
+    "stage_timer",
+    default=None,
+)
+
+
+def bind_stage_timer(timer: StageTimer) -> Token[StageTimer | None]:
+    """Make ``timer`` the target of ``timing_span`` in the current context."""
+    return stage_timer_var.set(timer)
+
+
+def reset_stage_timer(token: Token[StageTimer | None]) -> None:
+    """Undo ``bind_stage_timer``.
+
+    Async generators may be finalized in a different context than the one
+    that bound the timer; the binding then dies with its task instead.
+    """
+    try:
+        stage_timer_var.reset(token)
+    except ValueError:
+        stage_timer_var.set(None)
+
+
+@contextmanager
+def timing_span(stage: str, **fields: Any) -> Iterator[None]:  # noqa: ANN401
+    """Time a block against the bound StageTimer; no-op when none is bound."""
+    timer = stage_timer_var.get()
+    if timer is None:
+        yield
+        return
+    with timer.span(stage, **fields):
+        yield
@@ -0,0 +1,54 @@
+"""Process-wide cache of JSON schemas and validators for structured LLM output.
+
+Pydantic regenerates ``model_json_schema()`` from scratch on every call, and
+for deep response types such as ``GmDecisionResponse`` that walk costs more
+than validating the model's answer.  The registry builds each schema once,
+together with a ``TypeAdapter`` for validation, and hands out the same
+objects for the lifetime of the process.
+
+Response types used on the hot path are registered with ``precompute`` when
+their module is imported; anything else is built on first use.  The cached
+schema dicts are shared, so callers must treat them as read-only.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True)
+class StructuredSchema[T: BaseModel]:
+    """Precomputed JSON schema and validator for one response type."""
+
+    json_schema: Mapping[str, Any]
+    adapter: TypeAdapter[T]
+
+    def validate_json(self, data: str | bytes) -> T:
+        """Parse and validate a JSON document into the response type."""
+        return self.adapter.validate_json(data)
+
+
+_registry: dict[type[BaseModel], StructuredSchema[Any]] = {}
+
+
+def structured_schema[T: BaseModel](model: type[T]) -> StructuredSchema[T]:
+    """Return the cached schema entry for ``model``, building it if needed."""
+    entry = _registry.get(model)
+    if entry is None:
+        entry = _registry[model] = StructuredSchema(
+            json_schema=model.model_json_schema(),
+            adapter=TypeAdapter(model),
+        )
+    return entry
+
+
+def precompute(*models: type[BaseModel]) -> None:
+    """Build schema entries ahead of the first request."""
+    for model in models:
+        structured_schema(model)
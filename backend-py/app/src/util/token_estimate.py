@@ -0,0 +1,21 @@
+"""Local token-count approximation for prompt budgeting.
+
+Counting tokens exactly needs a model round trip (``count_tokens``), which
+would cost more than the trimming it informs.  Gemini's tokenizer averages
+roughly four characters per token for ASCII text, while Japanese and other
+non-ASCII characters come out close to one token each, so the estimate
+weights the two separately.  It is deliberately slightly pessimistic.
+"""
+
+from __future__ import annotations
+
+_ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Return an approximate token count for ``text``."""
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return -(-ascii_chars // _ASCII_CHARS_PER_TOKEN) + non_ascii_chars
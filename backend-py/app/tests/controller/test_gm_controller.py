@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import uuid
-from unittest.mock import MagicMock, patch
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @pytest.fixture
 def client(monkeypatch):
@@ -18,15 +23,22 @@ def client(monkeypatch):
     return TestClient(app)
 
 
-def _mock_use_case(return_value: object) -> MagicMock:
-    """Return a MagicMock that replaces GmTurnUseCase class.
+@contextmanager
+def _mock_use_case(client: TestClient, return_value: object) -> Iterator[None]:
+    """Override the shared GmTurnUseCase dependency with a MagicMock.
 
-    When the controller calls ``GmTurnUseCase()``, the mock class is called and
-    returns a mock instance whose ``get_latest_turn`` is pre-configured.
+    The mock instance's ``get_latest_turn`` is pre-configured to return
+    ``return_value``.
     """
+    from container import get_gm_turn_usecase
+
     mock_instance = MagicMock()
     mock_instance.get_latest_turn.return_value = return_value
-    return MagicMock(return_value=mock_instance)
+    client.app.dependency_overrides[get_gm_turn_usecase] = lambda: mock_instance
+    try:
+        yield
+    finally:
+        client.app.dependency_overrides.pop(get_gm_turn_usecase, None)
 
 
 class TestGetLatestTurn:
@@ -35,10 +47,7 @@ class TestGetLatestTurn:
     def test_returns_404_when_no_turns(self, client: TestClient) -> None:
         """Returns 404 when no turns exist for the session."""
         session_id = str(uuid.uuid4())
-        with patch(
-            "controller.gm_controller.GmTurnUseCase",
-            _mock_use_case(None),
-        ):
+        with _mock_use_case(client, None):
             res = client.get(
                 "/api/gm/turn/latest",
                 params={"session_id": session_id},
@@ -73,10 +82,7 @@ class TestGetLatestTurn:
             is_ending=True,
             requires_user_action=False,
         )
-        with patch(
-            "controller.gm_controller.GmTurnUseCase",
-            _mock_use_case(fake_response),
-        ):
+        with _mock_use_case(client, fake_response):
             res = client.get(
                 "/api/gm/turn/latest",
                 params={"session_id": session_id},
@@ -103,10 +109,7 @@ class TestGetLatestTurn:
             is_ending=False,
             requires_user_action=True,
         )
-        with patch(
-            "controller.gm_controller.GmTurnUseCase",
-            _mock_use_case(fake_response),
-        ):
+        with _mock_use_case(client, fake_response):
             res = client.get(
                 "/api/gm/turn/latest",
                 params={"session_id": session_id},
@@ -64,7 +64,7 @@ class _FakeStorage:
     def __init__(self) -> None:
         self.uploaded: list[tuple[str, bytes, str]] = []
 
-    def upload_audio(
+    async def upload_audio(
         self,
         path: str,
         audio_bytes: bytes,
@@ -10,6 +10,9 @@ from domain.service.context_service import (
     ContextService,
     extract_nodes_text,
 )
+from domain.service.game_context_cache import GameContextCache
+from gateway.game_snapshot_gateway import GameSnapshot
+from util.token_estimate import estimate_tokens
 
 
 class TestFormatNpcs:
@@ -91,22 +94,15 @@ class TestLoadBackgrounds:
     def test_includes_scenario_backgrounds(self) -> None:
         """Scenario backgrounds should be included."""
         svc = ContextService()
-        svc._bg_gw.find_all_by_scenario = MagicMock(
-            return_value=[
-                _fake_bg(
-                    location="Castle",
-                    description="Grand castle",
-                    scenario_id=_SCENARIO_ID,
-                ),
-            ],
-        )
-        svc._bg_gw.find_all_by_session = MagicMock(return_value=[])
+        rows = [
+            _fake_bg(
+                location="Castle",
+                description="Grand castle",
+                scenario_id=_SCENARIO_ID,
+            ),
+        ]
 
-        result = svc._load_backgrounds(
-            MagicMock(),
-            uuid.UUID(_SCENARIO_ID),
-            uuid.UUID(_SESSION_ID),
-        )
+        result = svc._load_backgrounds(rows)
         assert len(result) == 1
         assert result[0].location_name == "Castle"
 
@@ -164,22 +160,15 @@ class TestPromptCacheHelpers:
     def test_includes_session_backgrounds(self) -> None:
         """Session-generated backgrounds should also be included."""
         svc = ContextService()
-        svc._bg_gw.find_all_by_scenario = MagicMock(return_value=[])
-        svc._bg_gw.find_all_by_session = MagicMock(
-            return_value=[
-                _fake_bg(
-                    location="Forest",
-                    description="A misty forest",
-                    session_id=_SESSION_ID,
-                ),
-            ],
-        )
+        rows = [
+            _fake_bg(
+                location="Forest",
+                description="A misty forest",
+                session_id=_SESSION_ID,
+            ),
+        ]
 
-        result = svc._load_backgrounds(
-            MagicMock(),
-            uuid.UUID(_SCENARIO_ID),
-            uuid.UUID(_SESSION_ID),
-        )
+        result = svc._load_backgrounds(rows)
         assert len(result) == 1
         assert result[0].location_name == "Forest"
 
@@ -188,14 +177,9 @@ class TestPromptCacheHelpers:
         shared_id = "33333333-3333-3333-3333-333333333333"
         bg = _fake_bg(bg_id=shared_id, location="Cave")
         svc = ContextService()
-        svc._bg_gw.find_all_by_scenario = MagicMock(return_value=[bg])
-        svc._bg_gw.find_all_by_session = MagicMock(return_value=[bg])
+        rows = [bg, bg]
 
-        result = svc._load_backgrounds(
-            MagicMock(),
-            uuid.UUID(_SCENARIO_ID),
-            uuid.UUID(_SESSION_ID),
-        )
+        result = svc._load_backgrounds(rows)
         assert len(result) == 1
 
 
@@ -371,11 +355,8 @@ class TestLoadTurnsNodesExtraction:
                 },
             ],
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._load_turns(MagicMock(), uuid.uuid4())
+        result = svc._load_turns([turn_row])
 
         assert len(result) == 1
         assert result[0].nodes_text != ""
@@ -391,11 +372,8 @@ class TestLoadTurnsNodesExtraction:
         turn_row.input_text = "look"
         turn_row.gm_decision_type = "narrate"
         turn_row.output = {"narration_text": "You looked."}
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._load_turns(MagicMock(), uuid.uuid4())
+        result = svc._load_turns([turn_row])
 
         assert len(result) == 1
         assert result[0].nodes_text == ""
@@ -410,26 +388,16 @@ class TestExtractPreviousBgmMood:
         svc = ContextService()
         turn_row = MagicMock()
         turn_row.output = {"bgm_mood": "battle"}
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_bgm_mood(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_bgm_mood([turn_row])
 
         assert result == "battle"
 
     def test_returns_none_when_no_turns(self) -> None:
         """Should return None when no turns exist."""
         svc = ContextService()
-        svc._turn_gw.get_recent = MagicMock(return_value=[])
 
-        result = svc._extract_previous_bgm_mood(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_bgm_mood([])
 
         assert result is None
 
@@ -438,14 +406,8 @@ class TestExtractPreviousBgmMood:
         svc = ContextService()
         turn_row = MagicMock()
         turn_row.output = {"bgm_mood": ""}
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_bgm_mood(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_bgm_mood([turn_row])
 
         assert result is None
 
@@ -454,14 +416,8 @@ class TestExtractPreviousBgmMood:
         svc = ContextService()
         turn_row = MagicMock()
         turn_row.output = {"narration_text": "Something."}
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_bgm_mood(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_bgm_mood([turn_row])
 
         assert result is None
 
@@ -470,14 +426,8 @@ class TestExtractPreviousBgmMood:
         svc = ContextService()
         turn_row = MagicMock()
         turn_row.output = {"bgm_mood": "  Exploration  "}
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_bgm_mood(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_bgm_mood([turn_row])
 
         assert result == "exploration"
 
@@ -496,7 +446,6 @@ class TestBuildContextBgmMood:
         sess.scenario_id = scenario_id
         sess.current_turn_number = 3
         sess.current_state = {}
-        svc._session_gw.get_by_id = MagicMock(return_value=sess)
 
         # Mock scenario
         scenario = MagicMock()
@@ -505,10 +454,6 @@ class TestBuildContextBgmMood:
         scenario.win_conditions = []
         scenario.fail_conditions = []
         scenario.max_turns = 30
-        svc._scenario_gw.get_by_id = MagicMock(return_value=scenario)
-
-        # Mock player character
-        svc._pc_gw.get_by_session = MagicMock(return_value=None)
 
         # Mock turns with bgm_mood
         turn_row = MagicMock()
@@ -520,27 +465,98 @@ class TestBuildContextBgmMood:
             "narration_text": "Walking.",
             "bgm_mood": "peaceful",
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        # Mock npcs, objectives, items, backgrounds
-        svc._npc_gw.get_by_session = MagicMock(return_value=[])
-        svc._objective_gw.get_active_by_session = MagicMock(
-            return_value=[],
-        )
-        svc._item_gw.get_by_session = MagicMock(return_value=[])
-        svc._bg_gw.find_all_by_scenario = MagicMock(
-            return_value=[],
-        )
-        svc._bg_gw.find_all_by_session = MagicMock(
-            return_value=[],
+        svc._snapshot_gw.load = MagicMock(
+            return_value=GameSnapshot(
+                session=sess,
+                scenario=scenario,
+                player=None,
+                npcs=[],
+                objectives=[],
+                items=[],
+                backgrounds=[],
+                recent_turns=[turn_row],
+            ),
         )
 
         ctx = svc.build_context(MagicMock(), session_id)
 
         assert ctx.previous_bgm_mood == "peaceful"
 
+    def test_build_context_reuses_loaded_session(self) -> None:
+        """A pre-loaded session row should be forwarded to the snapshot."""
+        svc = ContextService()
+        session_id = uuid.uuid4()
+        sess = MagicMock()
+        sess.current_turn_number = 1
+        sess.current_state = {}
+        scenario = MagicMock()
+        scenario.title = "Test Scenario"
+        scenario.description = "A test."
+        scenario.win_conditions = []
+        scenario.fail_conditions = []
+        scenario.max_turns = 10
+        svc._snapshot_gw.load = MagicMock(
+            return_value=GameSnapshot(
+                session=sess,
+                scenario=scenario,
+                player=None,
+                npcs=[],
+                objectives=[],
+                items=[],
+                backgrounds=[],
+                recent_turns=[],
+            ),
+        )
+        db = MagicMock()
+
+        svc.build_context(db, session_id, game_session=sess)
+
+        svc._snapshot_gw.load.assert_called_once_with(
+            db,
+            session_id,
+            game_session=sess,
+            turn_limit=5,
+        )
+
+
+class TestBuildNpcs:
+    """Tests for _build_npcs over (npc, relationship) rows."""
+
+    def _npc(self, name: str) -> MagicMock:
+        npc = MagicMock()
+        npc.name = name
+        npc.profile = {}
+        npc.goals = {}
+        npc.state = {}
+        npc.location_x = 0
+        npc.location_y = 0
+        return npc
+
+    def test_relationship_values_included(self) -> None:
+        """Joined relationship values should populate the summary."""
+        rel = MagicMock()
+        rel.affinity = 10
+        rel.trust = 20
+        rel.fear = 0
+        rel.debt = 5
+
+        result = ContextService._build_npcs([(self._npc("Rio"), rel)])
+
+        assert result[0].relationship == {
+            "affinity": 10,
+            "trust": 20,
+            "fear": 0,
+            "debt": 5,
+        }
+
+    def test_missing_relationship_is_empty(self) -> None:
+        """NPCs without a relationship row get an empty dict."""
+        result = ContextService._build_npcs([(self._npc("Guard"), None)])
+
+        assert result[0].name == "Guard"
+        assert result[0].relationship == {}
+
 
 class TestPromptBgmSection:
     """Tests for BGM state section in prompts."""
@@ -637,14 +653,7 @@ class TestExtractPreviousBackground:
                 {"type": "dialogue", "text": "B.", "speaker": "NPC"},
             ],
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
-
-        result = svc._extract_previous_background(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_background([turn_row])
 
         assert result == "forest_bg"
 
@@ -663,26 +672,16 @@ class TestExtractPreviousBackground:
                 {"type": "dialogue", "text": "C.", "speaker": "NPC"},
             ],
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_background(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_background([turn_row])
 
         assert result == "castle_bg"
 
     def test_returns_none_when_no_turns(self) -> None:
         """Should return None when no turns exist."""
         svc = ContextService()
-        svc._turn_gw.get_recent = MagicMock(return_value=[])
 
-        result = svc._extract_previous_background(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_background([])
 
         assert result is None
 
@@ -696,14 +695,8 @@ class TestExtractPreviousBackground:
                 {"type": "dialogue", "text": "B.", "speaker": "NPC"},
             ],
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_background(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_background([turn_row])
 
         assert result is None
 
@@ -714,14 +707,8 @@ class TestExtractPreviousBackground:
         turn_row.output = {
             "selected_background_id": "abc-123",
         }
-        svc._turn_gw.get_recent = MagicMock(
-            return_value=[turn_row],
-        )
 
-        result = svc._extract_previous_background(
-            MagicMock(),
-            uuid.uuid4(),
-        )
+        result = svc._extract_previous_background([turn_row])
 
         assert result == "abc-123"
 
@@ -814,3 +801,149 @@ class TestPromptBackgroundStateSection:
 
         assert "# Current Scene Background" in prompt
         assert "castle_bg" in prompt
+
+
+class TestBuildContextCache:
+    """Tests for the GameContext cache in build_context."""
+
+    def _svc_with_snapshot(self, cache: GameContextCache) -> ContextService:
+        svc = ContextService(cache=cache)
+        sess = MagicMock()
+        sess.current_turn_number = 4
+        sess.current_state = {}
+        scenario = MagicMock()
+        scenario.title = "Test Scenario"
+        scenario.description = "A test."
+        scenario.win_conditions = []
+        scenario.fail_conditions = []
+        scenario.max_turns = 30
+        pc = MagicMock()
+        pc.name = "Hero"
+        pc.stats = {"hp": 10}
+        pc.status_effects = []
+        pc.location_x = 0
+        pc.location_y = 0
+        svc._snapshot_gw.load = MagicMock(
+            return_value=GameSnapshot(
+                session=sess,
+                scenario=scenario,
+                player=pc,
+                npcs=[],
+                objectives=[],
+                items=[],
+                backgrounds=[],
+                recent_turns=[],
+            ),
+        )
+        svc._session_gw.get_current_turn_number = MagicMock(return_value=4)
+        return svc
+
+    def test_second_build_uses_cache(self) -> None:
+        """A matching turn number serves the context from memory."""
+        svc = self._svc_with_snapshot(GameContextCache())
+        session_id = uuid.uuid4()
+
+        first = svc.build_context(MagicMock(), session_id)
+        second = svc.build_context(MagicMock(), session_id)
+
+        assert second == first
+        svc._snapshot_gw.load.assert_called_once()
+
+    def test_turn_number_mismatch_reloads(self) -> None:
+        """A turn advanced by another worker forces a reload."""
+        svc = self._svc_with_snapshot(GameContextCache())
+        session_id = uuid.uuid4()
+        svc.build_context(MagicMock(), session_id)
+
+        svc._session_gw.get_current_turn_number = MagicMock(return_value=5)
+        svc.build_context(MagicMock(), session_id)
+
+        assert svc._snapshot_gw.load.call_count == 2
+
+    def test_record_turn_keeps_cache_current(self) -> None:
+        """A recorded turn advances the cached version."""
+        cache = GameContextCache()
+        svc = self._svc_with_snapshot(cache)
+        session_id = uuid.uuid4()
+        svc.build_context(MagicMock(), session_id)
+        turn = MagicMock()
+        turn.session_id = session_id
+        turn.turn_number = 5
+        turn.input_type = "do"
+        turn.input_text = "walk"
+        turn.gm_decision_type = "narrate"
+        turn.output = {"narration_text": "Walking.", "bgm_mood": "calm"}
+
+        svc.record_turn(turn)
+        svc._session_gw.get_current_turn_number = MagicMock(return_value=5)
+        ctx = svc.build_context(MagicMock(), session_id)
+
+        svc._snapshot_gw.load.assert_called_once()
+        assert ctx.current_turn_number == 5
+        assert ctx.previous_bgm_mood == "calm"
+        assert ctx.recent_turns[-1].input_text == "walk"
+
+
+class TestPromptTokenBudget:
+    """Tests for trimming prompt sections to the token budget."""
+
+    def _context(self, *, turns: int = 5) -> MagicMock:
+        ctx = TestPromptCacheHelpers()._context()
+        ctx.recent_turns = [
+            TurnSummary(
+                turn_number=i,
+                input_type="do",
+                input_text=f"action {i}",
+                decision_type="narrate",
+                narration_summary="",
+                nodes_text=f"  (narration) turn-{i} " + "x" * 2000,
+            )
+            for i in range(1, turns + 1)
+        ]
+        ctx.active_npcs = [
+            NpcSummary(
+                name="Guard",
+                profile={"backstory": "y" * 2000},
+                goals={"primary": "Protect"},
+                state={"mood": "alert"},
+                relationship={"affinity": 5},
+            ),
+        ]
+        return ctx
+
+    def test_small_prompt_is_untouched(self) -> None:
+        """Within budget every turn and full NPC profile is kept."""
+        svc = ContextService(token_budget=100_000)
+        prompt = svc.build_prompt(self._context(), "do", "look")
+
+        for i in range(1, 6):
+            assert f"turn-{i} " in prompt
+        assert "backstory" in prompt
+
+    def test_oldest_turns_dropped_first(self) -> None:
+        """Older turns go before NPC detail or the newest turns."""
+        svc = ContextService(token_budget=2500)
+        prompt = svc.build_prompt(self._context(), "do", "look")
+
+        assert "turn-1 " not in prompt
+        assert "turn-2 " not in prompt
+        assert "turn-5 " in prompt
+        assert "backstory" in prompt
+
+    def test_tight_budget_compacts_and_keeps_input(self) -> None:
+        """Under a tight budget NPCs lose their profile but input survives."""
+        svc = ContextService(token_budget=1000)
+        prompt = svc.build_prompt_delta(
+            self._context(),
+            "do",
+            "open the door",
+            extra_sections=["# Soft Limit"],
+        )
+
+        assert "backstory" not in prompt
+        assert "- Guard: state=" in prompt
+        assert "turn-5 " in prompt
+        assert "turn-4 " not in prompt
+        assert "open the door" in prompt
+        assert prompt.rstrip().endswith("# Soft Limit")
+        assert estimate_tokens(prompt) <= 1000
@@ -0,0 +1,261 @@
+"""Tests for GameContextCache eviction and write-through updates."""
+
+from __future__ import annotations
+
+import uuid
+
+from domain.entity.gm_types import (
+    BackgroundResourceSummary,
+    FlagChange,
+    GameContext,
+    ItemSummary,
+    ItemUpdate,
+    LocationChange,
+    NewItem,
+    NpcStateEntry,
+    NpcStateUpdate,
+    NpcSummary,
+    ObjectiveSummary,
+    ObjectiveUpdate,
+    PlayerSummary,
+    RelationshipChange,
+    StatDelta,
+    StateChanges,
+    TurnSummary,
+)
+from domain.service.game_context_cache import GameContextCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _context(*, turn: int = 1) -> GameContext:
+    return GameContext(
+        scenario_title="S",
+        scenario_setting="Setting",
+        system_prompt="",
+        win_conditions=[],
+        fail_conditions=[],
+        recent_turns=[],
+        player=PlayerSummary(
+            name="Hero",
+            stats={"hp": 10},
+            status_effects=["poisoned"],
+            location_x=0,
+            location_y=0,
+        ),
+        active_npcs=[
+            NpcSummary(
+                name="Rio",
+                profile={},
+                goals={},
+                state={"mood": "calm"},
+                relationship={"affinity": 1, "trust": 2, "fear": 0, "debt": 0},
+            ),
+        ],
+        active_objectives=[ObjectiveSummary(title="Find key", status="active")],
+        player_items=[ItemSummary(name="Potion", item_type="consumable", quantity=2)],
+        current_turn_number=turn,
+        current_state={"flags": {"met_guard": True}},
+    )
+
+
+def _turn(number: int) -> TurnSummary:
+    return TurnSummary(
+        turn_number=number,
+        input_type="do",
+        input_text="look",
+        decision_type="narrate",
+        narration_summary="",
+    )
+
+
+class TestEviction:
+    """Tests for LRU and TTL eviction."""
+
+    def test_get_returns_copy(self) -> None:
+        """Mutating a returned context must not change the cached entry."""
+        cache = GameContextCache()
+        sid = uuid.uuid4()
+        cache.put(sid, _context())
+
+        got = cache.get(sid)
+        assert got is not None
+        got.player.stats["hp"] = 0
+
+        again = cache.get(sid)
+        assert again is not None
+        assert again.player.stats["hp"] == 10
+
+    def test_ttl_expiry(self) -> None:
+        """Entries older than the TTL are dropped."""
+        clock = _Clock()
+        cache = GameContextCache(ttl_seconds=10, clock=clock)
+        sid = uuid.uuid4()
+        cache.put(sid, _context())
+
+        clock.now = 9.9
+        assert cache.get(sid) is not None
+        clock.now = 10.0
+        assert cache.get(sid) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used session is evicted first."""
+        cache = GameContextCache(max_entries=2)
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        cache.put(a, _context())
+        cache.put(b, _context())
+        cache.get(a)
+        cache.put(c, _context())
+
+        assert cache.get(a) is not None
+        assert cache.get(b) is None
+        assert cache.get(c) is not None
+
+    def test_invalidate(self) -> None:
+        """Invalidated sessions are no longer returned."""
+        cache = GameContextCache()
+        sid = uuid.uuid4()
+        cache.put(sid, _context())
+        cache.invalidate(sid)
+
+        assert cache.get(sid) is None
+
+
+class TestApplyChanges:
+    """Tests for mirroring StateChanges onto the cached context."""
+
+    def _applied(self, changes: StateChanges) -> GameContext:
+        cache = GameContextCache()
+        sid = uuid.uuid4()
+        cache.put(sid, _context())
+        cache.apply_changes(sid, changes)
+        ctx = cache.get(sid)
+        assert ctx is not None
+        return ctx
+
+    def test_player_changes(self) -> None:
+        """Stats, location and status effects are updated."""
+        ctx = self._applied(
+            StateChanges(
+                stats_delta=[StatDelta(stat="hp", delta=-3)],
+                location_change=LocationChange(location_name="Gate", x=4, y=5),
+                status_effect_adds=["blessed"],
+                status_effect_removes=["poisoned"],
+            ),
+        )
+        assert ctx.player.stats == {"hp": 7}
+        assert (ctx.player.location_x, ctx.player.location_y) == (4, 5)
+        assert ctx.player.status_effects == ["blessed"]
+
+    def test_item_changes(self) -> None:
+        """New, removed and updated items are reflected."""
+        ctx = self._applied(
+            StateChanges(
+                new_items=[NewItem(name="Key", description="Rusty", item_type="key")],
+                item_updates=[ItemUpdate(name="Potion", quantity_delta=-1)],
+            ),
+        )
+        assert [(i.name, i.quantity) for i in ctx.player_items] == [
+            ("Potion", 1),
+            ("Key", 1),
+        ]
+
+        ctx = self._applied(StateChanges(removed_items=["Potion"]))
+        assert ctx.player_items == []
+
+    def test_npc_changes(self) -> None:
+        """Relationship deltas and state replacement are applied."""
+        ctx = self._applied(
+            StateChanges(
+                relationship_changes=[
+                    RelationshipChange(npc_name="Rio", affinity_delta=5),
+                ],
+                npc_state_updates=[
+                    NpcStateUpdate(
+                        npc_name="Rio",
+                        state=[NpcStateEntry(key="mood", value="angry")],
+                    ),
+                ],
+            ),
+        )
+        npc = ctx.active_npcs[0]
+        assert npc.relationship["affinity"] == 6
+        assert npc.state == {"mood": "angry"}
+
+    def test_objective_changes(self) -> None:
+        """Completed objectives leave the active list; new ones are added."""
+        ctx = self._applied(
+            StateChanges(
+                objective_updates=[
+                    ObjectiveUpdate(title="Find key", status="completed"),
+                    ObjectiveUpdate(title="Open gate", status="active"),
+                ],
+            ),
+        )
+        assert [o.title for o in ctx.active_objectives] == ["Open gate"]
+
+    def test_flag_changes(self) -> None:
+        """Flags are set and cleared in current_state."""
+        ctx = self._applied(
+            StateChanges(
+                flag_changes=[
+                    FlagChange(flag_id="met_guard", value=False),
+                    FlagChange(flag_id="has_key", value=True),
+                ],
+            ),
+        )
+        assert ctx.current_state["flags"] == {"has_key": True}
+
+    def test_missing_entry_is_noop(self) -> None:
+        """Applying changes for an uncached session does nothing."""
+        cache = GameContextCache()
+        cache.apply_changes(uuid.uuid4(), StateChanges())
+        assert len(cache) == 0
+
+
+class TestRecordTurn:
+    """Tests for turn and background write-through."""
+
+    def test_record_turn_advances_version(self) -> None:
+        """Recorded turns bump the turn number and keep the window size."""
+        cache = GameContextCache()
+        sid = uuid.uuid4()
+        ctx = _context(turn=2)
+        ctx.recent_turns = [_turn(1), _turn(2)]
+        cache.put(sid, ctx)
+
+        cache.record_turn(
+            sid,
+            _turn(3),
+            previous_background="forest",
+            previous_bgm_mood="battle",
+            turn_limit=2,
+        )
+
+        got = cache.get(sid)
+        assert got is not None
+        assert got.current_turn_number == 3
+        assert [t.turn_number for t in got.recent_turns] == [2, 3]
+        assert got.previous_background == "forest"
+        assert got.previous_bgm_mood == "battle"
+
+    def test_add_background_deduplicates(self) -> None:
+        """The same background is only listed once."""
+        cache = GameContextCache()
+        sid = uuid.uuid4()
+        cache.put(sid, _context())
+        bg = BackgroundResourceSummary(id="bg-1", location_name="Cave", description="")
+
+        cache.add_background(sid, bg)
+        cache.add_background(sid, bg)
+
+        got = cache.get(sid)
+        assert got is not None
+        assert [b.id for b in got.available_backgrounds] == ["bg-1"]
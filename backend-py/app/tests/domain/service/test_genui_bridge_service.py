@@ -1167,6 +1167,17 @@ class TestStreamDecision:
 class TestStreamDecisionWithNodes:
     """Tests for stream_decision() when nodes are present."""
 
+    def test_partial_nodes_event(self) -> None:
+        """partial_nodes_event() marks a cumulative nodesReady as partial."""
+        nodes = [SceneNode(type="narration", text="The forest grows quiet.")]
+
+        raw = GenuiBridgeService.partial_nodes_event(nodes)
+        parsed = json.loads(raw.removeprefix("data: ").strip())
+
+        assert parsed["type"] == "nodesReady"
+        assert parsed["partial"] is True
+        assert parsed["nodes"][0]["text"] == "The forest grows quiet."
+
     @pytest.mark.asyncio
     async def test_nodes_ready_event_emitted(self) -> None:
         """When nodes present, nodesReady event should be emitted."""
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.domain.entity.gm_types import GmDecisionResponse
 from src.domain.service.gm_decision_service import GmDecisionRuntime, GmDecisionService
+from src.infra.model_router import ModelRoute, ModelRouter
+from src.infra.usage_accounting import UsagePurpose
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """リトライ間の待機を無くしてテストを高速化する."""
+    monkeypatch.setattr(
+        GmDecisionService,
+        "RETRY_POLICY",
+        replace(GmDecisionService.RETRY_POLICY, base_delay=0.0),
+    )
 
 
 def _make_adk_mock(
@@ -68,6 +82,26 @@ class TestGmDecisionRuntime:
         calls = adk.decide.call_args_list
         assert calls[0].kwargs["session_id"] == first_session_id
         assert calls[1].kwargs["session_id"] == first_session_id
+        # 共有セッションは DB に永続化する
+        assert calls[0].kwargs["ephemeral"] is False
+
+    @pytest.mark.asyncio
+    async def test_single_shot_decide_is_ephemeral(self) -> None:
+        """セッションを共有しない decide() はインメモリセッションを使うこと."""
+        adk = _make_adk_mock()
+        svc = GmDecisionService(adk)
+
+        await svc.decide("prompt", game_session_id="gs-1")
+        await svc.decide(
+            "prompt",
+            game_session_id="gs-1",
+            runtime=GmDecisionRuntime(use_interactions=False),
+        )
+
+        assert [c.kwargs["ephemeral"] for c in adk.decide.call_args_list] == [
+            True,
+            True,
+        ]
 
     @pytest.mark.asyncio
     async def test_decide_raises_after_all_retries_fail(self) -> None:
@@ -100,6 +134,28 @@ class TestGmDecisionRuntime:
         assert decision.decision_type == "choice"
         assert adk.decide.await_count == 2
 
+    @pytest.mark.asyncio
+    async def test_decide_forwards_on_node(self) -> None:
+        """on_node はそのまま ADK クライアントに渡されること."""
+        adk = _make_adk_mock()
+        svc = GmDecisionService(adk)
+        listener = MagicMock()
+
+        await svc.decide("prompt", game_session_id="gs-1", on_node=listener)
+
+        assert adk.decide.call_args.kwargs["on_node"] is listener
+
+    @pytest.mark.asyncio
+    async def test_fatal_error_is_not_retried(self) -> None:
+        """致命的エラー (不正な引数など) はリトライしないこと."""
+        adk = _make_adk_mock(side_effect=ValueError("bad request"))
+        svc = GmDecisionService(adk)
+
+        with pytest.raises(ValueError, match="bad request"):
+            await svc.decide("prompt", game_session_id="gs-1")
+
+        assert adk.decide.await_count == 1
+
     @pytest.mark.asyncio
     async def test_cleanup_runtime_deletes_adk_session(self) -> None:
         """cleanup_runtime() は adk.cleanup_session を呼び出すこと."""
@@ -127,3 +183,170 @@ class TestGmDecisionRuntime:
         await svc.cleanup_runtime(runtime, game_session_id="gs-1")
 
         adk.cleanup_session.assert_not_awaited()
+
+
+def _hedging_service(adk: MagicMock, *, latency: float) -> GmDecisionService:
+    """ヘッジ有効でレイテンシ履歴を埋めた GmDecisionService を返す."""
+    svc = GmDecisionService(adk, hedge_percentile=0.95)
+    for _ in range(GmDecisionService.HEDGE_MIN_SAMPLES):
+        svc._latencies[UsagePurpose.DECISION].record(latency)
+    return svc
+
+
+class TestHedgedDecision:
+    """パーセンタイル超過時のヘッジリクエストのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_stalls(self) -> None:
+        """Primary が停滞したら 2 本目を投げ、先に返った結果を採用すること."""
+        fast = GmDecisionResponse(decision_type="choice", narration_text="hedge")
+        primary_cancelled = asyncio.Event()
+
+        async def decide(**kwargs: object) -> GmDecisionResponse:
+            if kwargs.get("on_node") is not None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    primary_cancelled.set()
+                    raise
+            return fast
+
+        adk = _make_adk_mock(side_effect=decide)
+        svc = _hedging_service(adk, latency=0.01)
+
+        decision = await svc.decide(
+            "prompt",
+            game_session_id="gs-1",
+            on_node=MagicMock(),
+        )
+
+        assert decision.narration_text == "hedge"
+        assert adk.decide.await_count == 2
+        assert primary_cancelled.is_set()
+        primary_kwargs, hedge_kwargs = (c.kwargs for c in adk.decide.call_args_list)
+        # Only the primary streams nodes, and the hedge has its own session.
+        assert hedge_kwargs.get("on_node") is None
+        assert hedge_kwargs["session_id"] != primary_kwargs["session_id"]
+        assert hedge_kwargs["ephemeral"] is True
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_primary_is_fast(self) -> None:
+        """閾値内に返れば 2 本目は投げないこと."""
+        adk = _make_adk_mock()
+        svc = _hedging_service(adk, latency=5.0)
+
+        await svc.decide("prompt", game_session_id="gs-1")
+
+        assert adk.decide.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self) -> None:
+        """先に失敗した側は無視し、もう一方の成功を待つこと."""
+        calls = 0
+
+        async def decide(**_: object) -> GmDecisionResponse:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.05)
+                return GmDecisionResponse(decision_type="narrate", narration_text="p")
+            msg = "hedge failed"
+            raise RuntimeError(msg)
+
+        adk = _make_adk_mock(side_effect=decide)
+        svc = _hedging_service(adk, latency=0.01)
+
+        decision = await svc.decide("prompt", game_session_id="gs-1")
+
+        assert decision.narration_text == "p"
+        assert adk.decide.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_enough_samples(self) -> None:
+        """レイテンシ履歴が少ないうちはヘッジしないこと."""
+        adk = _make_adk_mock()
+        svc = GmDecisionService(adk, hedge_percentile=0.95)
+
+        assert svc._hedge_delay(None) is None
+        await svc.decide("prompt", game_session_id="gs-1")
+        assert len(svc._latencies[UsagePurpose.DECISION]) == 1
+
+    def test_no_hedge_with_shared_session(self) -> None:
+        """ADK セッションを共有する runtime ではヘッジしないこと."""
+        svc = _hedging_service(_make_adk_mock(), latency=0.01)
+
+        assert svc._hedge_delay(GmDecisionRuntime(use_interactions=True)) is None
+        assert svc._hedge_delay(GmDecisionRuntime()) == pytest.approx(0.01)
+
+    @pytest.mark.asyncio
+    async def test_endings_are_not_hedged_or_mixed_into_decisions(self) -> None:
+        """ENDING 呼び出しはヘッジせず、DECISION のレイテンシにも混ぜないこと."""
+        adk = _make_adk_mock()
+        svc = _hedging_service(adk, latency=0.0)
+
+        assert svc._hedge_delay(None, UsagePurpose.ENDING) is None
+        await svc.decide(
+            "prompt",
+            game_session_id="gs-1",
+            purpose=UsagePurpose.ENDING,
+        )
+
+        assert adk.decide.await_count == 1
+        assert len(svc._latencies[UsagePurpose.ENDING]) == 1
+        assert (
+            len(svc._latencies[UsagePurpose.DECISION])
+            == GmDecisionService.HEDGE_MIN_SAMPLES
+        )
+
+    def test_disabled_by_default(self) -> None:
+        """hedge_percentile 未指定ではヘッジしないこと."""
+        svc = GmDecisionService(_make_adk_mock())
+        for _ in range(GmDecisionService.HEDGE_MIN_SAMPLES):
+            svc._latencies[UsagePurpose.DECISION].record(0.01)
+
+        assert svc._hedge_delay(None) is None
+
+
+class TestModelRouting:
+    """ModelRouter によるモデル選択のテスト."""
+
+    @staticmethod
+    def _router() -> ModelRouter:
+        return ModelRouter(
+            {
+                UsagePurpose.DECISION: (ModelRoute("best"), ModelRoute("fast")),
+                UsagePurpose.ENDING: (ModelRoute("cheap"),),
+            },
+            latency_budgets={UsagePurpose.DECISION: 1.0},
+        )
+
+    @pytest.mark.asyncio
+    async def test_purpose_selects_route(self) -> None:
+        """呼び出し目的に応じたルートが ADK に渡ること."""
+        adk = _make_adk_mock()
+        svc = GmDecisionService(adk, router=self._router())
+
+        await svc.decide("prompt", game_session_id="gs-1")
+        await svc.decide("prompt", game_session_id="gs-1", purpose=UsagePurpose.ENDING)
+
+        routes = [c.kwargs["route"].model for c in adk.decide.call_args_list]
+        assert routes == ["best", "cheap"]
+
+    @pytest.mark.asyncio
+    async def test_slow_route_falls_back_unless_cached(self) -> None:
+        """遅いルートは避けるが、明示キャッシュ利用時は優先ルートに固定すること."""
+        adk = _make_adk_mock()
+        router = self._router()
+        for _ in range(ModelRouter.MIN_SAMPLES):
+            router.observe(UsagePurpose.DECISION, ModelRoute("best"), 5.0)
+        svc = GmDecisionService(adk, router=router)
+
+        await svc.decide("prompt", game_session_id="gs-1")
+        await svc.decide(
+            "delta",
+            game_session_id="gs-1",
+            cached_content="cachedContents/scenario-1",
+        )
+
+        routes = [c.kwargs["route"].model for c in adk.decide.call_args_list]
+        assert routes == ["fast", "best"]
@@ -0,0 +1,232 @@
+"""Tests for PromptCacheManager reference counting, refresh and eviction."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.service.prompt_cache_manager import (
+    PromptCacheKey,
+    PromptCacheManager,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _gemini() -> MagicMock:
+    gemini = MagicMock()
+    names = iter(f"cachedContents/{i}" for i in range(100))
+    gemini.create_prompt_cache = AsyncMock(side_effect=lambda **_: next(names))
+    gemini.refresh_prompt_cache = AsyncMock()
+    gemini.delete_prompt_cache = AsyncMock()
+    return gemini
+
+
+def _key(scenario_id: str = "scn-1", seed: str = "seed") -> PromptCacheKey:
+    return PromptCacheKey.build(scenario_id, system_instruction="GM", seed=seed)
+
+
+async def _acquire(
+    manager: PromptCacheManager,
+    key: PromptCacheKey,
+    holder: str,
+) -> str | None:
+    return await manager.acquire(
+        key,
+        holder=holder,
+        system_instruction="GM",
+        seed="seed",
+    )
+
+
+async def _settle() -> None:
+    """Let background refreshes and deletes run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPromptCacheKey:
+    """Tests for key derivation."""
+
+    def test_seed_change_yields_new_key(self) -> None:
+        """Editing the scenario text must not reuse the old cache."""
+        assert _key(seed="a") != _key(seed="b")
+        assert _key(seed="a") == _key(seed="a")
+
+
+class TestAcquireRelease:
+    """Tests for sharing and reference counting."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_cache(self) -> None:
+        """Sessions on the same scenario reuse a single cache."""
+        gemini = _gemini()
+        manager = PromptCacheManager(gemini, model="m")
+        key = _key()
+
+        first = await _acquire(manager, key, "s1")
+        second = await _acquire(manager, key, "s2")
+
+        assert first == second == "cachedContents/0"
+        assert manager.references(key) == 2
+        gemini.create_prompt_cache.assert_awaited_once()
+        assert gemini.create_prompt_cache.await_args.kwargs["system_instruction"] == (
+            "GM"
+        )
+
+        manager.release("s1")
+        assert manager.references(key) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquirers_share_one_creation(self) -> None:
+        """Sessions arriving while the cache is created wait for that call."""
+        gemini = _gemini()
+        created = asyncio.Event()
+
+        async def create(**_: object) -> str:
+            await created.wait()
+            return "cachedContents/0"
+
+        gemini.create_prompt_cache = AsyncMock(side_effect=create)
+        manager = PromptCacheManager(gemini, model="m")
+        key = _key()
+
+        acquisitions = [
+            asyncio.create_task(_acquire(manager, key, holder))
+            for holder in ("s1", "s2", "s3")
+        ]
+        await _settle()
+        created.set()
+
+        assert await asyncio.gather(*acquisitions) == ["cachedContents/0"] * 3
+        gemini.create_prompt_cache.assert_awaited_once()
+        assert manager.references(key) == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_creation_does_not_block_other_scenarios(self) -> None:
+        """Only acquirers of the key being created wait for it."""
+        gemini = _gemini()
+        stalled = asyncio.Event()
+
+        async def create(*, display_name: str, **_: object) -> str:
+            if "scn-slow" in display_name:
+                await stalled.wait()
+            return display_name
+
+        gemini.create_prompt_cache = AsyncMock(side_effect=create)
+        manager = PromptCacheManager(gemini, model="m")
+        slow = asyncio.create_task(_acquire(manager, _key("scn-slow"), "s1"))
+        await _settle()
+
+        async with asyncio.timeout(1):
+            assert await _acquire(manager, _key("scn-fast"), "s2")
+            manager.release("s2")
+
+        stalled.set()
+        assert await slow
+
+    @pytest.mark.asyncio
+    async def test_refreshes_near_expiry(self) -> None:
+        """A cache inside the refresh margin gets its TTL extended."""
+        clock = _Clock()
+        gemini = _gemini()
+        manager = PromptCacheManager(
+            gemini,
+            model="m",
+            ttl_seconds=100,
+            refresh_margin_seconds=10,
+            clock=clock,
+        )
+        key = _key()
+        await _acquire(manager, key, "s1")
+
+        clock.now = 95
+        assert await _acquire(manager, key, "s1") == "cachedContents/0"
+        await _settle()
+        gemini.refresh_prompt_cache.assert_awaited_once_with(
+            "cachedContents/0",
+            ttl="100s",
+        )
+
+        clock.now = 150
+        assert await _acquire(manager, key, "s1") == "cachedContents/0"
+        gemini.create_prompt_cache.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_is_recreated(self) -> None:
+        """Caches past their TTL are replaced by a fresh one."""
+        clock = _Clock()
+        gemini = _gemini()
+        manager = PromptCacheManager(gemini, model="m", ttl_seconds=100, clock=clock)
+        key = _key()
+        await _acquire(manager, key, "s1")
+
+        clock.now = 100
+        assert await _acquire(manager, key, "s1") == "cachedContents/1"
+
+    @pytest.mark.asyncio
+    async def test_creation_failure_backs_off(self) -> None:
+        """A failed creation returns None and is not retried until cooldown."""
+        clock = _Clock()
+        gemini = _gemini()
+        gemini.create_prompt_cache = AsyncMock(side_effect=RuntimeError("too small"))
+        manager = PromptCacheManager(
+            gemini,
+            model="m",
+            failure_cooldown_seconds=60,
+            clock=clock,
+        )
+        key = _key()
+
+        assert await _acquire(manager, key, "s1") is None
+        assert await _acquire(manager, key, "s1") is None
+        gemini.create_prompt_cache.assert_awaited_once()
+
+        clock.now = 60
+        await _acquire(manager, key, "s1")
+        assert gemini.create_prompt_cache.await_count == 2
+        assert manager._failed_until == {key: 120}
+
+        clock.now = 120
+        await _acquire(manager, _key("other"), "s2")
+        assert manager._failed_until == {_key("other"): 180}
+
+
+class TestEviction:
+    """Tests for capacity-based eviction."""
+
+    @pytest.mark.asyncio
+    async def test_only_unreferenced_caches_are_evicted(self) -> None:
+        """Over capacity, the least recently used idle cache is deleted."""
+        gemini = _gemini()
+        manager = PromptCacheManager(gemini, model="m", max_entries=1)
+
+        await _acquire(manager, _key("a"), "s1")
+        await _acquire(manager, _key("b"), "s2")
+        assert len(manager) == 2
+        gemini.delete_prompt_cache.assert_not_awaited()
+
+        manager.release("s1")
+        assert len(manager) == 1
+        await _settle()
+        gemini.delete_prompt_cache.assert_awaited_once_with("cachedContents/0")
+
+    @pytest.mark.asyncio
+    async def test_aclose_deletes_everything(self) -> None:
+        """Shutdown deletes all caches, referenced or not."""
+        gemini = _gemini()
+        manager = PromptCacheManager(gemini, model="m")
+        await _acquire(manager, _key("a"), "s1")
+
+        await manager.aclose()
+
+        assert len(manager) == 0
+        gemini.delete_prompt_cache.assert_awaited_once_with("cachedContents/0")
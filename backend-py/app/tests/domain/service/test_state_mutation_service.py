@@ -9,6 +9,8 @@ from __future__ import annotations
 import uuid
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.domain.entity.gm_types import (
     FlagChange,
     ItemUpdate,
@@ -420,3 +422,39 @@ class TestApplySessionEnd:
             ending_type="bad_end",
             ending_summary="The hero fell.",
         )
+
+
+class TestContextCacheWriteThrough:
+    """Tests for keeping the GameContext cache in sync with apply."""
+
+    def test_apply_mirrors_changes(self) -> None:
+        """Successful apply forwards the changes to the cache."""
+        cache = MagicMock()
+        svc = _make_svc()
+        svc.cache = cache
+        session_id = uuid.uuid4()
+        changes = StateChanges(
+            flag_changes=[FlagChange(flag_id="found_secret", value=True)],
+        )
+
+        svc.apply(MagicMock(), session_id, changes)
+
+        cache.apply_changes.assert_called_once_with(session_id, changes)
+        cache.invalidate.assert_not_called()
+
+    def test_apply_failure_invalidates(self) -> None:
+        """A failed write drops the cached context instead of mirroring."""
+        cache = MagicMock()
+        svc = _make_svc()
+        svc.cache = cache
+        svc.session_gw.get_by_id.side_effect = RuntimeError("db down")
+        session_id = uuid.uuid4()
+        changes = StateChanges(
+            flag_changes=[FlagChange(flag_id="found_secret", value=True)],
+        )
+
+        with pytest.raises(RuntimeError):
+            svc.apply(MagicMock(), session_id, changes)
+
+        cache.invalidate.assert_called_once_with(session_id)
+        cache.apply_changes.assert_not_called()
@@ -0,0 +1,155 @@
+"""Tests for GameSnapshotGateway."""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import event
+
+from domain.entity.models import Npcs, SceneBackgrounds, Turns
+from gateway.game_snapshot_gateway import GameSnapshotGateway
+from tests.gateway.conftest import _now
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlmodel import Session
+
+    from domain.entity.models import NpcRelationships, Scenarios, Sessions
+
+
+def _add_turns(db_session: Session, session_id: uuid.UUID, count: int) -> None:
+    for i in range(1, count + 1):
+        db_session.add(
+            Turns(
+                id=uuid.uuid4(),
+                session_id=session_id,
+                turn_number=i,
+                input_type="do",
+                input_text=f"Turn {i}",
+                gm_decision_type="narrate",
+                output={"narration_text": f"Response {i}"},
+                created_at=_now(),
+            ),
+        )
+    db_session.commit()
+
+
+class TestGameSnapshotGateway:
+    """Tests for GameSnapshotGateway.load."""
+
+    @pytest.mark.usefixtures("seed_player_character", "seed_objective", "seed_item")
+    def test_load_returns_all_rows(
+        self,
+        db_session: Session,
+        seed_scenario: Scenarios,
+        seed_session: Sessions,
+        seed_npc_relationship: NpcRelationships,
+    ) -> None:
+        """Verify every section of the snapshot is populated."""
+        db_session.add(
+            SceneBackgrounds(
+                id=uuid.uuid4(),
+                location_name="Castle",
+                scenario_id=seed_scenario.id,
+                created_at=_now(),
+            ),
+        )
+        db_session.add(
+            SceneBackgrounds(
+                id=uuid.uuid4(),
+                location_name="Forest",
+                session_id=seed_session.id,
+                created_at=_now(),
+            ),
+        )
+        db_session.commit()
+        _add_turns(db_session, seed_session.id, 2)
+
+        snapshot = GameSnapshotGateway().load(db_session, seed_session.id)
+
+        assert snapshot.session.id == seed_session.id
+        assert snapshot.scenario.id == seed_scenario.id
+        assert snapshot.player is not None
+        assert len(snapshot.npcs) == 1
+        assert snapshot.npcs[0][1] is not None
+        assert snapshot.npcs[0][1].id == seed_npc_relationship.id
+        assert len(snapshot.objectives) == 1
+        assert len(snapshot.items) == 1
+        assert [b.location_name for b in snapshot.backgrounds] == [
+            "Castle",
+            "Forest",
+        ]
+        assert [t.turn_number for t in snapshot.recent_turns] == [2, 1]
+
+    def test_npc_without_relationship(
+        self,
+        db_session: Session,
+        seed_session: Sessions,
+        seed_npc: Npcs,
+    ) -> None:
+        """Verify NPCs without a relationship row are still returned."""
+        snapshot = GameSnapshotGateway().load(db_session, seed_session.id)
+
+        assert snapshot.npcs == [(seed_npc, None)]
+
+    def test_turn_limit(
+        self,
+        db_session: Session,
+        seed_session: Sessions,
+    ) -> None:
+        """Verify only the newest turns up to the limit are returned."""
+        _add_turns(db_session, seed_session.id, 4)
+
+        snapshot = GameSnapshotGateway().load(
+            db_session,
+            seed_session.id,
+            turn_limit=2,
+        )
+
+        assert [t.turn_number for t in snapshot.recent_turns] == [4, 3]
+
+    def test_query_count_is_independent_of_npc_count(
+        self,
+        db_engine: Engine,
+        db_session: Session,
+        seed_session: Sessions,
+    ) -> None:
+        """Verify adding NPCs does not add queries."""
+        for i in range(3):
+            db_session.add(
+                Npcs(
+                    id=uuid.uuid4(),
+                    session_id=seed_session.id,
+                    name=f"NPC {i}",
+                    profile={},
+                    goals={},
+                    state={},
+                    created_at=_now(),
+                    updated_at=_now(),
+                ),
+            )
+        db_session.commit()
+        db_session.refresh(seed_session)
+        statements: list[str] = []
+
+        def _count(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        event.listen(db_engine, "before_cursor_execute", _count)
+        try:
+            GameSnapshotGateway().load(
+                db_session,
+                seed_session.id,
+                game_session=seed_session,
+            )
+        finally:
+            event.remove(db_engine, "before_cursor_execute", _count)
+
+        assert len(statements) == 7
+
+    def test_missing_session_raises(self, db_session: Session) -> None:
+        """Verify a missing session raises ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            GameSnapshotGateway().load(db_session, uuid.uuid4())
@@ -0,0 +1,100 @@
+"""Tests for run_in_session (sync gateways on Session / AsyncSession)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from gateway.session_gateway import SessionGateway
+from gateway.session_runner import is_async_session, run_in_session
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from sqlalchemy.engine import Engine
+
+    from domain.entity.models import Sessions
+
+
+@pytest.fixture
+async def async_db_session(db_engine: Engine) -> AsyncGenerator[AsyncSession]:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = db_engine.url.set(drivername="postgresql+asyncpg")
+    engine = create_async_engine(url)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+class TestRunInSession:
+    """Tests for run_in_session dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_sync_session_is_passed_through(self) -> None:
+        """A plain Session is handed to the callable unchanged."""
+        db = MagicMock()
+
+        result = await run_in_session(db, lambda s: s)
+
+        assert result is db
+        assert is_async_session(db) is False
+
+    @pytest.mark.asyncio
+    async def test_async_session_runs_gateway_via_run_sync(
+        self,
+        async_db_session: AsyncSession,
+        seed_session: Sessions,
+    ) -> None:
+        """Sync gateway methods work unchanged on an AsyncSession."""
+        gw = SessionGateway()
+
+        result = await run_in_session(
+            async_db_session,
+            lambda s: gw.get_by_id(s, seed_session.id),
+        )
+
+        assert result is not None
+        assert result.id == seed_session.id
+        assert is_async_session(async_db_session) is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_on_one_async_session_are_serialised(
+        self,
+        async_db_session: AsyncSession,
+        seed_session: Sessions,
+    ) -> None:
+        """Concurrent callers sharing one AsyncSession do not collide."""
+        gw = SessionGateway()
+
+        results = await asyncio.gather(
+            *(
+                run_in_session(
+                    async_db_session,
+                    lambda s: gw.get_by_id(s, seed_session.id),
+                )
+                for _ in range(5)
+            ),
+        )
+
+        assert all(r is not None and r.id == seed_session.id for r in results)
+
+    @pytest.mark.asyncio
+    async def test_writes_commit_through_async_session(
+        self,
+        async_db_session: AsyncSession,
+        seed_session: Sessions,
+    ) -> None:
+        """Gateway writes (commit + refresh) go through the async driver."""
+        gw = SessionGateway()
+
+        new_turn = await run_in_session(
+            async_db_session,
+            lambda s: gw.increment_turn(s, seed_session.id),
+        )
+
+        assert new_turn == 1
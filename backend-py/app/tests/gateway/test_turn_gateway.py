@@ -5,6 +5,8 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
+import pytest
+
 from domain.entity.models import Turns
 from gateway.turn_gateway import TurnGateway
 from tests.gateway.conftest import _now
@@ -73,6 +75,20 @@ class TestTurnGateway:
 
         assert recent == []
 
+    def test_get_after_returns_newer_turns_ascending(
+        self, db_session: Session, seed_session: Sessions
+    ) -> None:
+        """Verify get_after returns only later turns, oldest first, limited."""
+        gw = TurnGateway()
+        for i in range(1, 6):
+            turn = _new_turn(seed_session.id)
+            turn.turn_number = i
+            gw.create(db_session, turn)
+
+        turns = gw.get_after(db_session, seed_session.id, after_turn=2, limit=2)
+
+        assert [t.turn_number for t in turns] == [3, 4]
+
     def test_get_latest_returns_most_recent_turn(
         self, db_session: Session, seed_session: Sessions
     ) -> None:
@@ -105,3 +121,40 @@ class TestTurnGateway:
         latest = gw.get_latest(db_session, seed_session.id)
 
         assert latest is None
+
+    def test_create_next_allocates_sequential_numbers(
+        self, db_session: Session, seed_session: Sessions
+    ) -> None:
+        """Verify create_next bumps the session counter and inserts the turn."""
+        gw = TurnGateway()
+
+        numbers = [
+            gw.create_next(db_session, _new_turn(seed_session.id)) for _ in range(3)
+        ]
+
+        assert numbers == [1, 2, 3]
+        assert seed_session.current_turn_number == 3
+        latest = gw.get_latest(db_session, seed_session.id)
+        assert latest is not None
+        assert latest.turn_number == 3
+        assert latest.output == {"narration_text": "Quiet."}
+
+    def test_create_next_missing_session_raises(self, db_session: Session) -> None:
+        """Verify create_next raises ValueError for an unknown session."""
+        gw = TurnGateway()
+
+        with pytest.raises(ValueError, match="not found"):
+            gw.create_next(db_session, _new_turn(uuid.uuid4()))
+
+
+def _new_turn(session_id: uuid.UUID) -> Turns:
+    return Turns(
+        id=uuid.uuid4(),
+        session_id=session_id,
+        turn_number=0,
+        input_type="do",
+        input_text="Wait",
+        gm_decision_type="narrate",
+        output={"narration_text": "Quiet."},
+        created_at=_now(),
+    )
@@ -0,0 +1,82 @@
+"""Tests for unit_of_work transaction grouping."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from gateway.session_gateway import SessionGateway
+from gateway.unit_of_work import in_unit_of_work, unit_of_work
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+    from domain.entity.models import Sessions
+
+
+class TestUnitOfWork:
+    """Tests for unit_of_work."""
+
+    def test_writes_commit_once(
+        self, db_session: Session, seed_session: Sessions
+    ) -> None:
+        """Verify several gateway writes produce a single commit."""
+        gw = SessionGateway()
+        commits: list[object] = []
+        event.listen(db_session, "after_commit", commits.append)
+        try:
+            with unit_of_work(db_session):
+                gw.update_state(db_session, seed_session.id, {"phase": "battle"})
+                gw.increment_turn(db_session, seed_session.id)
+                gw.increment_turn(db_session, seed_session.id)
+                assert in_unit_of_work(db_session)
+        finally:
+            event.remove(db_session, "after_commit", commits.append)
+
+        assert len(commits) == 1
+        assert not in_unit_of_work(db_session)
+        db_session.refresh(seed_session)
+        assert seed_session.current_turn_number == 2
+        assert seed_session.current_state == {"phase": "battle"}
+
+    def test_error_rolls_back_everything(
+        self, db_engine: Engine, db_session: Session, seed_session: Sessions
+    ) -> None:
+        """Verify a failure inside the block leaves no partial writes."""
+        gw = SessionGateway()
+
+        def _fail_midway() -> None:
+            with unit_of_work(db_session):
+                gw.update_state(db_session, seed_session.id, {"phase": "battle"})
+                gw.increment_turn(db_session, seed_session.id)
+                msg = "boom"
+                raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError):
+            _fail_midway()
+
+        with Session(db_engine) as fresh:
+            row = gw.get_by_id(fresh, seed_session.id)
+            assert row is not None
+            assert row.current_turn_number == 0
+            assert row.current_state == {"phase": "exploration"}
+
+    def test_nested_joins_outer(
+        self, db_session: Session, seed_session: Sessions
+    ) -> None:
+        """Verify an inner block does not commit on its own."""
+        gw = SessionGateway()
+        commits: list[object] = []
+        event.listen(db_session, "after_commit", commits.append)
+        try:
+            with unit_of_work(db_session):
+                with unit_of_work(db_session):
+                    gw.increment_turn(db_session, seed_session.id)
+                assert commits == []
+        finally:
+            event.remove(db_session, "after_commit", commits.append)
+
+        assert len(commits) == 1
@@ -9,6 +9,7 @@ a PostgreSQL URL without a running server as long as no session methods are call
 from __future__ import annotations
 
 import os
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -25,7 +26,8 @@ def _make_memory_service_mock() -> MagicMock:
     代わりに AsyncMock を手動で設定し、呼び出し検証を可能にする。
     """
     mock = MagicMock()
-    mock.trigger_compression_if_due = AsyncMock()
+    mock.schedule_compression_if_due = MagicMock()
+    mock.aclose = AsyncMock()
     mock.add_session_to_memory = AsyncMock()
     mock.search_memory = AsyncMock(return_value=SearchMemoryResponse())
     return mock
@@ -39,6 +41,7 @@ def _make_final_event(json_text: str) -> object:
     """
     event = MagicMock()
     event.is_final_response.return_value = True
+    event.partial = False
     part = MagicMock()
     part.text = json_text
     part.thought = None
@@ -51,6 +54,7 @@ def _make_empty_final_event() -> object:
     """Build a final response event with no content."""
     event = MagicMock()
     event.is_final_response.return_value = True
+    event.partial = False
     event.content = None
     return event
 
@@ -267,6 +271,51 @@ class TestAdkGmClientDecide:
         assert received_session_ids[0] == "same-session"
         assert received_session_ids[1] == "same-session"
 
+    @pytest.mark.asyncio
+    async def test_ephemeral_decide_uses_in_memory_session(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ephemeral=True runs on the in-memory runner and discards the session."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from src.infra.adk_gm_client import AdkGmClient
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        in_memory = client._ephemeral_runner.session_service
+        decision = GmDecisionResponse(decision_type="narrate", narration_text="Hi.")
+
+        async def fake_run_async(**kwargs: object) -> object:
+            await in_memory.create_session(
+                app_name="gm",
+                user_id=str(kwargs["user_id"]),
+                session_id=str(kwargs["session_id"]),
+            )
+            yield _make_final_event(decision.model_dump_json())
+
+        async def db_run_async(**_: object) -> object:
+            pytest.fail("the database-backed runner must not be used")
+            yield  # pragma: no cover
+
+        client._ephemeral_runner.run_async = fake_run_async  # type: ignore[assignment]
+        client._runner.run_async = db_run_async  # type: ignore[assignment]
+
+        result = await client.decide(
+            prompt="Look around.",
+            session_id="single-shot",
+            game_session_id="test-game-session",
+            ephemeral=True,
+        )
+
+        assert result.narration_text == "Hi."
+        assert (
+            await in_memory.get_session(
+                app_name="gm",
+                user_id="test-game-session",
+                session_id="single-shot",
+            )
+            is None
+        )
+
     @pytest.mark.asyncio
     async def test_decide_skips_non_final_events(
         self, monkeypatch: pytest.MonkeyPatch
@@ -284,6 +333,7 @@ class TestAdkGmClientDecide:
 
         non_final = MagicMock()
         non_final.is_final_response.return_value = False
+        non_final.partial = False
         final = _make_final_event(decision.model_dump_json())
 
         async def fake_run_async(**_: object) -> object:
@@ -317,6 +367,7 @@ class TestAdkGmClientDecide:
 
         event = MagicMock()
         event.is_final_response.return_value = True
+        event.partial = False
         thought_part = MagicMock()
         thought_part.text = "Internal reasoning text that is not valid JSON"
         thought_part.thought = True  # must be excluded
@@ -354,6 +405,7 @@ class TestAdkGmClientDecide:
 
         event = MagicMock()
         event.is_final_response.return_value = True
+        event.partial = False
         part = MagicMock()
         part.text = "   "  # whitespace only — text.strip() is empty
         part.thought = None
@@ -505,10 +557,10 @@ class TestAdkGmClientDecide:
         assert "<PAST_CONVERSATIONS>" not in received_prompt[0]
 
     @pytest.mark.asyncio
-    async def test_decide_calls_trigger_compression_after_decision(
+    async def test_decide_schedules_compression_after_decision(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """trigger_compression_if_due() must be called after decide()."""
+        """decide() must queue compression without awaiting it."""
         monkeypatch.setenv("GEMINI_API_KEY", "test-key")
 
         from src.infra.adk_gm_client import AdkGmClient
@@ -529,7 +581,7 @@ class TestAdkGmClientDecide:
             game_session_id="11111111-1111-1111-1111-111111111111",
         )
 
-        memory_mock.trigger_compression_if_due.assert_awaited_once_with(
+        memory_mock.schedule_compression_if_due.assert_called_once_with(
             "11111111-1111-1111-1111-111111111111"
         )
 
@@ -616,6 +668,120 @@ class TestAdkGmClientDecide:
         delete_mock.assert_awaited_once()
 
 
+class TestAdkGmClientNodeStreaming:
+    """Tests for decide(on_node=...) incremental node delivery."""
+
+    @staticmethod
+    def _make_partial_event(text: str) -> object:
+        event = MagicMock()
+        event.partial = True
+        event.is_final_response.return_value = False
+        part = MagicMock()
+        part.text = text
+        part.thought = None
+        event.content = MagicMock()
+        event.content.parts = [part]
+        return event
+
+    @pytest.mark.asyncio
+    async def test_on_node_called_per_completed_node(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each node is reported once its JSON object closes in the stream."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from google.adk.agents.run_config import StreamingMode
+
+        from src.domain.entity.gm_types import SceneNode
+        from src.infra.adk_gm_client import AdkGmClient
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        decision = GmDecisionResponse(
+            decision_type="narrate",
+            narration_text="Summary.",
+            nodes=[
+                SceneNode(type="narration", text="First."),
+                SceneNode(type="narration", text="Second."),
+            ],
+        )
+        text = decision.model_dump_json()
+        cut = text.index("Second.")
+        received: list[tuple[int, str | None]] = []
+        seen_before_final: list[int] = []
+        run_configs: list[object] = []
+
+        async def fake_run_async(**kwargs: object) -> object:
+            run_configs.append(kwargs.get("run_config"))
+            yield self._make_partial_event(text[:cut])
+            seen_before_final.append(len(received))
+            yield self._make_partial_event(text[cut:])
+            yield _make_final_event(text)
+
+        client._runner.run_async = fake_run_async  # type: ignore[assignment]
+
+        result = await client.decide(
+            prompt="test",
+            session_id="s",
+            game_session_id="g",
+            on_node=lambda i, node: received.append((i, node.text)),
+        )
+
+        assert seen_before_final == [1]
+        assert received == [(0, "First."), (1, "Second.")]
+        assert result.nodes is not None
+        assert len(result.nodes) == 2
+        assert getattr(run_configs[0], "streaming_mode", None) == StreamingMode.SSE
+
+    @pytest.mark.asyncio
+    async def test_invalid_node_skipped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A streamed element that is not a valid SceneNode is not reported."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from src.infra.adk_gm_client import AdkGmClient
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        decision = GmDecisionResponse(decision_type="narrate", narration_text="ok")
+        received: list[int] = []
+
+        async def fake_run_async(**_: object) -> object:
+            yield self._make_partial_event('{"nodes": [{"type": 42}]')
+            yield _make_final_event(decision.model_dump_json())
+
+        client._runner.run_async = fake_run_async  # type: ignore[assignment]
+
+        await client.decide(
+            prompt="test",
+            session_id="s",
+            game_session_id="g",
+            on_node=lambda i, _node: received.append(i),
+        )
+
+        assert received == []
+
+    @pytest.mark.asyncio
+    async def test_no_streaming_without_listener(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without on_node the runner is called without a streaming config."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from src.infra.adk_gm_client import AdkGmClient
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        decision = GmDecisionResponse(decision_type="narrate", narration_text="ok")
+        run_configs: list[object] = []
+
+        async def fake_run_async(**kwargs: object) -> object:
+            run_configs.append(kwargs.get("run_config"))
+            yield _make_final_event(decision.model_dump_json())
+
+        client._runner.run_async = fake_run_async  # type: ignore[assignment]
+
+        await client.decide(prompt="test", session_id="s", game_session_id="g")
+
+        assert run_configs == [None]
+
+
 class TestAdkGmClientInit:
     """Tests for AdkGmClient initialization."""
 
@@ -675,3 +841,96 @@ class TestAdkGmClientInit:
         client = AdkGmClient(memory_service=_make_memory_service_mock())
 
         assert client._runner.auto_create_session is True
+
+
+class TestAdkGmClientPromptCache:
+    """Tests for explicit prompt cache injection via before_model_callback."""
+
+    @staticmethod
+    def _request() -> object:
+        from google.adk.models.llm_request import LlmRequest
+        from google.genai import types as genai_types
+
+        return LlmRequest(
+            config=genai_types.GenerateContentConfig(system_instruction="GM"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_content_replaces_system_instruction(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """During decide(cached_content=...) model requests use the cache."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from src.infra.adk_gm_client import AdkGmClient, _apply_prompt_cache
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        llm_request: Any = self._request()
+        decision = GmDecisionResponse(decision_type="narrate", narration_text="ok")
+
+        async def fake_run_async(**_: object) -> object:
+            _apply_prompt_cache(MagicMock(), llm_request)
+            yield _make_final_event(decision.model_dump_json())
+
+        client._runner.run_async = fake_run_async  # type: ignore[assignment]
+
+        await client.decide(
+            prompt="delta",
+            session_id="s",
+            game_session_id="g",
+            cached_content="cachedContents/scenario-1",
+        )
+
+        assert llm_request.config.cached_content == "cachedContents/scenario-1"
+        assert llm_request.config.system_instruction is None
+
+    def test_callback_is_noop_without_cache(self) -> None:
+        """Outside a cached decide() the request is left untouched."""
+        from src.infra.adk_gm_client import _apply_prompt_cache
+
+        llm_request: Any = self._request()
+
+        assert _apply_prompt_cache(MagicMock(), llm_request) is None
+        assert llm_request.config.cached_content is None
+        assert llm_request.config.system_instruction == "GM"
+
+
+class TestAdkGmClientModelRoute:
+    """Tests for per-call model routing via before_model_callback."""
+
+    @pytest.mark.asyncio
+    async def test_route_overrides_model_and_thinking(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """During decide(route=...) model requests use the routed model."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        from google.adk.models.llm_request import LlmRequest
+        from google.genai import types as genai_types
+
+        from src.infra.adk_gm_client import AdkGmClient, _apply_model_route
+        from src.infra.model_router import ModelRoute
+
+        client = AdkGmClient(memory_service=_make_memory_service_mock())
+        routed: Any = LlmRequest(model=AdkGmClient.MODEL)
+        untouched: Any = LlmRequest(model=AdkGmClient.MODEL)
+        decision = GmDecisionResponse(decision_type="narrate", narration_text="ok")
+
+        async def fake_run_async(**_: object) -> object:
+            _apply_model_route(MagicMock(), routed)
+            yield _make_final_event(decision.model_dump_json())
+
+        client._runner.run_async = fake_run_async  # type: ignore[assignment]
+
+        await client.decide(
+            prompt="p",
+            session_id="s",
+            game_session_id="g",
+            route=ModelRoute("gemini-pro", genai_types.ThinkingLevel.LOW),
+        )
+        _apply_model_route(MagicMock(), untouched)
+
+        assert routed.model == "gemini-pro"
+        assert routed.config.thinking_config.thinking_level == "LOW"
+        assert untouched.model == AdkGmClient.MODEL
+        assert untouched.config.thinking_config is None
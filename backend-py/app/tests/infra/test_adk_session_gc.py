@@ -0,0 +1,130 @@
+"""Tests for the orphaned ADK session collector."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from google.adk.sessions import DatabaseSessionService
+from sqlalchemy import DateTime, bindparam, text
+
+from src.infra.adk_session_gc import AdkSessionCollector
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _clock() -> float:
+    return _NOW.timestamp()
+
+
+@pytest.fixture
+async def service(tmp_path: Path) -> AsyncIterator[DatabaseSessionService]:
+    """SQLite-backed session service; its engine is disposed on teardown."""
+    service = DatabaseSessionService(f"sqlite+aiosqlite:///{tmp_path}/adk.db")
+    yield service
+    await service.db_engine.dispose()
+
+
+async def _add_sessions(
+    service: DatabaseSessionService,
+    ages: dict[str, float],
+    *,
+    app_name: str = "gm",
+) -> None:
+    """Create sessions named by key, last updated ``value`` seconds ago."""
+    for session_id, age in ages.items():
+        await service.create_session(
+            app_name=app_name,
+            user_id="game-1",
+            session_id=session_id,
+        )
+        updated = (_NOW - timedelta(seconds=age)).replace(tzinfo=None)
+        async with service.db_engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "UPDATE sessions SET update_time = :updated WHERE id = :id",
+                ).bindparams(bindparam("updated", type_=DateTime)),
+                {"updated": updated, "id": session_id},
+            )
+
+
+async def _remaining(service: DatabaseSessionService, app_name: str = "gm") -> set[str]:
+    response = await service.list_sessions(app_name=app_name, user_id=None)
+    return {s.id for s in response.sessions}
+
+
+class TestAdkSessionCollector:
+    """Tests for AdkSessionCollector."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_only_stale_sessions(
+        self,
+        service: DatabaseSessionService,
+    ) -> None:
+        """Sessions older than max_age are deleted; recent ones are kept."""
+        await _add_sessions(service, {"old": 7200.0, "live": 60.0})
+        collector = AdkSessionCollector(
+            service,
+            "gm",
+            max_age_seconds=3600.0,
+            clock=_clock,
+        )
+
+        assert await collector.collect() == 1
+        assert await _remaining(service) == {"live"}
+
+    @pytest.mark.asyncio
+    async def test_deletions_per_run_are_capped_oldest_first(
+        self,
+        service: DatabaseSessionService,
+    ) -> None:
+        """At most max_deletions sessions are removed per collect()."""
+        await _add_sessions(
+            service,
+            {f"old-{i}": 7200.0 + i for i in range(5)},
+        )
+        collector = AdkSessionCollector(
+            service,
+            "gm",
+            max_deletions=2,
+            clock=_clock,
+        )
+
+        assert await collector.collect() == 2
+        assert await _remaining(service) == {"old-0", "old-1", "old-2"}
+
+    @pytest.mark.asyncio
+    async def test_other_apps_are_untouched(
+        self,
+        service: DatabaseSessionService,
+    ) -> None:
+        """Only sessions of the collector's app are deleted."""
+        await _add_sessions(service, {"old": 7200.0}, app_name="other")
+        collector = AdkSessionCollector(service, "gm", clock=_clock)
+
+        assert await collector.collect() == 0
+        assert await _remaining(service, "other") == {"old"}
+
+    @pytest.mark.asyncio
+    async def test_background_loop_runs_until_closed(
+        self,
+        service: DatabaseSessionService,
+    ) -> None:
+        """start() collects immediately and aclose() stops the loop."""
+        await _add_sessions(service, {"old": 7200.0})
+        collector = AdkSessionCollector(service, "gm", clock=_clock)
+
+        collector.start()
+        for _ in range(100):
+            if not await _remaining(service):
+                break
+            await asyncio.sleep(0.01)
+        await collector.aclose()
+
+        assert await _remaining(service) == set()
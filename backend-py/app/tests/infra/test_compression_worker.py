@@ -0,0 +1,129 @@
+"""Tests for the coalescing background compression worker."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from src.infra.compression_worker import CompressionWorker
+
+_SESSION_A = uuid.UUID("11111111-1111-1111-1111-111111111111")
+_SESSION_B = uuid.UUID("22222222-2222-2222-2222-222222222222")
+
+
+class _GatedCompress:
+    """Compression stub that blocks until released and records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[uuid.UUID] = []
+        self.active = 0
+        self.max_active = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, session_id: uuid.UUID) -> None:
+        self.calls.append(session_id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+
+
+class TestCompressionWorker:
+    """Tests for CompressionWorker scheduling and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_does_not_wait(self) -> None:
+        """schedule() returns before the compression finishes."""
+        compress = _GatedCompress()
+        worker = CompressionWorker(compress)
+
+        worker.schedule(_SESSION_A)
+        await asyncio.sleep(0)
+
+        assert compress.calls == [_SESSION_A]
+        assert len(worker) == 1
+        compress.release.set()
+        await worker.drain()
+
+    @pytest.mark.asyncio
+    async def test_requests_coalesce_per_session(self) -> None:
+        """A burst while running yields exactly one follow-up run."""
+        compress = _GatedCompress()
+        worker = CompressionWorker(compress)
+
+        for _ in range(5):
+            worker.schedule(_SESSION_A)
+            await asyncio.sleep(0)
+        compress.release.set()
+        await worker.wait_idle(_SESSION_A)
+
+        assert compress.calls == [_SESSION_A, _SESSION_A]
+        assert len(worker) == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more sessions compress at once than max_concurrency."""
+        compress = _GatedCompress()
+        worker = CompressionWorker(compress, max_concurrency=1)
+
+        worker.schedule(_SESSION_A)
+        worker.schedule(_SESSION_B)
+        await asyncio.sleep(0.01)
+
+        assert compress.max_active == 1
+        compress.release.set()
+        await worker.drain()
+        assert sorted(compress.calls) == [_SESSION_A, _SESSION_B]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_contained(self) -> None:
+        """A failing compression neither raises nor blocks later runs."""
+        calls: list[uuid.UUID] = []
+
+        async def compress(session_id: uuid.UUID) -> None:
+            calls.append(session_id)
+            if len(calls) == 1:
+                msg = "gemini down"
+                raise RuntimeError(msg)
+
+        worker = CompressionWorker(compress)
+        worker.schedule(_SESSION_A)
+        await worker.wait_idle(_SESSION_A)
+        worker.schedule(_SESSION_A)
+        await worker.wait_idle(_SESSION_A)
+
+        assert calls == [_SESSION_A, _SESSION_A]
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_then_rejects_new_work(self) -> None:
+        """drain() lets running work finish and ignores later requests."""
+        finished: list[uuid.UUID] = []
+
+        async def compress(session_id: uuid.UUID) -> None:
+            await asyncio.sleep(0.01)
+            finished.append(session_id)
+
+        worker = CompressionWorker(compress)
+        worker.schedule(_SESSION_A)
+        await worker.drain()
+        worker.schedule(_SESSION_B)
+        await asyncio.sleep(0.02)
+
+        assert finished == [_SESSION_A]
+
+    @pytest.mark.asyncio
+    async def test_drain_cancels_after_timeout(self) -> None:
+        """Work still running after the timeout is cancelled."""
+        compress = _GatedCompress()
+        worker = CompressionWorker(compress)
+        worker.schedule(_SESSION_A)
+        await asyncio.sleep(0)
+
+        await worker.drain(timeout=0.01)
+
+        assert len(worker) == 0
+        assert compress.active == 0
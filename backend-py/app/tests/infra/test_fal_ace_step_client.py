@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
+import httpx
 import pytest
 
+from src.infra import fal_ace_step_client
 from src.infra.fal_ace_step_client import FalAceStepClient
 
 
@@ -110,6 +113,49 @@ async def test_generate_music_ignores_octet_stream_header(monkeypatch) -> None:
     assert generated.extension == "wav"
 
 
+@pytest.mark.asyncio
+async def test_generate_music_uses_base_url_override(monkeypatch) -> None:
+    monkeypatch.setenv("FAL_API_KEY", "test-key")
+    monkeypatch.setenv("FAL_BASE_URL", "http://127.0.0.1:8787/fal/")
+    fake_client = _FakeFalSyncClient()
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(
+                200,
+                json={"audio": {"url": "http://127.0.0.1:8787/files/a.mp3"}},
+            )
+        return httpx.Response(
+            200,
+            content=b"mp3-bytes",
+            headers={"content-type": "audio/mpeg"},
+        )
+
+    real_async_client = httpx.AsyncClient
+
+    def _mock_async_client(**kwargs: object) -> httpx.AsyncClient:
+        return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(fal_ace_step_client.httpx, "AsyncClient", _mock_async_client)
+    client = FalAceStepClient(client=fake_client)  # type: ignore[arg-type]
+
+    generated = await client.generate_music("calm harbor theme", duration_seconds=30)
+
+    assert fake_client.calls == []
+    assert str(requests[0].url) == (
+        "http://127.0.0.1:8787/fal/fal-ai/ace-step/prompt-to-audio"
+    )
+    assert requests[0].headers["Authorization"] == "Key test-key"
+    assert json.loads(requests[0].content) == {
+        "prompt": "calm harbor theme",
+        "duration": 30,
+    }
+    assert generated.audio_bytes == b"mp3-bytes"
+    assert generated.extension == "mp3"
+
+
 def test_init_raises_without_fal_key(monkeypatch) -> None:
     monkeypatch.delenv("FAL_KEY", raising=False)
     monkeypatch.delenv("FAL_API_KEY", raising=False)
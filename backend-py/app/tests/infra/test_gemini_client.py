@@ -13,6 +13,8 @@ import pytest
 from google.genai import types
 from pydantic import BaseModel
 
+from infra import usage_accounting
+from infra.usage_accounting import UsageAggregator
 from src.infra.gemini_client import GeminiClient
 
 
@@ -162,6 +164,8 @@ class TestGeminiClientGenerateStructured:
             ),
         )
         client._client.aio.interactions.create = AsyncMock(return_value=interaction)
+        aggregator = UsageAggregator()
+        monkeypatch.setattr(usage_accounting, "usage_aggregator", aggregator)
 
         result = await client.generate_structured_with_meta(
             contents="turn prompt",
@@ -178,6 +182,8 @@ class TestGeminiClientGenerateStructured:
         assert result.usage is not None
         assert result.usage.total_tokens == 20
         assert result.usage.cached_tokens == 4
+        (row,) = aggregator.drain()
+        assert (row.purpose, row.call_count, row.total_tokens) == ("decision", 1, 20)
 
         call_kwargs = client._client.aio.interactions.create.call_args.kwargs
         assert call_kwargs["previous_interaction_id"] == "prev_1"
@@ -301,6 +307,19 @@ class TestGeminiClientRuntimeResources:
         assert name == "cachedContents/game-1"
         client._client.aio.caches.create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_refresh_prompt_cache_updates_ttl(self, monkeypatch) -> None:
+        """refresh_prompt_cache should extend the TTL of the named cache."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        client = GeminiClient()
+        client._client.aio.caches.update = AsyncMock()
+
+        await client.refresh_prompt_cache("cachedContents/game-1", ttl="600s")
+
+        kwargs = client._client.aio.caches.update.await_args.kwargs
+        assert kwargs["name"] == "cachedContents/game-1"
+        assert kwargs["config"].ttl == "600s"
+
     @pytest.mark.asyncio
     async def test_delete_prompt_cache_forwards_name(self, monkeypatch) -> None:
         """delete_prompt_cache should forward cache name."""
@@ -326,3 +345,25 @@ class TestGeminiClientRuntimeResources:
         client._client.aio.interactions.delete.assert_awaited_once_with(
             id="interaction_1",
         )
+
+
+class TestGeminiClientAclose:
+    """Tests for releasing pooled connections."""
+
+    @pytest.mark.asyncio
+    async def test_closes_sdk_clients(self, monkeypatch) -> None:
+        """Both the genai and the lazily created OpenAI clients are closed."""
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+        client = GeminiClient()
+        openai_client = client._get_openai_client()
+        openai_client.close = AsyncMock()  # type: ignore[method-assign]
+        aio_close = AsyncMock()
+        client._client.aio.aclose = aio_close  # type: ignore[method-assign]
+
+        await client.aclose()
+
+        aio_close.assert_awaited_once()
+        openai_client.close.assert_awaited_once()
+        assert client._openai_client is None
@@ -0,0 +1,205 @@
+"""Tests for process-wide LLM admission control."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.infra.llm_admission import (
+    DEFAULT_LIMITS,
+    AdmissionClass,
+    AdmissionController,
+    AdmissionRejectedError,
+    ClassLimits,
+)
+from src.infra.usage_accounting import UsagePurpose
+from util.logging import StageTimer, bind_stage_timer, reset_stage_timer
+
+
+async def _settle() -> None:
+    """Let woken waiters run up to their next await."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionClass:
+    """Tests for AdmissionClass."""
+
+    def test_every_purpose_has_a_class(self) -> None:
+        """Usage purposes map to the class of the same name."""
+        for purpose in UsagePurpose:
+            assert AdmissionClass.for_purpose(purpose).name == purpose.name
+
+    def test_interactive_classes_come_first(self) -> None:
+        """Decisions outrank endings, images and compression."""
+        assert (
+            AdmissionClass.DECISION
+            < AdmissionClass.ENDING
+            < AdmissionClass.IMAGE
+            < AdmissionClass.COMPRESSION
+        )
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    async def test_grants_waiters_in_priority_order(self) -> None:
+        """When a slot frees up the highest-priority waiter gets it."""
+        controller = AdmissionController(max_concurrency=1)
+        order: list[AdmissionClass] = []
+
+        async def call(admission_class: AdmissionClass) -> None:
+            async with controller.admit(admission_class):
+                order.append(admission_class)
+
+        await controller.acquire(AdmissionClass.DECISION)
+        waiters = [
+            asyncio.create_task(call(admission_class))
+            for admission_class in (
+                AdmissionClass.COMPRESSION,
+                AdmissionClass.IMAGE,
+                AdmissionClass.DECISION,
+            )
+        ]
+        await _settle()
+        controller.release(AdmissionClass.DECISION)
+        await asyncio.gather(*waiters)
+
+        assert order == [
+            AdmissionClass.DECISION,
+            AdmissionClass.IMAGE,
+            AdmissionClass.COMPRESSION,
+        ]
+
+    async def test_class_limit_leaves_room_for_other_classes(self) -> None:
+        """A saturated class queues while other classes are still admitted."""
+        controller = AdmissionController(
+            {AdmissionClass.COMPRESSION: ClassLimits(concurrency=1, max_queue=4)},
+            max_concurrency=4,
+        )
+        await controller.acquire(AdmissionClass.COMPRESSION)
+
+        queued = asyncio.create_task(controller.acquire(AdmissionClass.COMPRESSION))
+        await _settle()
+        await controller.acquire(AdmissionClass.DECISION)
+
+        stats = controller.stats()
+        assert not queued.done()
+        assert stats["compression"]["queued"] == 1
+        assert stats["decision"]["in_flight"] == 1
+
+        controller.release(AdmissionClass.COMPRESSION)
+        await queued
+        assert controller.stats()["compression"]["in_flight"] == 1
+
+    async def test_sheds_when_queue_is_full(self) -> None:
+        """A call beyond the class queue bound fails fast."""
+        controller = AdmissionController(
+            {AdmissionClass.IMAGE: ClassLimits(concurrency=1, max_queue=1)},
+        )
+        await controller.acquire(AdmissionClass.IMAGE)
+        queued = asyncio.create_task(controller.acquire(AdmissionClass.IMAGE))
+        await _settle()
+
+        with pytest.raises(AdmissionRejectedError, match="queue_full"):
+            await controller.acquire(AdmissionClass.IMAGE)
+
+        assert controller.stats()["image"]["shed"] == 1
+        queued.cancel()
+
+    async def test_sheds_after_max_wait(self) -> None:
+        """A call that waits longer than its class allows is shed."""
+        controller = AdmissionController(
+            {
+                AdmissionClass.COMPRESSION: ClassLimits(
+                    concurrency=1,
+                    max_queue=4,
+                    max_wait_seconds=0.01,
+                ),
+            },
+        )
+        await controller.acquire(AdmissionClass.COMPRESSION)
+
+        with pytest.raises(AdmissionRejectedError, match="wait_timeout"):
+            await controller.acquire(AdmissionClass.COMPRESSION)
+
+        stats = controller.stats()["compression"]
+        assert stats["queued"] == 0
+        assert stats["shed"] == 1
+
+    async def test_cancelled_waiter_does_not_leak_a_slot(self) -> None:
+        """Cancelling a queued call removes it without consuming capacity."""
+        controller = AdmissionController(max_concurrency=1)
+        await controller.acquire(AdmissionClass.DECISION)
+        queued = asyncio.create_task(controller.acquire(AdmissionClass.ENDING))
+        await _settle()
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        controller.release(AdmissionClass.DECISION)
+
+        stats = controller.stats()
+        assert stats["ending"]["queued"] == 0
+        assert stats["ending"]["in_flight"] == 0
+        async with asyncio.timeout(1):
+            await controller.acquire(AdmissionClass.ENDING)
+
+    async def test_records_queue_wait_on_stage_timer(self) -> None:
+        """Calls that had to queue report the wait as ``llm_queue``."""
+        controller = AdmissionController(max_concurrency=1)
+        timer = StageTimer()
+        token = bind_stage_timer(timer)
+        try:
+            await controller.acquire(AdmissionClass.DECISION)
+            assert "llm_queue" not in timer.as_dict()
+
+            queued = asyncio.create_task(controller.acquire(AdmissionClass.DECISION))
+            await _settle()
+            controller.release(AdmissionClass.DECISION)
+            await queued
+        finally:
+            reset_stage_timer(token)
+
+        assert "llm_queue" in timer.as_dict()
+        assert controller.stats()["decision"]["admitted"] == 2
+
+
+class TestAdmissionControllerFromEnv:
+    """Tests for environment configuration."""
+
+    async def test_reads_limits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Total and per-class concurrency come from LLM_ADMISSION_*."""
+        monkeypatch.setenv("LLM_ADMISSION_MAX_CONCURRENCY", "2")
+        monkeypatch.setenv("LLM_ADMISSION_IMAGE_CONCURRENCY", "1")
+
+        controller = AdmissionController.from_env()
+        await controller.acquire(AdmissionClass.IMAGE)
+        image = asyncio.create_task(controller.acquire(AdmissionClass.IMAGE))
+        await _settle()
+        await controller.acquire(AdmissionClass.DECISION)
+        decision = asyncio.create_task(controller.acquire(AdmissionClass.DECISION))
+        await _settle()
+
+        assert not image.done()
+        assert not decision.done()
+        image.cancel()
+        decision.cancel()
+
+    async def test_invalid_values_use_defaults(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Malformed or non-positive limits are ignored."""
+        monkeypatch.setenv("LLM_ADMISSION_MAX_CONCURRENCY", "0")
+        monkeypatch.setenv("LLM_ADMISSION_IMAGE_CONCURRENCY", "many")
+
+        controller = AdmissionController.from_env()
+        async with asyncio.timeout(1):
+            for _ in range(DEFAULT_LIMITS[AdmissionClass.IMAGE].concurrency):
+                await controller.acquire(AdmissionClass.IMAGE)
+
+        assert controller.stats()["image"]["in_flight"] == (
+            DEFAULT_LIMITS[AdmissionClass.IMAGE].concurrency
+        )
@@ -0,0 +1,234 @@
+"""Tests for error-classified LLM retries and circuit breakers."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import openai
+import pytest
+from google.genai import errors as genai_errors
+from pydantic import BaseModel
+
+# llm_retry resolves the app's ``infra`` package, not ``src.infra``.
+from infra.llm_admission import AdmissionRejectedError
+from src.infra.llm_retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    InvalidOutputError,
+    LlmErrorKind,
+    RetryPolicy,
+    call_with_retry,
+    circuit_breaker,
+    classify_error,
+)
+
+_NO_WAIT = RetryPolicy(base_delay=0.0, rate_limit_base_delay=0.0)
+
+
+class _Sample(BaseModel):
+    value: int
+
+
+def _validation_error() -> Exception:
+    try:
+        _Sample.model_validate_json('{"value": "x"}')
+    except Exception as exc:
+        return exc
+    msg = "expected a validation error"
+    raise AssertionError(msg)
+
+
+def _openai_status_error(status: int) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/images")
+    response = httpx.Response(status, request=request)
+    return openai.APIStatusError("error", response=response, body=None)
+
+
+class TestClassifyError:
+    """Tests for classify_error()."""
+
+    @pytest.mark.parametrize(
+        ("exc", "kind"),
+        [
+            (genai_errors.APIError(429, {}), LlmErrorKind.RATE_LIMITED),
+            (genai_errors.APIError(503, {}), LlmErrorKind.TRANSIENT),
+            (genai_errors.APIError(408, {}), LlmErrorKind.TRANSIENT),
+            (genai_errors.APIError(400, {}), LlmErrorKind.FATAL),
+            (_openai_status_error(429), LlmErrorKind.RATE_LIMITED),
+            (_openai_status_error(500), LlmErrorKind.TRANSIENT),
+            (_openai_status_error(401), LlmErrorKind.FATAL),
+            (InvalidOutputError("empty"), LlmErrorKind.INVALID_OUTPUT),
+            (json.JSONDecodeError("bad", "", 0), LlmErrorKind.INVALID_OUTPUT),
+            (_validation_error(), LlmErrorKind.INVALID_OUTPUT),
+            (TimeoutError(), LlmErrorKind.TRANSIENT),
+            (RuntimeError("connection reset"), LlmErrorKind.TRANSIENT),
+            (ValueError("missing key"), LlmErrorKind.FATAL),
+            (CircuitOpenError("open"), LlmErrorKind.FATAL),
+            (AdmissionRejectedError("shed"), LlmErrorKind.FATAL),
+        ],
+    )
+    def test_kinds(self, exc: Exception, kind: LlmErrorKind) -> None:
+        """Each error maps to the expected handling class."""
+        assert classify_error(exc) is kind
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy.delay()."""
+
+    def test_fatal_and_exhausted_give_up(self) -> None:
+        """Fatal errors and the last attempt are not retried."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.delay(LlmErrorKind.FATAL, 1) is None
+        assert policy.delay(LlmErrorKind.TRANSIENT, 3) is None
+
+    def test_invalid_output_retries_immediately(self) -> None:
+        """Invalid output is resampled without waiting."""
+        assert RetryPolicy().delay(LlmErrorKind.INVALID_OUTPUT, 1) == 0.0
+
+    def test_backoff_is_jittered_and_capped(self) -> None:
+        """Delays stay within the exponential ceiling and max_delay."""
+        policy = RetryPolicy(
+            max_attempts=10,
+            base_delay=1.0,
+            rate_limit_base_delay=4.0,
+            max_delay=6.0,
+        )
+
+        for _ in range(50):
+            transient = policy.delay(LlmErrorKind.TRANSIENT, 2)
+            limited = policy.delay(LlmErrorKind.RATE_LIMITED, 5)
+            assert transient is not None
+            assert 0.0 <= transient <= 2.0
+            assert limited is not None
+            assert 0.0 <= limited <= 6.0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """The threshold of provider failures opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=lambda: 0.0)
+
+        breaker.record_failure(LlmErrorKind.TRANSIENT)
+        breaker.before_call("m")
+        breaker.record_failure(LlmErrorKind.RATE_LIMITED)
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("m")
+
+    def test_non_provider_failures_do_not_count(self) -> None:
+        """Invalid output and fatal errors never open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        breaker.record_failure(LlmErrorKind.INVALID_OUTPUT)
+        breaker.record_failure(LlmErrorKind.FATAL)
+
+        assert not breaker.is_open
+
+    def test_single_probe_after_reset_timeout(self) -> None:
+        """After the timeout one probe passes; success closes the circuit."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout_seconds=10.0,
+            clock=lambda: now[0],
+        )
+        breaker.record_failure(LlmErrorKind.TRANSIENT)
+        now[0] = 10.0
+
+        breaker.before_call("m")
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("m")
+        breaker.record_success()
+
+        assert not breaker.is_open
+        breaker.before_call("m")
+
+    def test_failed_probe_reopens(self) -> None:
+        """A failing probe restarts the open period."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout_seconds=10.0,
+            clock=lambda: now[0],
+        )
+        breaker.record_failure(LlmErrorKind.TRANSIENT)
+        now[0] = 10.0
+        breaker.before_call("m")
+        breaker.record_failure(LlmErrorKind.TRANSIENT)
+        now[0] = 15.0
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call("m")
+
+
+class TestCallWithRetry:
+    """Tests for call_with_retry()."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_then_succeeds(self) -> None:
+        """Transient failures are retried and the attempt number is passed."""
+        op = AsyncMock(side_effect=[TimeoutError(), "ok"])
+
+        result = await call_with_retry(
+            op,
+            model="test-retry-transient",
+            name="op",
+            policy=_NO_WAIT,
+        )
+
+        assert result == "ok"
+        assert [c.args for c in op.await_args_list] == [(1,), (2,)]
+
+    @pytest.mark.asyncio
+    async def test_fatal_raises_without_retry(self) -> None:
+        """A fatal error is raised from the first attempt."""
+        op = AsyncMock(side_effect=genai_errors.APIError(403, {}))
+
+        with pytest.raises(genai_errors.APIError):
+            await call_with_retry(op, model="test-retry-fatal", name="op")
+
+        assert op.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_exhaustion_raises_last_error(self) -> None:
+        """After max_attempts the last exception propagates."""
+        op = AsyncMock(side_effect=InvalidOutputError("empty"))
+
+        with pytest.raises(InvalidOutputError):
+            await call_with_retry(op, model="test-retry-invalid", name="op")
+
+        assert op.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self) -> None:
+        """With the model's circuit open no call is made at all."""
+        model = "test-retry-open"
+        breaker = circuit_breaker(model)
+        for _ in range(5):
+            breaker.record_failure(LlmErrorKind.TRANSIENT)
+        op = AsyncMock(return_value="ok")
+
+        with pytest.raises(CircuitOpenError):
+            await call_with_retry(op, model=model, name="op")
+
+        op.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_breaker_shared_per_model(self) -> None:
+        """Failures from different callers of one model share a breaker."""
+        model = "test-retry-shared"
+        op = AsyncMock(side_effect=TimeoutError())
+        policy = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+        for _ in range(2):
+            with pytest.raises((TimeoutError, CircuitOpenError)):
+                await call_with_retry(op, model=model, name="op", policy=policy)
+
+        assert circuit_breaker(model).is_open
+        assert op.await_count == 5
@@ -0,0 +1,108 @@
+"""Tests for purpose-based model routing."""
+
+from __future__ import annotations
+
+import pytest
+from google.genai import types as genai_types
+
+from src.infra.model_router import DEFAULT_ROUTES, ModelRoute, ModelRouter
+from src.infra.usage_accounting import UsagePurpose
+
+_FAST = ModelRoute("fast", genai_types.ThinkingLevel.MINIMAL)
+_BEST = ModelRoute("best", genai_types.ThinkingLevel.LOW)
+
+
+def _adaptive_router() -> ModelRouter:
+    return ModelRouter(
+        {UsagePurpose.DECISION: (_BEST, _FAST)},
+        latency_budgets={UsagePurpose.DECISION: 1.0},
+    )
+
+
+def _observe(router: ModelRouter, route: ModelRoute, seconds: float) -> None:
+    for _ in range(ModelRouter.MIN_SAMPLES):
+        router.observe(UsagePurpose.DECISION, route, seconds)
+
+
+class TestModelRoute:
+    """Tests for ModelRoute.parse."""
+
+    def test_parses_model_and_thinking_level(self) -> None:
+        """``model:level`` sets the thinking level; a bare model leaves it unset."""
+        assert ModelRoute.parse(" best:low ") == _BEST
+        assert ModelRoute.parse("best") == ModelRoute("best")
+
+    @pytest.mark.parametrize("spec", ["", ":low", "best:extreme"])
+    def test_rejects_invalid_specs(self, spec: str) -> None:
+        """Empty models and unknown thinking levels are rejected."""
+        with pytest.raises(ValueError, match=r"."):
+            ModelRoute.parse(spec)
+
+
+class TestModelRouterFromEnv:
+    """Tests for environment configuration."""
+
+    def test_defaults_without_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unset variables keep the default route of every purpose."""
+        for purpose in DEFAULT_ROUTES:
+            monkeypatch.delenv(f"GM_MODEL_{purpose.name}", raising=False)
+
+        router = ModelRouter.from_env()
+
+        for purpose, routes in DEFAULT_ROUTES.items():
+            assert router.route(purpose) == routes[0]
+
+    def test_reads_routes_and_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Route lists and latency budgets come from GM_MODEL_<PURPOSE>."""
+        monkeypatch.setenv("GM_MODEL_ENDING", "best:low,fast:minimal")
+        monkeypatch.setenv("GM_MODEL_ENDING_LATENCY_BUDGET_MS", "1000")
+
+        router = ModelRouter.from_env()
+        for _ in range(ModelRouter.MIN_SAMPLES):
+            router.observe(UsagePurpose.ENDING, _BEST, 5.0)
+
+        assert router.primary(UsagePurpose.ENDING) == _BEST
+        assert router.route(UsagePurpose.ENDING) == _FAST
+
+    def test_invalid_route_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A malformed variable is ignored rather than failing startup."""
+        monkeypatch.setenv("GM_MODEL_COMPRESSION", "fast:turbo")
+
+        router = ModelRouter.from_env()
+
+        assert (
+            router.route(UsagePurpose.COMPRESSION)
+            == DEFAULT_ROUTES[UsagePurpose.COMPRESSION][0]
+        )
+
+
+class TestModelRouterAdaptive:
+    """Tests for latency-adaptive routing."""
+
+    def test_prefers_first_route_within_budget(self) -> None:
+        """Without enough samples or within budget the first route is used."""
+        router = _adaptive_router()
+        assert router.route(UsagePurpose.DECISION) == _BEST
+
+        _observe(router, _BEST, 0.5)
+
+        assert router.route(UsagePurpose.DECISION) == _BEST
+
+    def test_falls_back_when_over_budget_and_probes(self) -> None:
+        """A slow preferred route is skipped except on periodic probes."""
+        router = _adaptive_router()
+        _observe(router, _BEST, 3.0)
+
+        routes = [
+            router.route(UsagePurpose.DECISION) for _ in range(ModelRouter.PROBE_EVERY)
+        ]
+
+        assert routes.count(_BEST) == 1
+        assert routes.count(_FAST) == ModelRouter.PROBE_EVERY - 1
+
+    def test_pinned_calls_use_the_primary_route(self) -> None:
+        """Calls bound to one model (prompt caches) never fall back."""
+        router = _adaptive_router()
+        _observe(router, _BEST, 3.0)
+
+        assert router.route(UsagePurpose.DECISION, pinned=True) == _BEST
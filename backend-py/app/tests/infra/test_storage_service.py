@@ -0,0 +1,100 @@
+"""Tests for StorageService."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from src.infra import storage_service
+from src.infra.storage_service import StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@pytest.fixture(autouse=True)
+def _supabase_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SUPABASE_URL", "http://127.0.0.1:54321/")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+    monkeypatch.setattr(StorageService, "BASE_DELAY_SECONDS", 0.0)
+
+
+@pytest.fixture
+def requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[list[httpx.Response]], list[httpx.Request]]:
+    """Route the shared pool to canned responses and record the requests."""
+
+    def install(responses: list[httpx.Response]) -> list[httpx.Request]:
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return responses.pop(0)
+
+        pool = storage_service._StoragePool(max_concurrency=2, timeout_seconds=1.0)
+        pool.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(storage_service, "_pool", pool)
+        return sent
+
+    return install
+
+
+def test_init_raises_without_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("SUPABASE_URL")
+
+    with pytest.raises(ValueError, match="SUPABASE_URL"):
+        StorageService()
+
+
+async def test_upload_image_posts_multipart_upsert(requests) -> None:
+    sent = requests([httpx.Response(200, json={"Key": "ok"})])
+
+    path = await StorageService().upload_image("s1", b"jpeg", "image/jpeg")
+
+    assert path.startswith("sessions/s1/")
+    assert path.endswith(".jpg")
+    request = sent[0]
+    assert request.method == "POST"
+    assert str(request.url) == (
+        f"http://127.0.0.1:54321/storage/v1/object/generated-images/{path}"
+    )
+    assert request.headers["Authorization"] == "Bearer service-key"
+    assert request.headers["x-upsert"] == "true"
+    assert request.headers["content-type"].startswith("multipart/form-data")
+    assert b"jpeg" in request.content
+
+
+async def test_upload_retries_server_errors(requests) -> None:
+    sent = requests([httpx.Response(503), httpx.Response(200, json={})])
+
+    path = await StorageService().upload_audio("bgm/a.mp3", b"mp3", bucket="bgm")
+
+    assert path == "bgm/a.mp3"
+    assert len(sent) == 2
+
+
+async def test_upload_does_not_retry_client_errors(requests) -> None:
+    sent = requests([httpx.Response(400), httpx.Response(200, json={})])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await StorageService().upload_audio("bgm/a.mp3", b"mp3")
+
+    assert len(sent) == 1
+
+
+async def test_download_image_returns_none_after_retries(requests) -> None:
+    sent = requests([httpx.Response(502)] * StorageService.MAX_ATTEMPTS)
+
+    assert await StorageService().download_image("sessions/s1/a.png") is None
+    assert len(sent) == StorageService.MAX_ATTEMPTS
+
+
+async def test_download_image_returns_bytes(requests) -> None:
+    sent = requests([httpx.Response(200, content=b"png")])
+
+    assert await StorageService().download_image("a.png", bucket="avatars") == b"png"
+    assert sent[0].method == "GET"
+    assert sent[0].url.path == "/storage/v1/object/avatars/a.png"
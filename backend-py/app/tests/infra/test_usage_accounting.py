@@ -0,0 +1,200 @@
+"""Tests for per-session LLM usage accounting."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.infra import usage_accounting
+from src.infra.usage_accounting import (
+    UsageAggregator,
+    UsagePurpose,
+    UsageRecord,
+    bind_usage_scope,
+    note_prompt_sections,
+    record_usage,
+    reset_usage_scope,
+    usage_purpose,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from src.domain.entity.models import LlmUsage
+
+_SESSION = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_SCENARIO = uuid.UUID("00000000-0000-0000-0000-0000000000aa")
+_T0 = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _record(**kwargs: object) -> UsageRecord:
+    fields: dict[str, object] = {
+        "model": "flash",
+        "purpose": UsagePurpose.DECISION,
+        "latency_ms": 100.0,
+        "game_session_id": _SESSION,
+        "scenario_id": _SCENARIO,
+    }
+    fields.update(kwargs)
+    return UsageRecord(**fields)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def aggregator(monkeypatch: pytest.MonkeyPatch) -> UsageAggregator:
+    """Replace the process-wide aggregator with a fresh one."""
+    fresh = UsageAggregator(clock=lambda: _T0)
+    monkeypatch.setattr(usage_accounting, "usage_aggregator", fresh)
+    return fresh
+
+
+class TestUsageAggregator:
+    """Tests for UsageAggregator."""
+
+    def test_sums_calls_per_session_purpose_and_model(self) -> None:
+        """Records with the same key are summed; others get their own row."""
+        aggregator = UsageAggregator(clock=lambda: _T0)
+        aggregator.add(_record(prompt_tokens=100, output_tokens=10, latency_ms=50.0))
+        aggregator.add(_record(prompt_tokens=200, output_tokens=30, latency_ms=150.0))
+        aggregator.add(_record(purpose=UsagePurpose.COMPRESSION, prompt_tokens=7))
+
+        rows = {row.purpose: row for row in aggregator.drain()}
+
+        decision = rows["decision"]
+        assert decision.call_count == 2
+        assert decision.prompt_tokens == 300
+        assert decision.output_tokens == 40
+        assert decision.latency_ms_total == 200
+        assert decision.latency_ms_max == 150
+        assert decision.session_id == _SESSION
+        assert decision.scenario_id == _SCENARIO
+        assert rows["compression"].prompt_tokens == 7
+        assert len(aggregator) == 0
+
+    def test_section_tokens_are_summed_per_section(self) -> None:
+        """Per-section prompt estimates accumulate by section name."""
+        aggregator = UsageAggregator(clock=lambda: _T0)
+        aggregator.add(_record(section_tokens={"turns": 40, "npcs": 10}))
+        aggregator.add(_record(section_tokens={"turns": 60}))
+        aggregator.add(_record(purpose=UsagePurpose.IMAGE))
+
+        rows = {row.purpose: row for row in aggregator.drain()}
+
+        assert rows["decision"].section_tokens == {"turns": 100, "npcs": 10}
+        assert rows["image"].section_tokens is None
+
+    def test_drain_closes_the_window(self) -> None:
+        """Each drained window starts where the previous one ended."""
+        now = [_T0]
+        aggregator = UsageAggregator(clock=lambda: now[0])
+        aggregator.add(_record())
+        now[0] = _T0 + timedelta(minutes=1)
+        (first,) = aggregator.drain()
+        aggregator.add(_record())
+        now[0] = _T0 + timedelta(minutes=2)
+        (second,) = aggregator.drain()
+
+        assert (first.window_start, first.window_end) == (
+            _T0,
+            now[0] - timedelta(minutes=1),
+        )
+        assert second.window_start == first.window_end
+        assert second.window_end == now[0]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_rows_and_drops_failed_windows(self) -> None:
+        """A started aggregator writes on flush; a failing write is dropped."""
+        written: list[Sequence[LlmUsage]] = []
+        fail = [True]
+
+        def writer(rows: Sequence[LlmUsage]) -> None:
+            if fail[0]:
+                msg = "db down"
+                raise RuntimeError(msg)
+            written.append(rows)
+
+        aggregator = UsageAggregator(interval_seconds=3600.0)
+        aggregator.add(_record())
+        assert await aggregator.flush() == 0  # not started: window kept
+        assert len(aggregator) == 1
+
+        aggregator.start(writer)
+        assert await aggregator.flush() == 0
+        assert len(aggregator) == 0
+
+        fail[0] = False
+        aggregator.add(_record())
+        await aggregator.aclose()
+
+        assert [len(rows) for rows in written] == [1]
+
+    @pytest.mark.asyncio
+    async def test_background_loop_flushes_on_interval(self) -> None:
+        """The started loop flushes without an explicit call."""
+        written: list[Sequence[LlmUsage]] = []
+        aggregator = UsageAggregator(interval_seconds=0.0)
+        aggregator.add(_record())
+
+        aggregator.start(written.append)
+        for _ in range(50):
+            if written:
+                break
+            await asyncio.sleep(0.01)
+        await aggregator.aclose()
+
+        assert len(written) == 1
+
+
+class TestRecordUsage:
+    """Tests for context-scoped recording."""
+
+    def test_attributes_calls_to_the_bound_scope(
+        self,
+        aggregator: UsageAggregator,
+    ) -> None:
+        """Session, scenario and purpose come from the current context."""
+        token = bind_usage_scope(game_session_id=_SESSION, scenario_id=_SCENARIO)
+        try:
+            record_usage(model="flash", started=time.perf_counter(), prompt_tokens=5)
+            with usage_purpose(UsagePurpose.ENDING):
+                record_usage(model="flash", started=time.perf_counter())
+        finally:
+            reset_usage_scope(token)
+        record_usage(model="flash", started=time.perf_counter())
+
+        rows = {(row.session_id, row.purpose) for row in aggregator.drain()}
+
+        assert rows == {
+            (_SESSION, "decision"),
+            (_SESSION, "ending"),
+            (None, "decision"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_prompt_sections_attach_to_decisions_only(
+        self,
+        aggregator: UsageAggregator,
+    ) -> None:
+        """Noted sections ride on decision calls in the same context."""
+
+        async def turn() -> None:
+            note_prompt_sections({"fixed": 50, "turns": 20})
+            record_usage(model="flash", started=time.perf_counter())
+            record_usage(
+                model="image",
+                started=time.perf_counter(),
+                purpose=UsagePurpose.IMAGE,
+            )
+
+        await asyncio.create_task(turn())
+        record_usage(model="flash", started=time.perf_counter())
+
+        rows = {row.model: row for row in aggregator.drain()}
+
+        assert rows["flash"].call_count == 2
+        assert rows["flash"].section_tokens == {"fixed": 50, "turns": 20}
+        assert rows["image"].section_tokens is None
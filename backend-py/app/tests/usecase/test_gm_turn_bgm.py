@@ -227,6 +227,71 @@ async def test_bgm_update_is_emitted_before_done_event() -> None:
         assert bgm_idx < done_idx
 
 
+def _async_db() -> MagicMock:
+    """AsyncSession stand-in whose run_sync calls fn with a sync mock."""
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    db = MagicMock(spec=AsyncSession)
+    db.info = {}
+    sync_db = MagicMock()
+
+    async def _run_sync(fn: object) -> object:
+        return fn(sync_db)  # type: ignore[operator]
+
+    db.run_sync = AsyncMock(side_effect=_run_sync)
+    return db
+
+
+@pytest.mark.asyncio
+async def test_async_session_routes_db_calls_and_detaches_generation() -> None:
+    with (
+        patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+        patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+    ):
+        from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+        scenario_id = uuid.uuid4()
+        uc = GmTurnUseCase()
+        uc.session_gw.get_by_id = MagicMock(return_value=_session(scenario_id))
+        uc.context_svc.build_context = MagicMock(
+            return_value=_mock_context(),
+        )
+        uc._resolve_decision = AsyncMock(
+            return_value=GmDecisionResponse(
+                decision_type="narrate",
+                narration_text="ok",
+                bgm_mood="mysterious",
+                bgm_music_prompt="deep drones and bells, loopable",
+            ),
+        )
+        uc._persist_turn = MagicMock(return_value=1)
+        uc._evaluate_and_apply = MagicMock(return_value=False)
+        uc.bridge_svc.stream_decision = _empty_stream
+        uc._resolve_backgrounds = _empty_stream
+        uc._resolve_npc_emotion_assets = _empty_stream
+        uc._resolve_npc_images = MagicMock(return_value={})
+        uc.bgm_svc.get_cached_bgm_path = MagicMock(
+            side_effect=[None, "scenarios/any/mysterious.mp3"]
+        )
+        uc.bgm_svc.generate_and_cache = AsyncMock()
+        uc.bgm_svc.generate_and_cache_detached = AsyncMock(
+            return_value="https://cdn.example.com/generated.mp3",
+        )
+        db = _async_db()
+
+        events = await _collect(uc.execute(_request(), db))
+
+        assert any('"type": "bgmUpdate"' in e for e in events)
+        assert db.run_sync.await_count >= 4
+        uc.bgm_svc.generate_and_cache.assert_not_called()
+        uc.bgm_svc.generate_and_cache_detached.assert_awaited_once_with(
+            scenario_id,
+            "mysterious",
+            "deep drones and bells, loopable",
+            session_factory=ANY,
+        )
+
+
 def test_fallback_bgm_prompt_is_instrumental_only() -> None:
     with (
         patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
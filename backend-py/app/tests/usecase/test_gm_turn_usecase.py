@@ -7,6 +7,8 @@ and assetReady pipeline for node-based backgrounds.
 
 from __future__ import annotations
 
+import asyncio
+import uuid
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,11 +24,12 @@ from src.domain.entity.gm_types import (
     StatDelta,
     StateChanges,
 )
+from util.logging import stage_timer_var
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from src.usecase.gm_turn_usecase import GmTurnUseCase
+    from src.usecase.gm_turn_usecase import GmTurnUseCase, _TurnCommit
 
 
 # ---------------------------------------------------------------------------
@@ -126,10 +129,9 @@ def _stub_common(uc: object, *, turn_return: int) -> None:
     """Wire up mutation / persist / compress stubs."""
     uc.mutation_svc.apply = MagicMock()  # type: ignore[attr-defined]
     uc.mutation_svc.apply_session_end = MagicMock()  # type: ignore[attr-defined]
-    uc.session_gw.increment_turn = MagicMock(  # type: ignore[attr-defined]
+    uc.turn_gw.create_next = MagicMock(  # type: ignore[attr-defined]
         return_value=turn_return,
     )
-    uc.turn_gw.create = MagicMock()  # type: ignore[attr-defined]
     uc.npc_gw.get_by_session = MagicMock(  # type: ignore[attr-defined]
         return_value=[],
     )
@@ -784,6 +786,7 @@ def _setup_uc_for_asset_test(
     _stub_common(uc, turn_return=6)
     uc.bridge_svc.stream_decision = _empty_stream  # type: ignore[attr-defined]
     uc.storage_svc = MagicMock()  # type: ignore[attr-defined]
+    uc.storage_svc.download_image = AsyncMock(return_value=b"base-image")
 
 
 # ---------------------------------------------------------------------------
@@ -866,7 +869,7 @@ class TestResolveNodeAssets:
             uc.bg_gw.find_by_id = MagicMock(return_value=None)
             uc.bg_gw.find_by_description = MagicMock(return_value=None)
             uc.gemini.generate_image = AsyncMock(return_value=b"fake-png")
-            uc.storage_svc.upload_image = MagicMock(  # type: ignore[union-attr]
+            uc.storage_svc.upload_image = AsyncMock(  # type: ignore[union-attr]
                 return_value="sessions/img.png",
             )
             uc.bg_gw.create = MagicMock()
@@ -918,7 +921,7 @@ class TestResolveNodeAssets:
             )
             uc.bg_gw.find_by_description = MagicMock(return_value=None)
             uc.gemini.generate_image = AsyncMock(return_value=b"fake-png")
-            uc.storage_svc.upload_image = MagicMock(  # type: ignore[union-attr]
+            uc.storage_svc.upload_image = AsyncMock(  # type: ignore[union-attr]
                 return_value="sessions/dungeon.png",
             )
             uc.bg_gw.create = MagicMock()
@@ -1162,6 +1165,35 @@ def _npc_asset_events(parsed: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+class TestPromptTokenBudget:
+    """Tests for the GM_PROMPT_TOKEN_BUDGET knob."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [(None, 8000), ("12000", 12000), ("zero", 8000), ("0", 8000)],
+    )
+    def test_reads_budget_from_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        raw: str | None,
+        expected: int,
+    ) -> None:
+        """The context budget comes from the env, falling back to the default."""
+        if raw is None:
+            monkeypatch.delenv("GM_PROMPT_TOKEN_BUDGET", raising=False)
+        else:
+            monkeypatch.setenv("GM_PROMPT_TOKEN_BUDGET", raw)
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+
+        assert uc.context_svc.token_budget == expected
+
+
 class TestResolveNpcEmotionAssets:
     """Tests for NPC emotion image resolution in node-based mode."""
 
@@ -1294,8 +1326,8 @@ class TestResolveNpcEmotionAssets:
             )
             _setup_npc_emotion_test(uc, nodes=nodes, npc_records=[guard])
             uc.gemini.generate_image = AsyncMock(return_value=b"fake-png")
-            uc.storage_svc.download_image = MagicMock(return_value=b"base-image")  # type: ignore[union-attr]
-            uc.storage_svc.upload_image = MagicMock(  # type: ignore[union-attr]
+            uc.storage_svc.download_image = AsyncMock(return_value=b"base-image")  # type: ignore[union-attr]
+            uc.storage_svc.upload_image = AsyncMock(  # type: ignore[union-attr]
                 return_value="sessions/guard_surprise.png",
             )
             uc.npc_gw.update_emotion_image = MagicMock()
@@ -1312,12 +1344,131 @@ class TestResolveNpcEmotionAssets:
             assert kwargs["source_image"] == b"base-image"
             assert kwargs["transparent_background"] is True
             assert kwargs["size"] == "1024x1536"
-            uc.storage_svc.download_image.assert_called_once_with(  # type: ignore[union-attr]
+            uc.storage_svc.download_image.assert_awaited_once_with(  # type: ignore[union-attr]
                 "npcs/guard_default.png",
                 "scenario-assets",
             )
             uc.npc_gw.update_emotion_image.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_missing_emotions_generate_concurrently_in_node_order(
+        self,
+    ) -> None:
+        """Emotions start in first-needed order, capped, emitted as they finish."""
+        with (
+            patch(
+                "src.usecase.gm_turn_usecase.GeminiClient",
+                autospec=True,
+            ),
+            patch(
+                "src.usecase.gm_turn_usecase.StorageService",
+                autospec=True,
+            ),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            uc.npc_emotion_concurrency = 2
+
+            expressions = ["surprise", "joy", "fear", "sad"]
+            nodes = [
+                SceneNode(
+                    type="dialogue",
+                    text=expression,
+                    speaker="Guard",
+                    characters=[
+                        CharacterDisplay(npc_name="Guard", expression=expression),
+                    ],
+                )
+                for expression in expressions
+            ]
+            guard = _fake_npc_record(name="Guard", emotion_images={})
+            _setup_npc_emotion_test(uc, nodes=nodes, npc_records=[guard])
+            started: list[str] = []
+            running = 0
+            max_running = 0
+
+            async def generate_image(prompt: str, **_: object) -> bytes:
+                nonlocal running, max_running
+                expression = prompt.split("Expression: ", 1)[1].split(".", 1)[0]
+                started.append(expression)
+                running += 1
+                max_running = max(max_running, running)
+                # The first-needed portrait is the slowest to generate.
+                await asyncio.sleep(0.05 if expression == "surprise" else 0)
+                running -= 1
+                return expression.encode()
+
+            async def upload_image(_session_id: str, image: bytes) -> str:
+                return f"sessions/guard_{image.decode()}.png"
+
+            uc.gemini.generate_image = generate_image
+            uc.storage_svc.upload_image = upload_image  # type: ignore[union-attr]
+            uc.npc_gw.update_emotion_image = MagicMock()
+
+            events = await _collect(uc.execute(_make_request(), MagicMock()))
+            npc_events = _npc_asset_events(_parse_sse_events(events))
+
+            assert started == expressions
+            assert max_running == 2
+            emotion_keys = [
+                e["key"] for e in npc_events if e["key"] != "npc:Guard:default"
+            ]
+            assert emotion_keys == [
+                "npc:Guard:joy",
+                "npc:Guard:fear",
+                "npc:Guard:sad",
+                "npc:Guard:surprise",
+            ]
+            assert uc.npc_gw.update_emotion_image.call_count == len(expressions)
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_and_awaits_generations(self) -> None:
+        """Closing the stream waits for cancelled generations to finish."""
+        with (
+            patch(
+                "src.usecase.gm_turn_usecase.GeminiClient",
+                autospec=True,
+            ),
+            patch(
+                "src.usecase.gm_turn_usecase.StorageService",
+                autospec=True,
+            ),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            cancelled: list[str] = []
+
+            async def generate(
+                _db: object,
+                _session_id: object,
+                _npc_name: str,
+                expression: str,
+                _npc_images: object,
+            ) -> str:
+                if expression == "joy":
+                    return "bucket/joy.png"
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(expression)
+                    raise
+                return "unreachable"
+
+            uc._generate_npc_emotion = generate
+            stream = uc._generate_npc_emotions(
+                MagicMock(),
+                MagicMock(),
+                [("Guard", "joy"), ("Guard", "fear")],
+                {},
+            )
+
+            assert await anext(stream) == ("npc:Guard:joy", "bucket/joy.png")
+            await stream.aclose()
+
+            assert cancelled == ["fear"]
+
     @pytest.mark.asyncio
     async def test_no_image_npc_generates_default(self) -> None:
         """NPC without any images → generate default portrait first, then emotion.
@@ -1368,7 +1519,7 @@ class TestResolveNpcEmotionAssets:
             uc.gemini.generate_image = AsyncMock(
                 side_effect=[b"default-png", b"anger-png"],
             )
-            uc.storage_svc.upload_image = MagicMock(  # type: ignore[union-attr]
+            uc.storage_svc.upload_image = AsyncMock(  # type: ignore[union-attr]
                 side_effect=[
                     "sessions/bandit_default.png",
                     "sessions/bandit_anger.png",
@@ -1424,7 +1575,7 @@ class TestResolveNpcEmotionAssets:
             _setup_npc_emotion_test(uc, nodes=nodes, npc_records=[stranger])
             uc.npc_gw.find_by_name_and_session = MagicMock(return_value=stranger)
             uc.gemini.generate_image = AsyncMock(return_value=b"default-png")
-            uc.storage_svc.upload_image = MagicMock(  # type: ignore[union-attr]
+            uc.storage_svc.upload_image = AsyncMock(  # type: ignore[union-attr]
                 return_value="sessions/stranger_default.png",
             )
             uc.npc_gw.update_image_path = MagicMock()
@@ -1599,7 +1750,7 @@ class TestResolveNpcEmotionAssets:
 
             uc.bridge_svc.stream_decision = _bridge_with_done
             uc.gemini.generate_image = AsyncMock(return_value=b"default-png")
-            uc.storage_svc.upload_image = MagicMock(
+            uc.storage_svc.upload_image = AsyncMock(
                 return_value="sessions/bandit_default.png",
             )
             uc.npc_gw.update_image_path = MagicMock()
@@ -1716,7 +1867,7 @@ class TestResolveNpcEmotionAssets:
 
             # Both background and NPC default call generate_image; same stub is fine
             uc.gemini.generate_image = AsyncMock(return_value=b"fake-image")
-            uc.storage_svc.upload_image = MagicMock(
+            uc.storage_svc.upload_image = AsyncMock(
                 return_value="sessions/image.png",
             )
             uc.npc_gw.update_image_path = MagicMock()
@@ -1798,8 +1949,7 @@ class TestAutoAdvanceUntilUserAction:
 
             uc.mutation_svc.apply = MagicMock()
             uc.mutation_svc.apply_session_end = MagicMock()
-            uc.session_gw.increment_turn = MagicMock(side_effect=[2, 3])
-            uc.turn_gw.create = MagicMock()
+            uc.turn_gw.create_next = MagicMock(side_effect=[2, 3])
             uc.npc_gw.get_by_session = MagicMock(return_value=[])
             uc.npc_gw.get_by_scenario = MagicMock(return_value=[])
 
@@ -1840,7 +1990,7 @@ class TestAutoAdvanceUntilUserAction:
             assert show_continue_values == [False, False]
 
             assert uc.decision_svc.decide.await_count == 2
-            assert uc.turn_gw.create.call_count == 2
+            assert uc.turn_gw.create_next.call_count == 2
             assert uc.context_svc.build_prompt.call_count == 2
 
             second_prompt_call = uc.context_svc.build_prompt.call_args_list[1]
@@ -2035,7 +2185,7 @@ class TestAutoAdvanceUntilUserAction:
             )
 
             _stub_common(uc, turn_return=2)
-            uc.session_gw.increment_turn = MagicMock(side_effect=[2, 3, 4])
+            uc.turn_gw.create_next = MagicMock(side_effect=[2, 3, 4])
 
             async def _stream_decision(
                 _decision: GmDecisionResponse,
@@ -2135,7 +2285,7 @@ class TestAutoAdvanceUntilUserAction:
             )
 
             _stub_common(uc, turn_return=2)
-            uc.session_gw.increment_turn = MagicMock(side_effect=[2, 3])
+            uc.turn_gw.create_next = MagicMock(side_effect=[2, 3])
 
             async def _stream_decision(
                 _decision: GmDecisionResponse,
@@ -2970,3 +3120,499 @@ class TestGetLatestTurn:
 
         assert result is not None
         assert result.turn_number == 42
+
+
+# ---------------------------------------------------------------------------
+# Turn commit (unit of work)
+# ---------------------------------------------------------------------------
+
+
+class TestCommitTurn:
+    """Tests for applying and persisting a turn in one transaction."""
+
+    @staticmethod
+    def _make_uc() -> GmTurnUseCase:
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            return GmTurnUseCase()
+
+    @staticmethod
+    def _commit(uc: GmTurnUseCase) -> _TurnCommit:
+        from src.usecase.gm_turn_usecase import _TurnCommit
+
+        uc.condition_svc.evaluate = MagicMock(
+            return_value=MagicMock(triggered_fail=None, triggered_win=None),
+        )
+        context = MagicMock()
+        context.current_state = {}
+        context.player.stats = {"hp": 10}
+        return _TurnCommit(
+            request=_make_request(),
+            decision=GmDecisionResponse(
+                decision_type="narrate",
+                narration_text="Quiet.",
+                state_changes=StateChanges(
+                    stats_delta=[StatDelta(stat="hp", delta=-1)],
+                ),
+            ),
+            session_id=uuid.UUID(_fake_session().id),
+            context=context,
+            game_session=_fake_session(),
+            is_player_action=True,
+        )
+
+    def test_single_commit_for_apply_and_persist(self) -> None:
+        """Mutations and the turn row are committed once, together."""
+        uc = self._make_uc()
+        _stub_common(uc, turn_return=6)
+        db = MagicMock()
+        db.info = {}
+
+        is_ending, turn_number = uc._commit_turn(db, self._commit(uc))
+
+        assert (is_ending, turn_number) == (False, 6)
+        uc.mutation_svc.apply.assert_called_once()
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
+
+    def test_persist_failure_rolls_back_and_drops_cache(self) -> None:
+        """A failed turn insert rolls back the mutations too."""
+        uc = self._make_uc()
+        _stub_common(uc, turn_return=6)
+        uc.turn_gw.create_next = MagicMock(side_effect=RuntimeError("dup"))
+        uc.context_svc.cache = MagicMock()
+        db = MagicMock()
+        db.info = {}
+        commit = self._commit(uc)
+
+        with pytest.raises(RuntimeError):
+            uc._commit_turn(db, commit)
+
+        db.rollback.assert_called_once()
+        db.commit.assert_not_called()
+        uc.context_svc.cache.invalidate.assert_called_once_with(commit.session_id)
+
+
+# ---------------------------------------------------------------------------
+# Pipelined auto-advance
+# ---------------------------------------------------------------------------
+
+
+class TestPipelinedAutoAdvance:
+    """Tests for overlapping the next GM decision with asset streaming."""
+
+    async def _run(
+        self,
+        *,
+        pipelined: bool,
+        include_timing: bool = False,
+    ) -> tuple[list[str], list[str]]:
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+        uc.pipelined_auto_advance = pipelined
+        uc.session_gw.get_by_id = MagicMock(return_value=_fake_session(turn=1))
+        ctx = _CtxBuilder().build()
+        ctx.current_turn_number = 1
+        ctx.max_turns = 30
+        uc.context_svc.build_context = MagicMock(return_value=ctx)
+        uc.context_svc.build_prompt = MagicMock(return_value="prompt")
+        _stub_common(uc, turn_return=2)
+        uc.turn_gw.create_next = MagicMock(side_effect=[2, 3])
+
+        order: list[str] = []
+        decisions = iter(
+            [
+                GmDecisionResponse(decision_type="narrate", narration_text="One."),
+                GmDecisionResponse(decision_type="choice", narration_text="Two."),
+            ],
+        )
+
+        async def _decide(*_args: object, **_kwargs: object) -> GmDecisionResponse:
+            decision = next(decisions)
+            order.append(f"decide:{decision.narration_text}")
+            timer = stage_timer_var.get()
+            if timer is not None:
+                timer.record("probe_decide", 1.0)
+            return decision
+
+        uc.decision_svc.decide = AsyncMock(side_effect=_decide)
+
+        async def _stream_decision(
+            decision: GmDecisionResponse,
+            **_kwargs: object,
+        ) -> AsyncIterator[str]:
+            # Give a pending next-turn task the chance to run first.
+            await asyncio.sleep(0)
+            order.append(f"stream:{decision.narration_text}")
+            timer = stage_timer_var.get()
+            if timer is not None:
+                timer.record("probe_stream", 1.0)
+            yield 'data: {"type":"done"}\n\n'
+
+        uc.bridge_svc.stream_decision = _stream_decision
+
+        request = _make_request(auto_advance_until_user_action=True)
+        events = await _collect(
+            uc.execute(
+                request.model_copy(update={"include_timing": include_timing}),
+                MagicMock(),
+            ),
+        )
+        return order, events
+
+    @pytest.mark.asyncio
+    async def test_next_decision_overlaps_current_stream(self) -> None:
+        """With pipelining the second decision starts before turn 1 streams."""
+        order, events = await self._run(pipelined=True)
+
+        assert order == ["decide:One.", "decide:Two.", "stream:One.", "stream:Two."]
+        done = [e for e in _parse_sse_events(events) if e.get("type") == "done"]
+        assert [d["will_continue"] for d in done] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_sequential_without_pipelining(self) -> None:
+        """Without pipelining each turn streams before the next decision."""
+        order, _ = await self._run(pipelined=False)
+
+        assert order == ["decide:One.", "stream:One.", "decide:Two.", "stream:Two."]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pipelined", [True, False])
+    async def test_timing_events_cover_one_turn_each(self, *, pipelined: bool) -> None:
+        """Each turn's timing event counts only that turn's stages."""
+        _, events = await self._run(pipelined=pipelined, include_timing=True)
+
+        timings = [e for e in _parse_sse_events(events) if e["type"] == "timing"]
+        assert [t["turn_number"] for t in timings] == [2, 3]
+        for timing in timings:
+            assert timing["stages"]["probe_decide"] == 1.0
+            assert timing["stages"]["probe_stream"] == 1.0
+
+
+class TestTimingEvent:
+    """Tests for the opt-in per-stage timing SSE event."""
+
+    async def _run(self, *, include_timing: bool) -> list[dict[str, Any]]:
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            uc.session_gw.get_by_id = MagicMock(return_value=_fake_session(turn=1))
+            uc.context_svc.build_context = MagicMock(
+                return_value=_CtxBuilder().build(),
+            )
+            uc.context_svc.build_prompt = MagicMock(return_value="prompt")
+            uc.decision_svc.decide = AsyncMock(
+                return_value=GmDecisionResponse(
+                    decision_type="choice",
+                    narration_text="Choose",
+                ),
+            )
+            _stub_common(uc, turn_return=2)
+            uc.bridge_svc.stream_decision = MagicMock(
+                return_value=_async_iter(['data: {"type":"done"}\n\n']),
+            )
+
+            request = _make_request().model_copy(
+                update={"include_timing": include_timing},
+            )
+            events = await _collect(uc.execute(request, MagicMock()))
+        return _parse_sse_events(events)
+
+    @pytest.mark.asyncio
+    async def test_timing_event_precedes_done(self) -> None:
+        """Requested timing is emitted right before done with stage durations."""
+        parsed = await self._run(include_timing=True)
+        types = [e["type"] for e in parsed]
+
+        assert types[-2:] == ["timing", "done"]
+        timing = parsed[-2]
+        assert timing["turn_number"] == 2
+        for stage in ("context", "prompt", "mutation", "persist", "bgm", "total"):
+            assert stage in timing["stages"]
+        assert "persist;dur=" in timing["server_timing"]
+
+    @pytest.mark.asyncio
+    async def test_timing_event_is_opt_in(self) -> None:
+        """No timing event is emitted unless the request asks for it."""
+        parsed = await self._run(include_timing=False)
+
+        assert "timing" not in [e["type"] for e in parsed]
+
+
+class TestPromptCache:
+    """Tests for sending only the prompt delta against a scenario cache."""
+
+    @pytest.mark.asyncio
+    async def test_cached_turn_sends_delta(self) -> None:
+        """With a cache available the delta prompt and cache name are sent."""
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            uc.prompt_cache_enabled = True
+            uc.session_gw.get_by_id = MagicMock(return_value=_fake_session(turn=1))
+            ctx = _CtxBuilder().build()
+            ctx.scenario_id = "scn-1"
+            uc.context_svc.build_context = MagicMock(return_value=ctx)
+            uc.context_svc.build_prompt_cache_seed = MagicMock(return_value="seed")
+            uc.context_svc.build_prompt = MagicMock(return_value="full")
+            uc.context_svc.build_prompt_delta = MagicMock(return_value="delta")
+            uc.gemini.create_prompt_cache.return_value = "cachedContents/scn-1"
+            uc.decision_svc.decide = AsyncMock(return_value=_fake_decision())
+            _stub_common(uc, turn_return=2)
+            uc.bridge_svc.stream_decision = _empty_stream
+
+            await _collect(uc.execute(_make_request(), MagicMock()))
+
+            uc.context_svc.build_prompt.assert_not_called()
+            args, kwargs = uc.decision_svc.decide.await_args
+            assert args == ("delta",)
+            assert kwargs["cached_content"] == "cachedContents/scn-1"
+            create_kwargs = uc.gemini.create_prompt_cache.await_args.kwargs
+            assert create_kwargs["contents"] == "seed"
+            assert create_kwargs["system_instruction"]
+            # The session's reference is dropped once the request finishes.
+            assert len(uc.prompt_cache) == 1
+            assert (
+                sum(uc.prompt_cache.references(key) for key in uc.prompt_cache._entries)
+                == 0
+            )
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_full_prompt(self) -> None:
+        """Without the flag the full prompt is sent and no cache is created."""
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            uc.session_gw.get_by_id = MagicMock(return_value=_fake_session(turn=1))
+            uc.context_svc.build_context = MagicMock(
+                return_value=_CtxBuilder().build(),
+            )
+            uc.context_svc.build_prompt = MagicMock(return_value="full")
+            uc.decision_svc.decide = AsyncMock(return_value=_fake_decision())
+            _stub_common(uc, turn_return=2)
+            uc.bridge_svc.stream_decision = _empty_stream
+
+            await _collect(uc.execute(_make_request(), MagicMock()))
+
+            assert uc.decision_svc.decide.await_args.kwargs["cached_content"] is None
+            uc.gemini.create_prompt_cache.assert_not_called()
+
+
+class TestPartialNodeStreaming:
+    """Tests for relaying GM nodes while the decision is still generating."""
+
+    async def _run(self, *, stream_nodes: bool) -> list[dict[str, Any]]:
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+            uc.session_gw.get_by_id = MagicMock(return_value=_fake_session(turn=1))
+            uc.context_svc.build_context = MagicMock(
+                return_value=_CtxBuilder().build(),
+            )
+            uc.context_svc.build_prompt = MagicMock(return_value="prompt")
+            decision = _fake_nodes_decision()
+
+            async def fake_decide(
+                *_: object,
+                **kwargs: object,
+            ) -> GmDecisionResponse:
+                on_node: Any = kwargs.get("on_node")
+                if on_node is not None:
+                    for index, node in enumerate(decision.nodes or []):
+                        on_node(index, node)
+                        await asyncio.sleep(0)
+                return decision
+
+            uc.decision_svc.decide = AsyncMock(side_effect=fake_decide)
+            _stub_common(uc, turn_return=2)
+            uc.bridge_svc.stream_decision = MagicMock(
+                return_value=_async_iter(
+                    [
+                        'data: {"type":"nodesReady","nodes":[]}\n\n',
+                        'data: {"type":"done"}\n\n',
+                    ],
+                ),
+            )
+
+            request = _make_request().model_copy(
+                update={"stream_nodes": stream_nodes},
+            )
+            events = await _collect(uc.execute(request, MagicMock()))
+        return _parse_sse_events(events)
+
+    @pytest.mark.asyncio
+    async def test_partial_nodes_precede_final_nodes(self) -> None:
+        """Cumulative partial nodesReady events come before the final one."""
+        parsed = await self._run(stream_nodes=True)
+        nodes_events = [e for e in parsed if e["type"] == "nodesReady"]
+
+        partial = [e for e in nodes_events if e.get("partial")]
+        assert partial
+        assert nodes_events[-1].get("partial") is None
+        counts = [len(e["nodes"]) for e in partial]
+        assert counts == sorted(counts)
+        assert counts[-1] == len(_fake_nodes_decision().nodes or [])
+
+    @pytest.mark.asyncio
+    async def test_partial_nodes_are_opt_in(self) -> None:
+        """Without stream_nodes no partial events are emitted."""
+        parsed = await self._run(stream_nodes=False)
+
+        assert not [e for e in parsed if e.get("partial")]
+
+
+class TestEndingNarration:
+    """Tests for closing narration generated after a session-ending turn."""
+
+    async def _run(
+        self,
+        *,
+        single_call: bool,
+        ending_nodes: int,
+        stream_nodes: bool = False,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        with (
+            patch("src.usecase.gm_turn_usecase.GeminiClient", autospec=True),
+            patch("src.usecase.gm_turn_usecase.StorageService", autospec=True),
+        ):
+            from src.usecase.gm_turn_usecase import GmTurnUseCase
+
+            uc = GmTurnUseCase()
+        uc.single_call_ending = single_call
+        session = _fake_session(turn=1)
+        session.ending_type = "victory"
+        session.ending_summary = "The dragon fell."
+        uc.session_gw.get_by_id = MagicMock(return_value=session)
+        uc.context_svc.build_context = MagicMock(return_value=_CtxBuilder().build())
+        uc.context_svc.build_prompt = MagicMock(return_value="prompt")
+        _stub_common(uc, turn_return=2)
+        session_end = StateChanges(
+            session_end=SessionEnd(
+                ending_type="victory",
+                ending_summary="The dragon fell.",
+            ),
+        )
+        closing = [
+            SceneNode(type="narration", text=f"Closing {i}.")
+            for i in range(ending_nodes)
+        ]
+        calls: list[dict[str, Any]] = []
+
+        async def fake_decide(*_: object, **kwargs: Any) -> GmDecisionResponse:  # noqa: ANN401
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return _fake_decision(state_changes=session_end)
+            on_node = kwargs.get("on_node")
+            if on_node is not None:
+                for index, node in enumerate(closing):
+                    on_node(index, node)
+                    # Leave the relay time to forward each node separately.
+                    await asyncio.sleep(0.01)
+            return _fake_decision(
+                nodes=closing,
+                state_changes=session_end if single_call else None,
+            )
+
+        uc.decision_svc.decide = AsyncMock(side_effect=fake_decide)
+        uc.bridge_svc.stream_decision = MagicMock(
+            return_value=_async_iter(
+                [
+                    'data: {"type":"nodesReady","nodes":[]}\n\n',
+                    'data: {"type":"done"}\n\n',
+                ],
+            ),
+        )
+
+        request = _make_request().model_copy(update={"stream_nodes": stream_nodes})
+        events = await _collect(uc.execute(request, MagicMock()))
+        return _parse_sse_events(events), calls[1:]
+
+    @pytest.mark.asyncio
+    async def test_single_call_generates_bounded_sequence(self) -> None:
+        """One ENDING call returns the closing nodes, capped in count."""
+        from src.domain.entity.gm_prompts import MAX_ENDING_NODES
+        from src.infra.usage_accounting import UsagePurpose
+
+        parsed, ending_calls = await self._run(
+            single_call=True,
+            ending_nodes=MAX_ENDING_NODES + 3,
+        )
+
+        assert len(ending_calls) == 1
+        assert ending_calls[0]["purpose"] == UsagePurpose.ENDING
+        assert ending_calls[0]["game_session_id"] == _make_request().session_id
+        types = [e["type"] for e in parsed]
+        assert types.index("done") > len(types) - 3
+        final = [e for e in parsed if e["type"] == "nodesReady"][-1]
+        assert len(final["nodes"]) == MAX_ENDING_NODES
+
+    @pytest.mark.asyncio
+    async def test_closing_nodes_stream_before_final_list(self) -> None:
+        """With stream_nodes the closing nodes are relayed as they parse."""
+        parsed, _ = await self._run(
+            single_call=True,
+            ending_nodes=3,
+            stream_nodes=True,
+        )
+
+        nodes_events = [e for e in parsed if e["type"] == "nodesReady"]
+        partial = [e for e in nodes_events[1:] if e.get("partial")]
+        counts = [len(e["nodes"]) for e in partial]
+        assert len(counts) > 1
+        assert counts == sorted(counts)
+        assert counts[-1] == 3
+        assert nodes_events[-1].get("partial") is None
+        assert len(nodes_events[-1]["nodes"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_streamed_closing_nodes_are_capped(self) -> None:
+        """Nodes beyond MAX_ENDING_NODES are never relayed as partial events."""
+        from src.domain.entity.gm_prompts import MAX_ENDING_NODES
+
+        parsed, _ = await self._run(
+            single_call=True,
+            ending_nodes=MAX_ENDING_NODES + 3,
+            stream_nodes=True,
+        )
+
+        nodes_events = [e for e in parsed if e["type"] == "nodesReady"]
+        partial = [e for e in nodes_events[1:] if e.get("partial")]
+        assert partial
+        assert max(len(e["nodes"]) for e in partial) == MAX_ENDING_NODES
+        assert len(nodes_events[-1]["nodes"]) == MAX_ENDING_NODES
+
+    @pytest.mark.asyncio
+    async def test_turn_by_turn_mode_loops_until_limit(self) -> None:
+        """GM_SINGLE_CALL_ENDING=0 keeps the multi-turn closing loop."""
+        from src.domain.entity.gm_prompts import MAX_CLOSING_TURNS
+
+        parsed, ending_calls = await self._run(single_call=False, ending_nodes=2)
+
+        assert len(ending_calls) == MAX_CLOSING_TURNS
+        final = [e for e in parsed if e["type"] == "nodesReady"][-1]
+        assert len(final["nodes"]) == 2 * MAX_CLOSING_TURNS
@@ -0,0 +1,27 @@
+"""Tests for the DATABASE_URL to asyncpg conversion."""
+
+from __future__ import annotations
+
+from src.util.database_url import to_asyncpg_url
+
+
+class TestToAsyncpgUrl:
+    """Tests for to_asyncpg_url()."""
+
+    def test_switches_dialect_and_keeps_other_params(self) -> None:
+        """The driver becomes asyncpg; unrelated query params survive."""
+        url, connect_args = to_asyncpg_url(
+            "postgresql://u:p@db:5432/app?application_name=gm",
+        )
+
+        assert url == "postgresql+asyncpg://u:p@db:5432/app?application_name=gm"
+        assert connect_args == {}
+
+    def test_sslmode_require_moves_to_connect_args(self) -> None:
+        """The sslmode=require param is dropped and becomes ssl=True."""
+        url, connect_args = to_asyncpg_url(
+            "postgres://u:p@db:5432/app?sslmode=require",
+        )
+
+        assert url == "postgresql+asyncpg://u:p@db:5432/app"
+        assert connect_args == {"ssl": True}
@@ -0,0 +1,37 @@
+"""Tests for environment variable tuning knobs."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.util.env import env_positive_float, env_positive_int
+
+
+class TestEnvPositiveNumbers:
+    """Tests for env_positive_int() and env_positive_float()."""
+
+    def test_reads_positive_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Valid positive values override the default."""
+        monkeypatch.setenv("KNOB_INT", "4")
+        monkeypatch.setenv("KNOB_FLOAT", "2.5")
+
+        assert env_positive_int("KNOB_INT", default=1) == 4
+        assert env_positive_float("KNOB_FLOAT", default=1.0) == 2.5
+
+    @pytest.mark.parametrize("raw", ["", "many", "0", "-3"])
+    def test_invalid_values_use_default(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        raw: str,
+    ) -> None:
+        """Malformed and non-positive values fall back to the default."""
+        monkeypatch.setenv("KNOB", raw)
+
+        assert env_positive_int("KNOB", default=7) == 7
+        assert env_positive_float("KNOB", default=None) is None
+
+    def test_unset_uses_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unset variable returns the default."""
+        monkeypatch.delenv("KNOB", raising=False)
+
+        assert env_positive_float("KNOB", default=30.0) == 30.0
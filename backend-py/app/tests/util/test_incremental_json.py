@@ -0,0 +1,64 @@
+"""Tests for IncrementalArrayParser."""
+
+from __future__ import annotations
+
+import json
+
+from src.util.incremental_json import IncrementalArrayParser
+
+_DOCUMENT = json.dumps(
+    {
+        "decision_type": "narrate",
+        "narration_text": 'He said "nodes": [{"fake": 1}]',
+        "nodes": [
+            {"type": "narration", "text": 'Brace } and \\" quote'},
+            {"type": "dialogue", "characters": [{"npc_name": "A"}]},
+        ],
+        "choices": [{"id": "c1"}],
+    },
+)
+
+
+def _feed_in_chunks(parser: IncrementalArrayParser, size: int) -> list[str]:
+    elements: list[str] = []
+    for start in range(0, len(_DOCUMENT), size):
+        elements.extend(parser.feed(_DOCUMENT[start : start + size]))
+    return elements
+
+
+class TestIncrementalArrayParser:
+    """Tests for IncrementalArrayParser.feed()."""
+
+    def test_whole_document_yields_each_element(self) -> None:
+        """Every object of the target array is returned exactly once."""
+        elements = IncrementalArrayParser("nodes").feed(_DOCUMENT)
+
+        assert [json.loads(e) for e in elements] == json.loads(_DOCUMENT)["nodes"]
+
+    def test_single_character_chunks(self) -> None:
+        """Element boundaries are found regardless of chunk boundaries."""
+        elements = _feed_in_chunks(IncrementalArrayParser("nodes"), 1)
+
+        assert [json.loads(e) for e in elements] == json.loads(_DOCUMENT)["nodes"]
+
+    def test_element_returned_as_soon_as_it_closes(self) -> None:
+        """The first element is available before the second is generated."""
+        parser = IncrementalArrayParser("nodes")
+        cut = _DOCUMENT.index('{"type": "dialogue"')
+
+        first = parser.feed(_DOCUMENT[:cut])
+        rest = parser.feed(_DOCUMENT[cut:])
+
+        assert len(first) == 1
+        assert json.loads(first[0])["type"] == "narration"
+        assert len(rest) == 1
+
+    def test_other_arrays_and_strings_ignored(self) -> None:
+        """Arrays under other keys and look-alikes inside strings are skipped."""
+        elements = IncrementalArrayParser("choices").feed(_DOCUMENT)
+
+        assert [json.loads(e) for e in elements] == [{"id": "c1"}]
+
+    def test_missing_key_yields_nothing(self) -> None:
+        """A document without the key produces no elements."""
+        assert IncrementalArrayParser("missing").feed(_DOCUMENT) == []
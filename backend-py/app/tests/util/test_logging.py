@@ -0,0 +1,69 @@
+"""Tests for stage timing helpers in util.logging."""
+
+from __future__ import annotations
+
+from util.logging import (
+    StageTimer,
+    bind_stage_timer,
+    reset_stage_timer,
+    stage_timer_var,
+    timing_span,
+)
+
+
+class TestStageTimer:
+    """Tests for StageTimer accumulation and formatting."""
+
+    def test_repeated_stages_are_summed(self) -> None:
+        """Durations recorded under the same stage accumulate."""
+        timer = StageTimer()
+        timer.record("gm_decide", 10.0, attempt=1)
+        timer.record("gm_decide", 5.5, attempt=2)
+
+        stages = timer.as_dict()
+        assert stages["gm_decide"] == 15.5
+        assert stages["total"] >= 0
+
+    def test_server_timing_format(self) -> None:
+        """Stages are rendered as Server-Timing metrics."""
+        timer = StageTimer()
+        timer.record("context", 1.25)
+
+        assert timer.server_timing().startswith("context;dur=1.25, total;dur=")
+
+    def test_child_timer_rolls_up_into_parent(self) -> None:
+        """A child keeps its own stages and adds them to its parent."""
+        parent = StageTimer()
+        first = StageTimer(parent=parent)
+        second = StageTimer(parent=parent)
+        first.record("gm_decide", 10.0)
+        second.record("gm_decide", 4.0)
+
+        assert first.as_dict()["gm_decide"] == 10.0
+        assert second.as_dict()["gm_decide"] == 4.0
+        assert parent.as_dict()["gm_decide"] == 14.0
+
+
+class TestTimingSpan:
+    """Tests for the context-bound timing_span helper."""
+
+    def test_records_into_bound_timer(self) -> None:
+        """Spans are recorded on the timer bound to the current context."""
+        timer = StageTimer()
+        token = bind_stage_timer(timer)
+        try:
+            with timing_span("persist"):
+                pass
+        finally:
+            reset_stage_timer(token)
+
+        assert "persist" in timer.as_dict()
+        assert stage_timer_var.get() is None
+
+    def test_noop_without_timer(self) -> None:
+        """Without a bound timer the block still runs."""
+        ran = False
+        with timing_span("persist"):
+            ran = True
+
+        assert ran
@@ -0,0 +1,48 @@
+"""Tests for the structured-output schema registry."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from src.util.schema_registry import precompute, structured_schema
+
+
+class _Answer(BaseModel):
+    text: str
+    score: int = 0
+
+
+class _Other(BaseModel):
+    flag: bool
+
+
+class TestStructuredSchema:
+    """Tests for structured_schema() and precompute()."""
+
+    def test_schema_matches_model_json_schema(self) -> None:
+        """The cached schema is the model's own JSON schema."""
+        assert structured_schema(_Answer).json_schema == _Answer.model_json_schema()
+
+    def test_entry_is_built_once(self) -> None:
+        """Repeated lookups return the same schema and adapter objects."""
+        first = structured_schema(_Answer)
+        second = structured_schema(_Answer)
+
+        assert second is first
+        assert second.json_schema is first.json_schema
+
+    def test_precompute_registers_models(self) -> None:
+        """precompute() builds entries that later lookups reuse."""
+        precompute(_Other)
+        entry = structured_schema(_Other)
+
+        assert structured_schema(_Other) is entry
+
+    def test_validate_json(self) -> None:
+        """validate_json() returns a model instance and rejects bad input."""
+        schema = structured_schema(_Answer)
+
+        assert schema.validate_json('{"text": "hi"}') == _Answer(text="hi")
+        with pytest.raises(ValidationError):
+            schema.validate_json('{"score": 1}')
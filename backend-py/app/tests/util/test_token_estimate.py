@@ -0,0 +1,24 @@
+"""Tests for the local token estimator."""
+
+from __future__ import annotations
+
+from src.util.token_estimate import estimate_tokens
+
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens()."""
+
+    def test_empty(self) -> None:
+        """Empty text has no tokens."""
+        assert estimate_tokens("") == 0
+
+    def test_ascii_about_four_chars_per_token(self) -> None:
+        """ASCII text counts one token per four characters, rounded up."""
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+        assert estimate_tokens("x" * 400) == 100
+
+    def test_non_ascii_one_token_per_char(self) -> None:
+        """Japanese characters count as a token each."""
+        assert estimate_tokens("こんにちは") == 5
+        assert estimate_tokens("Hi こんにちは") == 1 + 5
@@ -828,6 +828,50 @@ export const updatePolicyBgmServiceRole = pgPolicy(
   },
 ).link(bgm);
 
+// ===== LLM Usage テーブル（RLS付き） =====
+// LLM呼び出しのトークン数・レイテンシ集計（バックエンドが定期的に一括書き込み）
+// セッション削除後もコスト分析に使えるよう外部キーは張らない
+export const llmUsage = pgTable("llm_usage", {
+  id: uuid("id").primaryKey().defaultRandom(),
+  sessionId: uuid("session_id"),
+  scenarioId: uuid("scenario_id"),
+  purpose: text("purpose").notNull(),
+  model: text("model").notNull(),
+  callCount: integer("call_count").notNull(),
+  promptTokens: integer("prompt_tokens").notNull().default(0),
+  cachedTokens: integer("cached_tokens").notNull().default(0),
+  outputTokens: integer("output_tokens").notNull().default(0),
+  totalTokens: integer("total_tokens").notNull().default(0),
+  latencyMsTotal: integer("latency_ms_total").notNull().default(0),
+  latencyMsMax: integer("latency_ms_max").notNull().default(0),
+  sectionTokens: jsonb("section_tokens"),
+  windowStart: timestamp("window_start", {
+    withTimezone: true,
+    precision: 3,
+  }).notNull(),
+  windowEnd: timestamp("window_end", {
+    withTimezone: true,
+    precision: 3,
+  }).notNull(),
+  createdAt: timestamp("created_at", {
+    withTimezone: true,
+    precision: 3,
+  })
+    .notNull()
+    .defaultNow(),
+}).enableRLS();
+
+// ===== LLM Usage RLS ポリシー =====
+// 生成バックエンド（service_role）のみINSERT可能
+export const insertPolicyLlmUsageServiceRole = pgPolicy(
+  "insert_policy_llm_usage_service_role",
+  {
+    for: "insert",
+    to: "service_role",
+    withCheck: sql`true`,
+  },
+).link(llmUsage);
+
 // ===== 型エクスポート（Inferで自動推論） =====
 import type { InferInsertModel, InferSelectModel } from "drizzle-orm";
 
@@ -844,6 +888,7 @@ export type Objective = InferSelectModel<typeof objectives>;
 export type Item = InferSelectModel<typeof items>;
 export type SceneBackground = InferSelectModel<typeof sceneBackgrounds>;
 export type Bgm = InferSelectModel<typeof bgm>;
+export type LlmUsage = InferSelectModel<typeof llmUsage>;
 
 // INSERT型（新規作成時の型）
 export type NewUser = InferInsertModel<typeof users>;
@@ -858,3 +903,4 @@ export type NewObjective = InferInsertModel<typeof objectives>;
 export type NewItem = InferInsertModel<typeof items>;
 export type NewSceneBackground = InferInsertModel<typeof sceneBackgrounds>;
 export type NewBgm = InferInsertModel<typeof bgm>;
+export type NewLlmUsage = InferInsertModel<typeof llmUsage>;
@@ -0,0 +1,21 @@
+CREATE TABLE "llm_usage" (
+	"id" uuid PRIMARY KEY DEFAULT gen_random_uuid() NOT NULL,
+	"session_id" uuid,
+	"scenario_id" uuid,
+	"purpose" text NOT NULL,
+	"model" text NOT NULL,
+	"call_count" integer NOT NULL,
+	"prompt_tokens" integer DEFAULT 0 NOT NULL,
+	"cached_tokens" integer DEFAULT 0 NOT NULL,
+	"output_tokens" integer DEFAULT 0 NOT NULL,
+	"total_tokens" integer DEFAULT 0 NOT NULL,
+	"latency_ms_total" integer DEFAULT 0 NOT NULL,
+	"latency_ms_max" integer DEFAULT 0 NOT NULL,
+	"section_tokens" jsonb,
+	"window_start" timestamp (3) with time zone NOT NULL,
+	"window_end" timestamp (3) with time zone NOT NULL,
+	"created_at" timestamp (3) with time zone DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+ALTER TABLE "llm_usage" ENABLE ROW LEVEL SECURITY;--> statement-breakpoint
+CREATE POLICY "insert_policy_llm_usage_service_role" ON "llm_usage" AS PERMISSIVE FOR INSERT TO "service_role" WITH CHECK (true);